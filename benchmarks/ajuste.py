@@ -0,0 +1,58 @@
+"""
+Tiempo del ajuste automático del quantum frente a un barrido exhaustivo.
+
+Uso:
+    python -m benchmarks.ajuste
+    python -m benchmarks.ajuste --procesos 100000 --objetivo retorno_p99 --exhaustivo
+"""
+
+import argparse
+import random
+import time
+from dataclasses import replace
+from src.core.ajuste import AjustadorQuantum, OBJETIVOS, valor_objetivo
+from src.core.ejecucion import ConfiguracionSimulacion, ejecutar_barrido
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmark del ajuste de quantum")
+    parser.add_argument("--procesos", type=int, default=100_000)
+    parser.add_argument("--max-ejecucion", type=int, default=30)
+    parser.add_argument("--cargas", type=int, default=1, help="Cargas (una por semilla)")
+    parser.add_argument("--objetivo", choices=sorted(OBJETIVOS), default="espera_promedio")
+    parser.add_argument("--trabajadores", type=int, default=None)
+    parser.add_argument("--exhaustivo", action="store_true",
+                        help="Compara con la evaluación de todos los quantums")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    cargas = []
+    for semilla in range(args.semilla, args.semilla + args.cargas):
+        aleatorio = random.Random(semilla)
+        cargas.append(ConfiguracionSimulacion.desde_dict({"procesos": [
+            (i + 1, aleatorio.randint(0, 4 * args.procesos), aleatorio.randint(1, args.max_ejecucion))
+            for i in range(args.procesos)]}))
+
+    inicio = time.perf_counter()
+    ajuste = AjustadorQuantum(cargas, args.objetivo,
+                              max_trabajadores=args.trabajadores).ajustar()
+    segundos = time.perf_counter() - inicio
+    print(f"{args.cargas} carga(s) de {args.procesos} procesos, objetivo {args.objetivo}")
+    print(f"ajuste: q={ajuste.quantum} valor={ajuste.valor:.2f} "
+          f"({ajuste.simulaciones} simulaciones, {segundos:.1f} s)")
+
+    if args.exhaustivo:
+        inicio = time.perf_counter()
+        # Hasta el mayor quantum que pudo alcanzar el ajuste al ampliar el rango
+        quantums = range(1, max(args.max_ejecucion, max(ajuste.evaluaciones)) + 1)
+        valores = {}
+        for q in quantums:
+            resultados = ejecutar_barrido([replace(c, quantum=q) for c in cargas],
+                                          max_trabajadores=args.trabajadores)
+            valores[q] = sum(valor_objetivo(r, args.objetivo) for r in resultados) / len(cargas)
+        mejor = min(valores, key=lambda q: (valores[q], q))
+        print(f"exhaustivo: q={mejor} valor={valores[mejor]:.2f} "
+              f"({len(quantums) * len(cargas)} simulaciones, {time.perf_counter() - inicio:.1f} s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Recuperación de la cola de trabajos ante la caída de un trabajador.
+
+Encola un barrido en una cola SQLite temporal, lanza varios procesos con
+`ejecutar_trabajador` y mata a uno (SIGKILL) mientras tiene un trabajo
+prestado. Verifica que el préstamo vence, que otro trabajador reintenta el
+trabajo y que llegan todos los resultados, iguales a los de simular cada
+configuración en el proceso actual.
+
+Uso:
+    python -m benchmarks.cola_trabajos
+    python -m benchmarks.cola_trabajos --trabajadores 8 --trabajos 40 --prestamo 1
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from typing import List
+from src.core.ejecucion import ConfiguracionSimulacion, ejecutar_simulacion
+from src.servicio.cola_trabajos import ColaTrabajos, ejecutar_trabajador
+
+def generar_barrido(trabajos: int, procesos: int, semilla: int) -> List[ConfiguracionSimulacion]:
+    """Configuraciones Round Robin con cargas aleatorias distintas."""
+    aleatorio = random.Random(semilla)
+    return [ConfiguracionSimulacion.desde_dict({
+        "procesos": [(i + 1, aleatorio.randint(0, procesos), aleatorio.randint(1, 20))
+                     for i in range(procesos)],
+        "quantum": aleatorio.randint(1, 5),
+    }) for _ in range(trabajos)]
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Caída de un trabajador de la cola")
+    parser.add_argument("--trabajadores", type=int, default=3)
+    parser.add_argument("--trabajos", type=int, default=12)
+    parser.add_argument("--procesos", type=int, default=300, help="Procesos por simulación")
+    parser.add_argument("--prestamo", type=float, default=2.0, help="Segundos de cada préstamo")
+    parser.add_argument("--tiempo-limite", type=float, default=300.0)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    configs = generar_barrido(args.trabajos, args.procesos, args.semilla)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "cola.db")
+        cola = ColaTrabajos(ruta)
+        lote = cola.encolar(configs)
+        inicio = time.perf_counter()
+        trabajadores = {}
+        for _ in range(args.trabajadores):
+            proceso = multiprocessing.Process(
+                target=ejecutar_trabajador, args=(ruta,),
+                kwargs={"duracion": args.prestamo, "intervalo": 0.05})
+            proceso.start()
+            trabajadores[proceso.pid] = proceso
+
+        # Se mata al primer trabajador que tenga un trabajo prestado
+        conexion = sqlite3.connect(ruta, timeout=60.0)
+        victima = None
+        while victima is None and time.perf_counter() - inicio < args.tiempo_limite:
+            for id_trabajo, nombre in conexion.execute(
+                    "SELECT id, trabajador FROM trabajos WHERE estado = 'en_curso'"):
+                pid = int(nombre.rsplit(":", 1)[1])
+                if pid in trabajadores:
+                    victima = id_trabajo
+                    trabajadores.pop(pid).kill()
+                    print(f"Trabajador {pid} terminado con el trabajo {id_trabajo} prestado")
+                    break
+            time.sleep(0.01)
+        if victima is None:
+            raise AssertionError("Ningún trabajador tomó un trabajo")
+
+        resultados = cola.esperar(lote, intervalo=0.1, tiempo_limite=args.tiempo_limite)
+        segundos = time.perf_counter() - inicio
+        for proceso in trabajadores.values():
+            proceso.join()
+        estado, intentos = conexion.execute(
+            "SELECT estado, intentos FROM trabajos WHERE id = ?", (victima,)).fetchone()
+        conexion.close()
+        conteo = cola.estado(lote)
+        cola.cerrar()
+
+    if estado != "terminado" or intentos < 2:
+        raise AssertionError(f"El trabajo {victima} no se reintentó: {estado}, {intentos} intentos")
+    if conteo["terminado"] != args.trabajos:
+        raise AssertionError(f"No terminaron todos los trabajos: {conteo}")
+    for i, (config, resultado) in enumerate(zip(configs, resultados)):
+        if resultado != ejecutar_simulacion(config):
+            raise AssertionError(f"Resultado distinto en el trabajo {i}")
+    print(f"{args.trabajos} trabajos con {args.trabajadores} trabajadores (uno caído) en "
+          f"{segundos:.2f} s; el trabajo {victima} terminó en el intento {intentos}")
+
+if __name__ == "__main__":
+    main()
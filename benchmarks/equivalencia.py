@@ -0,0 +1,418 @@
+"""
+Arnés de equivalencia y control de rendimiento de los motores de simulación.
+
+Genera cargas aleatorias (con semilla) y ejecuta cada motor contra la
+referencia, `PlanificadorRoundRobin.tick()` con historial completo. Compara
+por proceso el comienzo, la finalización, la espera, la respuesta y el
+retorno, las métricas globales y, en los motores que lo producen, el
+historial de estados. Luego mide el rendimiento de cada motor (procesos
+simulados por segundo) y falla si cae por debajo de la línea base guardada.
+
+La línea base guarda, para cada motor, la razón entre su rendimiento y el
+del motor tick a tick sin historial medido en la misma corrida, así que no
+depende de la máquina. Se regenera con --actualizar-linea-base cuando un
+cambio mejora un motor a propósito.
+
+Uso:
+    python -m benchmarks.equivalencia
+    python -m benchmarks.equivalencia --casos 5000 --semilla 3
+    python -m benchmarks.equivalencia --actualizar-linea-base
+
+Código de salida: 0 si todo coincide y no hay regresiones, 1 en otro caso.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from src.core.ejecucion import (ConfiguracionSimulacion, ejecutar_simulacion,
+                                ejecutar_lote, resultado_planificador)
+from src.core.historial import NivelHistorial, Segmento, calcular_segmentos
+from src.core.rapido import resolver_round_robin, aplica_forma_cerrada
+from src.core.estacionario import SimulacionEstacionaria, METRICAS_ESTACIONARIAS
+from src.core.multicpu import simular_multicpu
+
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base.json")
+CAMPOS = ("tiempo_comienzo", "tiempo_finalizacion", "tiempo_espera",
+          "tiempo_respuesta", "tiempo_retorno")
+
+Resultado = Dict[str, Any]
+
+def generar_cargas(casos: int, semilla: int) -> List[ConfiguracionSimulacion]:
+    """
+    Genera cargas aleatorias que cubren los casos borde de la semántica.
+
+    Args:
+        casos: Cantidad de cargas
+        semilla: Semilla del generador
+
+    Returns:
+        Configuraciones Round Robin
+    """
+    aleatorio = random.Random(semilla)
+    cargas = []
+    for i in range(casos):
+        quantum = aleatorio.randint(1, 6)
+        n = aleatorio.randint(1, 30)
+        tipo = i % 5
+        if tipo == 0:
+            # Lote alineado: camino de forma cerrada
+            t0 = quantum * aleatorio.randint(0, 3)
+            procesos = [(t0, quantum * aleatorio.randint(1, 8)) for _ in range(n)]
+        elif tipo == 1:
+            # Llegadas simultáneas con ráfagas arbitrarias
+            procesos = [(0, aleatorio.randint(1, 15)) for _ in range(n)]
+        elif tipo == 2:
+            # Huecos largos: CPU ociosa entre llegadas
+            procesos = [(aleatorio.randint(0, 200), aleatorio.randint(1, 5)) for _ in range(n)]
+        elif tipo == 3:
+            # Llegadas negativas y coincidentes con límites de quantum
+            procesos = [(quantum * aleatorio.randint(-2, 6), aleatorio.randint(1, 12))
+                        for _ in range(n)]
+        else:
+            procesos = [(aleatorio.randint(0, 40), aleatorio.randint(1, 12)) for _ in range(n)]
+        cargas.append(ConfiguracionSimulacion.desde_dict({
+            "procesos": [(j + 1, llegada, ejecucion) for j, (llegada, ejecucion) in enumerate(procesos)],
+            "quantum": quantum,
+        }))
+    return cargas
+
+def _segmentos_por_proceso(config: ConfiguracionSimulacion,
+                           transiciones: Dict[str, list], tiempo_final: int) -> List[List[Segmento]]:
+    """Segmentos de estado de cada proceso, en el orden de la configuración."""
+    segmentos = calcular_segmentos(transiciones, tiempo_final)
+    return [segmentos.get(f"P{p[0]}", []) for p in config.procesos]
+
+def referencia(config: ConfiguracionSimulacion) -> Resultado:
+    """
+    Ejecuta el motor tick a tick con historial completo.
+
+    Además comprueba que la matriz tiempo x proceso coincide con las
+    transiciones registradas.
+    """
+    planificador = config.crear_planificador(NivelHistorial.COMPLETO)
+    while planificador.tick():
+        pass
+    resultado = resultado_planificador(planificador)
+    resultado["segmentos"] = _segmentos_por_proceso(
+        config, planificador.transiciones, planificador.tiempo_actual)
+    for clave, cambios in calcular_segmentos(planificador.transiciones,
+                                             planificador.tiempo_actual).items():
+        for inicio, fin, estado in cambios:
+            for t in range(inicio, fin):
+                if planificador.historial_estados.get(t, {}).get(clave, "") != estado:
+                    raise AssertionError(f"Historial completo y transiciones difieren en {clave}, t={t}")
+    return resultado
+
+def _historial_desde_rafagas(config: ConfiguracionSimulacion, rafagas: List[Tuple[int, int, int]],
+                             finalizacion: List[int]) -> List[List[Segmento]]:
+    """
+    Reconstruye los segmentos de estado a partir de las ráfagas de CPU.
+
+    Un proceso está sin llegar ('') hasta su entrada, en ejecución ('E')
+    durante sus ráfagas, finalizado ('F') desde su finalización y listo
+    ('L') el resto del tiempo.
+    """
+    tiempo_final = max(finalizacion)
+    por_proceso: List[List[Tuple[int, int]]] = [[] for _ in config.procesos]
+    for inicio, fin, i in rafagas:
+        if por_proceso[i] and por_proceso[i][-1][1] == inicio:
+            por_proceso[i][-1] = (por_proceso[i][-1][0], fin)
+        else:
+            por_proceso[i].append((inicio, fin))
+    segmentos = []
+    for i, p in enumerate(config.procesos):
+        entrada = max(p[1], 0)
+        lista: List[Segmento] = []
+        if entrada > 0:
+            lista.append((0, entrada, ""))
+        t = entrada
+        for inicio, fin in por_proceso[i]:
+            if inicio > t:
+                lista.append((t, inicio, "L"))
+            lista.append((inicio, fin, "E"))
+            t = fin
+        if finalizacion[i] < tiempo_final:
+            lista.append((finalizacion[i], tiempo_final, "F"))
+        segmentos.append(lista)
+    return segmentos
+
+def motor_eventos(configs: List[ConfiguracionSimulacion]) -> List[Resultado]:
+    """Motor de eventos con ráfagas, incluido el historial reconstruido."""
+    resultados = []
+    for config in configs:
+        tiempos = resolver_round_robin([p[1] for p in config.procesos],
+                                       [p[2] for p in config.procesos], config.quantum,
+                                       rafagas=True)
+        resultado = _desde_tiempos(config, tiempos)
+        resultado["segmentos"] = _historial_desde_rafagas(
+            config, tiempos["rafagas"], tiempos["finalizacion"].tolist())
+        resultados.append(resultado)
+    return resultados
+
+def _desde_tiempos(config: ConfiguracionSimulacion, tiempos: Dict[str, Any]) -> Resultado:
+    """Resultado comparable a partir de los arreglos de resolver_round_robin."""
+    finalizacion = tiempos["finalizacion"].tolist()
+    return {"procesos": [{
+        "id": p[0],
+        "tiempo_comienzo": c,
+        "tiempo_finalizacion": f,
+        "tiempo_espera": e,
+        "tiempo_respuesta": r,
+        "tiempo_retorno": f - p[1],
+    } for p, c, f, e, r in zip(config.procesos, tiempos["comienzo"].tolist(), finalizacion,
+                               tiempos["espera"].tolist(), tiempos["respuesta"].tolist())]}
+
+def motor_forma_cerrada(configs: List[ConfiguracionSimulacion]) -> List[Optional[Resultado]]:
+    """Forma cerrada en las cargas que la admiten (None en el resto)."""
+    resultados: List[Optional[Resultado]] = []
+    for config in configs:
+        llegadas = np.array([p[1] for p in config.procesos])
+        ejecuciones = np.array([p[2] for p in config.procesos])
+        if aplica_forma_cerrada(llegadas, ejecuciones, config.quantum):
+            resultados.append(_desde_tiempos(
+                config, resolver_round_robin(llegadas, ejecuciones, config.quantum)))
+        else:
+            resultados.append(None)
+    return resultados
+
+def motor_rapido(configs: List[ConfiguracionSimulacion]) -> List[Resultado]:
+    """Camino por defecto de ejecutar_simulacion sin progreso."""
+    return [ejecutar_simulacion(config) for config in configs]
+
+def motor_bifurcado(configs: List[ConfiguracionSimulacion]) -> List[Resultado]:
+    """Bifurca a mitad de la simulación; ambas ramas deben terminar igual."""
+    resultados = []
+    for config in configs:
+        planificador = config.crear_planificador(NivelHistorial.TRANSICIONES)
+        mitad = sum(p[2] for p in config.procesos) // 2
+        while planificador.tiempo_actual < mitad and planificador.tick():
+            pass
+        rama = planificador.bifurcar()
+        for actual in (planificador, rama):
+            while len(actual.procesos_finalizados) < len(actual.procesos) and actual.tick():
+                pass
+        original, bifurcado = resultado_planificador(planificador), resultado_planificador(rama)
+        for resultado, actual in ((original, planificador), (bifurcado, rama)):
+            resultado["segmentos"] = _segmentos_por_proceso(
+                config, actual.transiciones, actual.tiempo_actual)
+        if original != bifurcado:
+            raise AssertionError("La rama bifurcada difiere del original")
+        resultados.append(bifurcado)
+    return resultados
+
+def motor_estacionario(configs: List[ConfiguracionSimulacion]) -> List[Optional[Resultado]]:
+    """
+    SimulacionEstacionaria sobre el flujo finito de cada carga.
+
+    Solo acumula estadísticas, así que se comparan totales, mínimos y
+    máximos (ver `_agregados`). Las cargas con llegadas negativas quedan
+    afuera: el flujo exige llegadas ordenadas y la referencia ordena por
+    entrada.
+    """
+    resultados: List[Optional[Resultado]] = []
+    for config in configs:
+        if any(p[1] < 0 for p in config.procesos):
+            resultados.append(None)
+            continue
+        llegadas = sorted(((p[1], p[2]) for p in config.procesos), key=lambda par: par[0])
+        simulacion = SimulacionEstacionaria(llegadas, config.quantum)
+        simulacion.avanzar()
+        agregados: Dict[str, Any] = {"finalizados": simulacion.finalizados,
+                                     "tiempo_total": simulacion.tiempo}
+        for metrica in METRICAS_ESTACIONARIAS:
+            resumen = simulacion.estadisticas[metrica].resumen()
+            agregados[metrica] = (round(resumen["media"] * resumen["cantidad"]),
+                                  resumen["minimo"], resumen["maximo"])
+        resultados.append({"agregados": agregados})
+    return resultados
+
+def motor_multicpu(configs: List[ConfiguracionSimulacion]) -> List[Resultado]:
+    """simular_multicpu con una CPU: despachador, ventanas y barreras sin efecto."""
+    resultados = []
+    for config in configs:
+        resultado = simular_multicpu(config, 1)
+        # Las métricas propias de varias CPU no existen en la referencia
+        resultado["metricas"] = {k: v for k, v in resultado["metricas"].items()
+                                 if k not in ("cpus", "ventanas", "segundos")}
+        resultados.append(resultado)
+    return resultados
+
+def motor_sin_historial(configs: List[ConfiguracionSimulacion]) -> List[Resultado]:
+    """Motor tick a tick sin historial (el modo de las ejecuciones sin interfaz)."""
+    resultados = []
+    for config in configs:
+        planificador = config.crear_planificador()
+        while planificador.tick():
+            pass
+        resultados.append(resultado_planificador(planificador))
+    return resultados
+
+# Motores verificados: reciben todas las cargas y devuelven un resultado por carga
+MOTORES: Dict[str, Callable[[List[ConfiguracionSimulacion]], List[Optional[Resultado]]]] = {
+    "sin_historial": motor_sin_historial,
+    "rapido": motor_rapido,
+    "eventos": motor_eventos,
+    "forma_cerrada": motor_forma_cerrada,
+    "lote": ejecutar_lote,
+    "bifurcado": motor_bifurcado,
+    "estacionario": motor_estacionario,
+    "multicpu": motor_multicpu,
+}
+
+def _agregados(resultado: Resultado) -> Dict[str, Any]:
+    """Finalizados, tiempo total y (total, mínimo, máximo) de espera y retorno."""
+    procesos = resultado["procesos"]
+    agregados: Dict[str, Any] = {
+        "finalizados": len(procesos),
+        "tiempo_total": max(p["tiempo_finalizacion"] for p in procesos),
+    }
+    for metrica, campo in (("espera", "tiempo_espera"), ("retorno", "tiempo_retorno")):
+        valores = [p[campo] for p in procesos]
+        agregados[metrica] = (sum(valores), min(valores), max(valores))
+    return agregados
+
+def comparar(config: ConfiguracionSimulacion, esperado: Resultado,
+             obtenido: Resultado) -> Optional[str]:
+    """
+    Compara un resultado con la referencia.
+
+    Returns:
+        Descripción de la primera diferencia, o None si coinciden
+    """
+    if "agregados" in obtenido:
+        esperados = _agregados(esperado)
+        if obtenido["agregados"] != esperados:
+            return f"Agregados: esperado {esperados}, obtenido {obtenido['agregados']}"
+        return None
+    for p_esperado, p_obtenido in zip(esperado["procesos"], obtenido["procesos"]):
+        for campo in CAMPOS:
+            if p_esperado[campo] != p_obtenido[campo]:
+                return (f"P{p_esperado['id']}.{campo}: esperado {p_esperado[campo]}, "
+                        f"obtenido {p_obtenido[campo]}")
+    if len(esperado["procesos"]) != len(obtenido["procesos"]):
+        return "Cantidad de procesos distinta"
+    if "metricas" in obtenido and obtenido["metricas"] != esperado["metricas"]:
+        return f"Métricas: esperado {esperado['metricas']}, obtenido {obtenido['metricas']}"
+    if "segmentos" in obtenido:
+        for p, s_esperado, s_obtenido in zip(config.procesos, esperado["segmentos"],
+                                             obtenido["segmentos"]):
+            if s_esperado != s_obtenido:
+                return f"Historial de P{p[0]}: esperado {s_esperado}, obtenido {s_obtenido}"
+    return None
+
+def verificar(cargas: List[ConfiguracionSimulacion], motores: List[str]) -> List[str]:
+    """
+    Ejecuta cada motor contra la referencia.
+
+    Returns:
+        Mensajes de error (vacío si todo coincide)
+    """
+    errores = []
+    esperados = [referencia(config) for config in cargas]
+    for nombre in motores:
+        try:
+            obtenidos = MOTORES[nombre](cargas)
+        except AssertionError as error:
+            errores.append(f"[{nombre}] {error}")
+            continue
+        cubiertas = 0
+        for config, esperado, obtenido in zip(cargas, esperados, obtenidos):
+            if obtenido is None:
+                continue
+            cubiertas += 1
+            diferencia = comparar(config, esperado, obtenido)
+            if diferencia is not None:
+                errores.append(f"[{nombre}] {diferencia}\n    carga: "
+                               f"{json.dumps(config.a_dict())}")
+                break
+        print(f"  {nombre:>14}: {cubiertas} cargas comparadas")
+    return errores
+
+# Motor contra el que se expresa el rendimiento de los demás en la línea base
+MOTOR_REFERENCIA = "sin_historial"
+
+def medir(motores: List[str], semilla: int, repeticiones: int = 3) -> Dict[str, float]:
+    """
+    Mide procesos simulados por segundo de cada motor (mejor de varias).
+
+    Usa cargas fijas de 40 procesos: lotes alineados para la forma cerrada y
+    llegadas dispersas para el resto. Siempre mide también MOTOR_REFERENCIA.
+    """
+    aleatorio = random.Random(semilla)
+    dispersas = [ConfiguracionSimulacion.desde_dict({
+        "procesos": [(j + 1, aleatorio.randint(0, 80), aleatorio.randint(1, 10)) for j in range(40)],
+        "quantum": aleatorio.randint(1, 4)}) for _ in range(200)]
+    alineadas = [ConfiguracionSimulacion.desde_dict({
+        "procesos": [(j + 1, 0, 2 * aleatorio.randint(1, 10)) for j in range(40)],
+        "quantum": 2}) for _ in range(200)]
+    rendimiento = {}
+    for nombre in dict.fromkeys([MOTOR_REFERENCIA, *motores]):
+        cargas = alineadas if nombre == "forma_cerrada" else dispersas
+        # El motor tick a tick es lento: basta con menos cargas
+        if nombre in ("sin_historial", "bifurcado", "multicpu"):
+            cargas = cargas[:20]
+        procesos = sum(len(c.procesos) for c in cargas)
+        mejor = float("inf")
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            MOTORES[nombre](cargas)
+            mejor = min(mejor, time.perf_counter() - inicio)
+        rendimiento[nombre] = procesos / mejor
+    return rendimiento
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Equivalencia y rendimiento de los motores")
+    parser.add_argument("--casos", type=int, default=1000)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--motores", nargs="*", default=list(MOTORES), choices=list(MOTORES))
+    parser.add_argument("--linea-base", default=LINEA_BASE)
+    parser.add_argument("--tolerancia", type=float, default=None,
+                        help="Caída relativa admitida (por defecto, la de la línea base)")
+    parser.add_argument("--actualizar-linea-base", action="store_true")
+    parser.add_argument("--sin-rendimiento", action="store_true")
+    args = parser.parse_args()
+
+    print(f"Verificando {args.casos} cargas (semilla {args.semilla})")
+    errores = verificar(generar_cargas(args.casos, args.semilla), args.motores)
+    for error in errores:
+        print(f"DIFERENCIA {error}")
+
+    if not args.sin_rendimiento:
+        rendimiento = medir(args.motores, args.semilla)
+        razones = {k: v / rendimiento[MOTOR_REFERENCIA] for k, v in rendimiento.items()}
+        base: Dict[str, Any] = {"referencia": MOTOR_REFERENCIA, "tolerancia": 0.3, "motores": {}}
+        if os.path.exists(args.linea_base):
+            with open(args.linea_base, encoding="utf-8") as archivo:
+                base = json.load(archivo)
+        if base.get("referencia") != MOTOR_REFERENCIA:
+            # Línea base en procesos/s absolutos o contra otro motor: no es comparable
+            base.update(referencia=MOTOR_REFERENCIA, motores={})
+        tolerancia = args.tolerancia if args.tolerancia is not None else base["tolerancia"]
+        print(f"{'motor':>16} {'procesos/s':>12} {'razón':>9} {'línea base':>11}")
+        for nombre, valor in rendimiento.items():
+            razon = razones[nombre]
+            razon_base = base["motores"].get(nombre)
+            texto_base = f"{razon_base:11.2f}" if razon_base else f"{'-':>11}"
+            print(f"{nombre:>16} {valor:12.0f} {razon:9.2f} {texto_base}")
+            if (not args.actualizar_linea_base and razon_base
+                    and razon < razon_base * (1 - tolerancia)):
+                errores.append(f"[{nombre}] regresión de rendimiento: {razon:.2f} veces "
+                               f"{MOTOR_REFERENCIA}, mínimo {razon_base * (1 - tolerancia):.2f}")
+                print(f"REGRESIÓN {errores[-1]}")
+        if args.actualizar_linea_base:
+            base["motores"].update({k: round(v, 3) for k, v in razones.items()})
+            with open(args.linea_base, "w", encoding="utf-8") as archivo:
+                json.dump(base, archivo, indent=2, sort_keys=True)
+                archivo.write("\n")
+            print(f"Línea base actualizada en {args.linea_base}")
+
+    sys.exit(1 if errores else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Simulaciones necesarias para comparar dos configuraciones según el diseño.
+
+Ejecuta el mismo experimento con cargas independientes, con números
+aleatorios comunes y con números comunes más variables antitéticas, y
+estima cuántas simulaciones por alternativa necesita cada diseño para que
+el intervalo de la diferencia tenga la semiamplitud pedida (la semiamplitud
+decrece como 1 / sqrt(n)).
+
+Uso:
+    python -m benchmarks.experimentos
+    python -m benchmarks.experimentos --quantum 4 5 --procesos 50 --semiamplitud 0.25
+"""
+
+import argparse
+import math
+import time
+from src.core.ajuste import OBJETIVOS
+from src.core.experimentos import ExperimentoComparativo, carga_aleatoria
+
+# (nombre, números comunes, variables antitéticas)
+DISENOS = (("independientes", False, False), ("comunes", True, False),
+           ("comunes + antitéticas", True, True))
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Reducción de varianza en comparaciones")
+    parser.add_argument("--quantum", type=int, nargs=2, default=[2, 3])
+    parser.add_argument("--procesos", type=int, default=20)
+    parser.add_argument("--max-ejecucion", type=int, default=10)
+    parser.add_argument("--max-llegada", type=int, default=20)
+    parser.add_argument("--replicas", type=int, default=100)
+    parser.add_argument("--objetivo", choices=sorted(OBJETIVOS), default="espera_promedio")
+    parser.add_argument("--semiamplitud", type=float, default=0.5,
+                        help="Semiamplitud deseada del intervalo de la diferencia")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--trabajadores", type=int, default=None)
+    args = parser.parse_args()
+
+    alternativas = {f"q={q}": {"quantum": q} for q in args.quantum}
+    generador = carga_aleatoria(args.procesos, args.max_ejecucion, args.max_llegada)
+    print(f"{args.objetivo}, q={args.quantum[1]} - q={args.quantum[0]}, "
+          f"{args.replicas} réplicas por diseño")
+    print(f"{'diseño':>22} {'diferencia':>11} {'semiamplitud':>13} {'necesarias':>11} "
+          f"{'ahorro':>8} {'segundos':>9}")
+    necesarias_independientes = None
+    for nombre, comunes, antiteticas in DISENOS:
+        experimento = ExperimentoComparativo(alternativas, generador, args.objetivo,
+                                             comunes=comunes, antiteticas=antiteticas,
+                                             semilla=args.semilla,
+                                             max_trabajadores=args.trabajadores)
+        inicio = time.perf_counter()
+        diferencia = experimento.ejecutar(args.replicas)["diferencias"][0]
+        segundos = time.perf_counter() - inicio
+        necesarias = math.ceil(args.replicas * (diferencia["semiamplitud"] / args.semiamplitud) ** 2)
+        if necesarias_independientes is None:
+            necesarias_independientes = necesarias
+        ahorro = necesarias_independientes / max(1, necesarias)
+        print(f"{nombre:>22} {diferencia['media']:11.3f} {diferencia['semiamplitud']:13.3f} "
+              f"{necesarias:11d} {ahorro:7.1f}x {segundos:9.2f}")
+
+if __name__ == "__main__":
+    main()
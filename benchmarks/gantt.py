@@ -0,0 +1,177 @@
+"""
+Tiempos y tamaños de la exportación del diagrama de Gantt.
+
+Genera una carga Round Robin de la duración pedida (por defecto, un millón
+de ticks), obtiene su historial con el motor de eventos y la dibuja a PNG y
+a SVG con `renderizar_gantt`, midiendo el tiempo de cada paso, el tamaño de
+cada archivo y la memoria máxima del proceso. Falla si algún formato tarda
+más que `--max-segundos`.
+
+Antes verifica que el PNG dibujado por teselas y franjas en paralelo sea
+idéntico, píxel a píxel, al dibujado de una sola vez, sobre una carga chica
+y con teselas de tamaños que no dividen a las barras.
+
+Uso:
+    python -m benchmarks.gantt
+    python -m benchmarks.gantt --procesos 20000 --ticks 1200000 --trabajadores 4
+"""
+
+import argparse
+import os
+import random
+import resource
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from typing import List, Tuple
+import numpy as np
+from src.core.ejecucion import ConfiguracionSimulacion, transiciones_simulacion
+from src.gui.gantt_imagen import renderizar_gantt
+from src.config.settings import GANTT_EXPORT_MAX_WIDTH
+
+def generar_carga(procesos: int, ticks: int, quantum: int, semilla: int) -> ConfiguracionSimulacion:
+    """
+    Genera llegadas en el primer cuarto y ráfagas que suman unos `ticks` ticks.
+
+    Args:
+        procesos: Cantidad de procesos
+        ticks: Duración aproximada de la simulación
+        quantum: Quantum de Round Robin
+        semilla: Semilla del generador
+
+    Returns:
+        Configuración de la simulación
+    """
+    aleatorio = random.Random(semilla)
+    media = max(1, ticks // procesos)
+    return ConfiguracionSimulacion.desde_dict({
+        "procesos": [(i + 1, aleatorio.randint(0, ticks // 4), aleatorio.randint(1, 2 * media))
+                     for i in range(procesos)],
+        "quantum": quantum,
+    })
+
+def leer_png(ruta: str) -> np.ndarray:
+    """
+    Lee un PNG RGB de 8 bits sin entrelazado, como los de `renderizar_gantt`.
+
+    Args:
+        ruta: Archivo PNG
+
+    Returns:
+        Píxeles (alto, ancho, 3)
+
+    Raises:
+        ValueError: Si el formato o algún filtro de fila no está soportado
+    """
+    with open(ruta, "rb") as archivo:
+        datos = archivo.read()
+    posicion, comprimido = 8, []
+    ancho = alto = 0
+    while posicion < len(datos):
+        longitud, tipo = struct.unpack(">I4s", datos[posicion:posicion + 8])
+        contenido = datos[posicion + 8:posicion + 8 + longitud]
+        if tipo == b"IHDR":
+            ancho, alto, bits, color = struct.unpack(">IIBB", contenido[:10])
+            if (bits, color) != (8, 2):
+                raise ValueError(f"PNG no soportado: {bits} bits, color {color}")
+        elif tipo == b"IDAT":
+            comprimido.append(contenido)
+        posicion += 12 + longitud
+    filas = np.frombuffer(zlib.decompress(b"".join(comprimido)), dtype=np.uint8)
+    filas = filas.reshape(alto, 3 * ancho + 1)
+    pixeles = np.empty((alto, 3 * ancho), dtype=np.uint8)
+    anterior = np.zeros(3 * ancho, dtype=np.uint8)
+    for i, (filtro, fila) in enumerate(zip(filas[:, 0], filas[:, 1:])):
+        if filtro == 0:
+            pixeles[i] = fila
+        elif filtro == 2:
+            pixeles[i] = fila + anterior
+        else:
+            raise ValueError(f"Filtro de fila no soportado: {filtro}")
+        anterior = pixeles[i]
+    return pixeles.reshape(alto, ancho, 3)
+
+# (ancho de tesela, alto de franja) de las particiones comparadas con el dibujo único
+PARTICIONES: Tuple[Tuple[int, int], ...] = ((37, 13), (64, 20), (101, 7))
+
+def comparar_teselas(directorio: str, trabajadores: int = 2) -> List[str]:
+    """
+    Compara el PNG dibujado por teselas con el dibujado de una sola vez.
+
+    Usa una carga de 40 procesos con vista detallada (bordes por tick) y otra
+    de 2000 ticks en vista de densidad.
+
+    Returns:
+        Descripción de cada diferencia encontrada
+    """
+    diferencias = []
+    for nombre, ticks, escala in (("detalle", 120, None), ("densidad", 2000, 0.3)):
+        transiciones, tiempo_final = transiciones_simulacion(generar_carga(40, ticks, 3, 1))
+        referencia = os.path.join(directorio, f"{nombre}_unica.png")
+        renderizar_gantt(transiciones, tiempo_final, referencia, pixeles_por_tick=escala,
+                         ancho_tesela=1 << 30, alto_franja=1 << 30, max_trabajadores=1)
+        esperado = leer_png(referencia)
+        for ancho_tesela, alto_franja in PARTICIONES:
+            ruta = os.path.join(directorio, f"{nombre}_{ancho_tesela}x{alto_franja}.png")
+            renderizar_gantt(transiciones, tiempo_final, ruta, pixeles_por_tick=escala,
+                             ancho_tesela=ancho_tesela, alto_franja=alto_franja,
+                             max_trabajadores=trabajadores)
+            obtenido = leer_png(ruta)
+            distintos = np.argwhere((obtenido != esperado).any(axis=2))
+            if len(distintos):
+                y, x = distintos[0]
+                diferencias.append(f"{nombre}, teselas {ancho_tesela}x{alto_franja}: "
+                                   f"{len(distintos)} píxeles distintos, el primero en ({x}, {y})")
+    return diferencias
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmark de la exportación del Gantt")
+    parser.add_argument("--procesos", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    parser.add_argument("--quantum", type=int, default=20)
+    parser.add_argument("--ancho-maximo", type=int, default=GANTT_EXPORT_MAX_WIDTH)
+    parser.add_argument("--trabajadores", type=int, default=None)
+    parser.add_argument("--formatos", nargs="+", choices=("png", "svg"), default=["png", "svg"])
+    parser.add_argument("--max-segundos", type=float, default=30.0,
+                        help="Tiempo máximo aceptado por formato")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        diferencias = comparar_teselas(directorio)
+    for diferencia in diferencias:
+        print(f"DIFERENCIA {diferencia}")
+    if diferencias:
+        sys.exit(1)
+    print(f"PNG por teselas idéntico al dibujo único ({len(PARTICIONES)} particiones)")
+
+    config = generar_carga(args.procesos, args.ticks, args.quantum, args.semilla)
+    inicio = time.perf_counter()
+    transiciones, tiempo_final = transiciones_simulacion(config)
+    print(f"{args.procesos} procesos, {tiempo_final} ticks, "
+          f"{sum(map(len, transiciones.values()))} transiciones "
+          f"({time.perf_counter() - inicio:.2f} s de simulación)")
+
+    print(f"{'formato':>7} {'segundos':>9} {'MB':>9} {'pico RSS MB':>12}")
+    lentos = []
+    with tempfile.TemporaryDirectory() as directorio:
+        for formato in args.formatos:
+            ruta = os.path.join(directorio, f"gantt.{formato}")
+            inicio = time.perf_counter()
+            renderizar_gantt(transiciones, tiempo_final, ruta, ancho_maximo=args.ancho_maximo,
+                             max_trabajadores=args.trabajadores)
+            segundos = time.perf_counter() - inicio
+            # ru_maxrss está en KiB en Linux
+            pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{formato:>7} {segundos:9.2f} {os.path.getsize(ruta) / 1e6:9.2f} {pico:12.0f}")
+            if segundos > args.max_segundos:
+                lentos.append(formato)
+    if lentos:
+        print(f"Más de {args.max_segundos} s: {', '.join(lentos)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
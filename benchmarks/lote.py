@@ -0,0 +1,75 @@
+"""
+Rendimiento de la simulación por lotes frente a simular carga por carga.
+
+Uso:
+    python -m benchmarks.lote
+    python -m benchmarks.lote --simulaciones 100000 --procesos 20
+"""
+
+import argparse
+import random
+import time
+from src.core.ejecucion import (ConfiguracionSimulacion, ejecutar_simulacion,
+                                ejecutar_lote, resultado_planificador)
+from src.core.lote import simular_lote
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmark de la simulación por lotes")
+    parser.add_argument("--simulaciones", type=int, default=20_000)
+    parser.add_argument("--procesos", type=int, default=20)
+    parser.add_argument("--lote", type=int, default=4096)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    aleatorio = random.Random(args.semilla)
+    configs = [ConfiguracionSimulacion.desde_dict({
+        "procesos": [(i + 1, aleatorio.randint(0, 2 * args.procesos), aleatorio.randint(1, 10))
+                     for i in range(args.procesos)],
+        "quantum": aleatorio.randint(1, 4),
+    }) for _ in range(args.simulaciones)]
+
+    # Verificación contra el motor tick a tick en una muestra
+    for config in configs[:200]:
+        planificador = config.crear_planificador()
+        while planificador.tick():
+            pass
+        if ejecutar_lote([config])[0] != resultado_planificador(planificador):
+            raise AssertionError(f"Resultado distinto: {config}")
+
+    n = len(configs)
+    inicio = time.perf_counter()
+    for config in configs[:1000]:
+        planificador = config.crear_planificador()
+        while planificador.tick():
+            pass
+    por_ticks = (time.perf_counter() - inicio) / min(n, 1000)
+
+    inicio = time.perf_counter()
+    uno_a_uno = [ejecutar_simulacion(config) for config in configs]
+    por_eventos = (time.perf_counter() - inicio) / n
+
+    inicio = time.perf_counter()
+    en_lote = []
+    for i in range(0, n, args.lote):
+        en_lote += ejecutar_lote(configs[i:i + args.lote])
+    por_lote = (time.perf_counter() - inicio) / n
+    if en_lote != uno_a_uno:
+        raise AssertionError("La simulación por lotes difiere del motor de eventos")
+
+    llegadas = [[p[1] for p in c.procesos] for c in configs]
+    ejecuciones = [[p[2] for p in c.procesos] for c in configs]
+    quantums = [c.quantum for c in configs]
+    inicio = time.perf_counter()
+    for i in range(0, n, args.lote):
+        simular_lote(llegadas[i:i + args.lote], ejecuciones[i:i + args.lote],
+                     quantums[i:i + args.lote])
+    solo_motor = (time.perf_counter() - inicio) / n
+
+    print(f"{n} simulaciones de {args.procesos} procesos (lotes de {args.lote})")
+    for nombre, segundos in (("tick a tick", por_ticks), ("motor de eventos", por_eventos),
+                             ("lote con resultados", por_lote), ("lote, solo motor", solo_motor)):
+        print(f"{nombre:>20}: {segundos * 1e6:10.1f} µs/simulación")
+
+if __name__ == "__main__":
+    main()
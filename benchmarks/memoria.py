@@ -0,0 +1,238 @@
+"""
+Consumo de memoria por componente del simulador, medido con tracemalloc.
+
+Simula cargas aleatorias sin interfaz con cantidades de procesos y
+duraciones crecientes, en cada nivel de historial. Al terminar cada
+simulación se liberan los componentes uno por uno (estructuras del Gantt,
+historial_estados, transiciones, procesos_finalizados y, por último, los
+procesos con el planificador) y la diferencia entre instantáneas de
+tracemalloc da la memoria retenida por cada uno. Son estructuras que solo
+crecen, así que su pico coincide con lo retenido; el resto del pico de la
+simulación se informa como 'transitorio'.
+
+Cada cifra se da en bytes por proceso y bytes por tick. La línea base
+guarda los bytes por proceso de cada escenario y el control falla si
+alguno crece más que la tolerancia, igual que el control de rendimiento de
+`benchmarks.equivalencia`. Con --registro se agrega una línea JSON por
+ejecución para seguir la evolución en el tiempo.
+
+Los objetos de Qt (celdas de tablas, widgets) se reservan en C++ y
+tracemalloc no los ve; del Gantt se mide lo que arma en Python: la
+pirámide de ocupación y el índice del historial.
+
+Uso:
+    python -m benchmarks.memoria
+    python -m benchmarks.memoria --procesos 100 400 1600 --ejecucion-max 5 20 --detalle 10
+    python -m benchmarks.memoria --actualizar-linea-base
+    python -m benchmarks.memoria --registro memoria.jsonl
+
+Código de salida: 0 si no hay regresiones, 1 en otro caso.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+from src.core.ejecucion import ConfiguracionSimulacion, PLANIFICADORES
+from src.core.historial import NivelHistorial
+from src.gui.pintor_gantt import PintorGantt
+
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base_memoria.json")
+# Componentes en el orden en que se liberan
+COMPONENTES = ("gantt", "historial_estados", "transiciones", "procesos_finalizados", "procesos")
+# Crecimiento por proceso que nunca se considera regresión (ruido de redimensionado)
+MARGEN_BYTES_POR_PROCESO = 16
+
+Resultado = Dict[str, Any]
+
+def generar_carga(procesos: int, ejecucion_max: int, planificador: str,
+                  semilla: int) -> ConfiguracionSimulacion:
+    """
+    Genera una carga con llegadas dispersas.
+
+    Args:
+        procesos: Cantidad de procesos
+        ejecucion_max: Tiempo de ejecución máximo (controla la duración)
+        planificador: Nombre del planificador
+        semilla: Semilla del generador
+
+    Returns:
+        Configuración de la simulación
+    """
+    aleatorio = random.Random(semilla)
+    return ConfiguracionSimulacion.desde_dict({
+        "procesos": [(i + 1, aleatorio.randint(0, 2 * procesos), aleatorio.randint(1, ejecucion_max),
+                      aleatorio.randint(1, 5)) for i in range(procesos)],
+        "quantum": 2,
+        "planificador": planificador,
+    })
+
+def _instantanea() -> tracemalloc.Snapshot:
+    """Instantánea tras recolectar basura, sin las reservas del propio tracemalloc."""
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),))
+
+def _diferencia(anterior: tracemalloc.Snapshot, posterior: tracemalloc.Snapshot) -> int:
+    """Bytes reservados entre dos instantáneas (negativo si se liberaron)."""
+    return sum(stat.size_diff for stat in posterior.compare_to(anterior, "filename"))
+
+def medir_escenario(config: ConfiguracionSimulacion, nivel: NivelHistorial,
+                    detalle: int = 0) -> Resultado:
+    """
+    Simula una carga y atribuye la memoria a cada componente.
+
+    Args:
+        config: Carga a simular
+        nivel: Nivel de historial del planificador
+        detalle: Líneas de código con más memoria retenida que se incluyen
+
+    Returns:
+        'ticks', 'pico', 'retenido' (bytes por componente, incluido
+        'transitorio') y, si se pidió, 'lineas' con (ubicación, bytes)
+    """
+    # Todo se guarda aquí para poder soltar cada referencia por separado
+    partes: Dict[str, Any] = {}
+    base = _instantanea()
+    actual_base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+
+    partes["planificador"] = config.crear_planificador(nivel)
+    while partes["planificador"].tick():
+        pass
+    ticks = partes["planificador"].tiempo_actual
+    if nivel >= NivelHistorial.TRANSICIONES:
+        # Lo que arma el Gantt al alejar la vista y al consultar un instante
+        pintor = partes["pintor"] = PintorGantt()
+        pintor.transiciones = partes["planificador"].transiciones
+        pintor.tiempo_maximo = ticks
+        pintor.piramide()
+        pintor.indice()
+        del pintor
+    pico = tracemalloc.get_traced_memory()[1] - actual_base
+    final = _instantanea()
+
+    liberar: Dict[str, Callable[[], None]] = {
+        "gantt": lambda: partes.pop("pintor", None),
+        "historial_estados": lambda: setattr(partes["planificador"], "historial_estados", {}),
+        "transiciones": lambda: setattr(partes["planificador"], "transiciones", {}),
+        "procesos_finalizados": lambda: setattr(partes["planificador"], "procesos_finalizados", []),
+        "procesos": lambda: partes.pop("planificador"),
+    }
+    retenido: Dict[str, int] = {}
+    anterior = final
+    for componente in COMPONENTES:
+        liberar[componente]()
+        posterior = _instantanea()
+        retenido[componente] = max(0, -_diferencia(anterior, posterior))
+        anterior = posterior
+    total = _diferencia(base, final)
+    retenido["transitorio"] = max(0, pico - total)
+
+    resultado: Resultado = {"ticks": ticks, "pico": pico, "total": total, "retenido": retenido}
+    if detalle:
+        resultado["lineas"] = [
+            (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size_diff)
+            for stat in final.compare_to(base, "lineno")[:detalle]]
+    return resultado
+
+def _por_unidad(valor: int, procesos: int, ticks: int) -> Tuple[float, float]:
+    """Bytes por proceso y por tick."""
+    return valor / procesos, valor / max(1, ticks)
+
+def imprimir(nombre: str, procesos: int, resultado: Resultado) -> None:
+    """Muestra la atribución de un escenario."""
+    ticks = resultado["ticks"]
+    print(f"\n{nombre} ({ticks} ticks)")
+    print(f"{'componente':>22} {'bytes':>12} {'B/proceso':>11} {'B/tick':>10}")
+    filas = list(resultado["retenido"].items()) + [("total retenido", resultado["total"]),
+                                                  ("pico", resultado["pico"])]
+    for componente, valor in filas:
+        por_proceso, por_tick = _por_unidad(valor, procesos, ticks)
+        print(f"{componente:>22} {valor:12d} {por_proceso:11.1f} {por_tick:10.1f}")
+    for ubicacion, valor in resultado.get("lineas", []):
+        print(f"    {valor:12d}  {ubicacion}")
+
+def cifras(procesos: int, resultado: Resultado) -> Dict[str, float]:
+    """Bytes por proceso de cada componente y del pico, para la línea base."""
+    valores = {c: v / procesos for c, v in resultado["retenido"].items()}
+    valores["pico"] = resultado["pico"] / procesos
+    return {c: round(v, 1) for c, v in valores.items()}
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Memoria por componente del simulador")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[100, 300])
+    parser.add_argument("--ejecucion-max", type=int, nargs="+", default=[5, 20],
+                        help="Tiempos de ejecución máximos (duración de la simulación)")
+    parser.add_argument("--niveles", nargs="+", default=[n.name for n in NivelHistorial],
+                        choices=[n.name for n in NivelHistorial])
+    parser.add_argument("--planificador", choices=sorted(PLANIFICADORES), default="round_robin")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--detalle", type=int, default=0,
+                        help="Líneas de código con más memoria retenida por escenario")
+    parser.add_argument("--linea-base", default=LINEA_BASE)
+    parser.add_argument("--tolerancia", type=float, default=None,
+                        help="Crecimiento relativo admitido (por defecto, el de la línea base)")
+    parser.add_argument("--actualizar-linea-base", action="store_true")
+    parser.add_argument("--registro", default=None,
+                        help="Archivo JSONL al que se agrega el resultado de esta ejecución")
+    args = parser.parse_args()
+
+    base: Dict[str, Any] = {"tolerancia": 0.15, "escenarios": {}}
+    if os.path.exists(args.linea_base):
+        with open(args.linea_base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+    tolerancia = args.tolerancia if args.tolerancia is not None else base["tolerancia"]
+
+    tracemalloc.start()
+    # Una pasada pequeña carga los módulos y cachés que se importan bajo demanda
+    for nombre_nivel in args.niveles:
+        medir_escenario(generar_carga(10, 3, args.planificador, args.semilla),
+                        NivelHistorial[nombre_nivel])
+    errores: List[str] = []
+    medidos: Dict[str, Dict[str, Any]] = {}
+    for procesos in args.procesos:
+        for ejecucion_max in args.ejecucion_max:
+            config = generar_carga(procesos, ejecucion_max, args.planificador, args.semilla)
+            for nombre_nivel in args.niveles:
+                nombre = f"{args.planificador} n={procesos} max={ejecucion_max} {nombre_nivel}"
+                resultado = medir_escenario(config, NivelHistorial[nombre_nivel], args.detalle)
+                imprimir(nombre, procesos, resultado)
+                medidos[nombre] = {"ticks": resultado["ticks"], "bytes_por_proceso": cifras(procesos, resultado),
+                                   "bytes_por_tick": {c: round(v / max(1, resultado["ticks"]), 1)
+                                                      for c, v in resultado["retenido"].items()}}
+                referencia = base["escenarios"].get(nombre)
+                if args.actualizar_linea_base or not referencia:
+                    continue
+                for componente, valor in medidos[nombre]["bytes_por_proceso"].items():
+                    limite = max(referencia.get(componente, 0.0) * (1 + tolerancia),
+                                 referencia.get(componente, 0.0) + MARGEN_BYTES_POR_PROCESO)
+                    if valor > limite:
+                        errores.append(f"[{nombre}] {componente}: {valor:.1f} B/proceso, "
+                                       f"máximo {limite:.1f}")
+                        print(f"REGRESIÓN {errores[-1]}")
+    tracemalloc.stop()
+
+    if args.registro:
+        with open(args.registro, "a", encoding="utf-8") as archivo:
+            archivo.write(json.dumps({"fecha": datetime.now().isoformat(timespec="seconds"),
+                                      "python": platform.python_version(),
+                                      "escenarios": medidos}) + "\n")
+    if args.actualizar_linea_base:
+        base["escenarios"].update({n: m["bytes_por_proceso"] for n, m in medidos.items()})
+        with open(args.linea_base, "w", encoding="utf-8") as archivo:
+            json.dump(base, archivo, indent=2, sort_keys=True)
+            archivo.write("\n")
+        print(f"\nLínea base actualizada en {args.linea_base}")
+
+    sys.exit(1 if errores else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Tiempos de la simulación con varias CPU según la cantidad de particiones.
+
+Antes de medir verifica, en cargas aleatorias pequeñas, que con una CPU el
+resultado coincide con el planificador tick a tick y que con varias CPU no
+depende de la cantidad de particiones. Luego simula una carga grande con
+utilización cercana a la pedida y compara el tiempo de pared de cada
+cantidad de particiones con el de la ejecución secuencial (una partición).
+
+Uso:
+    python -m benchmarks.multicpu
+    python -m benchmarks.multicpu --procesos 2000000 --cpus 4000 --particiones 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Any, Dict, List
+from src.core.ejecucion import ConfiguracionSimulacion, PLANIFICADORES, resultado_planificador
+from src.core.multicpu import simular_multicpu
+from src.config.settings import MULTICPU_WINDOW
+
+def _sin_cpu(resultado: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Resultado por proceso sin la columna 'cpu'."""
+    return [{k: v for k, v in p.items() if k != "cpu"} for p in resultado["procesos"]]
+
+def _verificar(casos: int, semilla: int) -> None:
+    """Compara con el motor tick a tick y entre cantidades de particiones."""
+    aleatorio = random.Random(semilla)
+    for _ in range(casos):
+        planificador = aleatorio.choice(sorted(PLANIFICADORES))
+        procesos = [(i + 1, aleatorio.randint(0, 80), aleatorio.randint(1, 12), aleatorio.randint(1, 5))
+                    for i in range(aleatorio.randint(1, 60))]
+        config = ConfiguracionSimulacion.desde_dict({
+            "procesos": procesos, "quantum": aleatorio.randint(1, 5),
+            "planificador": planificador, "parametros": {"semilla": semilla}
+            if planificador == "loteria" else {}})
+        ventana = aleatorio.randint(1, 20)
+
+        secuencial = config.crear_planificador()
+        while secuencial.tick():
+            pass
+        if _sin_cpu(simular_multicpu(config, 1, ventana)) != resultado_planificador(secuencial)["procesos"]:
+            raise AssertionError(f"Una CPU distinta del planificador ({planificador}): {procesos}")
+
+        cpus = aleatorio.randint(2, 8)
+        referencia = simular_multicpu(config, cpus, ventana)["procesos"]
+        for particiones in (2, 3):
+            if simular_multicpu(config, cpus, ventana, particiones)["procesos"] != referencia:
+                raise AssertionError(f"{particiones} particiones distintas de 1 ({planificador}, "
+                                     f"{cpus} CPU): {procesos}")
+
+def generar_carga(procesos: int, cpus: int, utilizacion: float, ejecucion_max: int,
+                  planificador: str, semilla: int) -> ConfiguracionSimulacion:
+    """
+    Genera llegadas uniformes con la utilización media pedida.
+
+    Args:
+        procesos: Cantidad de procesos
+        cpus: Cantidad de CPU simuladas
+        utilizacion: Fracción de la capacidad total que ocupa la carga
+        ejecucion_max: Tiempo de ejecución máximo (uniforme desde 1)
+        planificador: Nombre del planificador
+        semilla: Semilla del generador
+
+    Returns:
+        Configuración de la simulación
+    """
+    aleatorio = random.Random(semilla)
+    horizonte = int(procesos * (1 + ejecucion_max) / 2 / cpus / utilizacion)
+    return ConfiguracionSimulacion.desde_dict({
+        "procesos": [(i + 1, aleatorio.randint(0, horizonte), aleatorio.randint(1, ejecucion_max))
+                     for i in range(procesos)],
+        "quantum": 2,
+        "planificador": planificador,
+    })
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulación con varias CPU por particiones")
+    parser.add_argument("--procesos", type=int, default=200_000)
+    parser.add_argument("--cpus", type=int, default=1000)
+    parser.add_argument("--utilizacion", type=float, default=0.9)
+    parser.add_argument("--ejecucion-max", type=int, default=10)
+    parser.add_argument("--planificador", choices=sorted(PLANIFICADORES), default="round_robin")
+    parser.add_argument("--ventana", type=int, default=MULTICPU_WINDOW)
+    parser.add_argument("--particiones", type=int, nargs="+",
+                        default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument("--casos", type=int, default=100, help="Casos de verificación")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    _verificar(args.casos, args.semilla)
+    print(f"Verificación: {args.casos} cargas iguales al planificador y entre particiones")
+
+    config = generar_carga(args.procesos, args.cpus, args.utilizacion, args.ejecucion_max,
+                           args.planificador, args.semilla)
+    print(f"\n{args.planificador}: {args.procesos} procesos, {args.cpus} CPU, ventana {args.ventana}, "
+          f"{os.cpu_count()} núcleos")
+    print(f"{'particiones':>11} {'segundos':>9} {'aceleración':>11} {'ventanas':>9} {'ticks':>9} "
+          f"{'utilización':>11}")
+    referencia = None
+    base = None
+    for particiones in args.particiones:
+        inicio = time.perf_counter()
+        resultado = simular_multicpu(config, args.cpus, args.ventana, particiones)
+        segundos = time.perf_counter() - inicio
+        if referencia is None:
+            referencia, base = resultado["procesos"], segundos
+        elif resultado["procesos"] != referencia:
+            raise AssertionError(f"{particiones} particiones: resultado distinto")
+        metricas = resultado["metricas"]
+        print(f"{particiones:11d} {segundos:9.2f} {base / segundos:10.2f}x {metricas['ventanas']:9d} "
+              f"{metricas['tiempo_total']:9d} {metricas['utilizacion_cpu']:10.1f}%")
+
+if __name__ == "__main__":
+    main()
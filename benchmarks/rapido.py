@@ -0,0 +1,99 @@
+"""
+Comparación de tiempos entre el motor tick a tick y la resolución rápida de
+Round Robin (forma cerrada y motor de eventos).
+
+Antes de medir, verifica que ambos caminos rápidos coinciden exactamente con
+`PlanificadorRoundRobin` en cargas aleatorias pequeñas.
+
+Uso:
+    python -m benchmarks.rapido
+    python -m benchmarks.rapido --procesos 10000000 --quantum 4
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict
+import numpy as np
+from src.core.ejecucion import (ConfiguracionSimulacion, ejecutar_simulacion,
+                                resultado_planificador)
+from src.core.rapido import resolver_round_robin, aplica_forma_cerrada
+
+def _verificar(casos: int, semilla: int) -> int:
+    """Compara la resolución rápida con el motor tick a tick."""
+    aleatorio = random.Random(semilla)
+    cerradas = 0
+    for _ in range(casos):
+        quantum = aleatorio.randint(1, 5)
+        n = aleatorio.randint(1, 30)
+        if aleatorio.random() < 0.5:
+            t0 = quantum * aleatorio.randint(0, 3)
+            procesos = [(i + 1, t0, quantum * aleatorio.randint(1, 6)) for i in range(n)]
+        else:
+            procesos = [(i + 1, aleatorio.randint(0, 40), aleatorio.randint(1, 12))
+                        for i in range(n)]
+        config = ConfiguracionSimulacion.desde_dict({"procesos": procesos, "quantum": quantum})
+        planificador = config.crear_planificador()
+        while planificador.tick():
+            pass
+        if resultado_planificador(planificador) != ejecutar_simulacion(config):
+            raise AssertionError(f"Resultados distintos para q={quantum}: {procesos}")
+        cerradas += aplica_forma_cerrada(np.array([p[1] for p in procesos]),
+                                         np.array([p[2] for p in procesos]), quantum)
+    return cerradas
+
+def _medir(funcion: Callable[[], object]) -> float:
+    """Segundos que tarda una llamada."""
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmark de la resolución rápida de Round Robin")
+    parser.add_argument("--procesos", type=int, default=10_000_000,
+                        help="Procesos del lote más grande (forma cerrada)")
+    parser.add_argument("--quantum", type=int, default=4)
+    parser.add_argument("--max-eventos", type=int, default=1_000_000,
+                        help="Procesos máximos para el motor de eventos")
+    parser.add_argument("--max-ticks", type=int, default=2_000,
+                        help="Procesos máximos para el motor tick a tick")
+    parser.add_argument("--casos", type=int, default=500)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    cerradas = _verificar(args.casos, args.semilla)
+    print(f"Verificación: {args.casos} cargas idénticas al motor tick a tick "
+          f"({cerradas} por forma cerrada)")
+
+    q = args.quantum
+    generador = np.random.default_rng(args.semilla)
+    print(f"{'procesos':>10} {'motor':>14} {'segundos':>10} {'procesos/s':>12}")
+    n = 1_000
+    while n <= args.procesos:
+        # Lote que entra junto con ejecuciones múltiplo del quantum
+        ejecuciones = q * generador.integers(1, 11, size=n)
+        llegadas = np.zeros(n, dtype=np.int64)
+        tiempos: Dict[str, float] = {
+            "forma cerrada": _medir(lambda: resolver_round_robin(llegadas, ejecuciones, q)),
+        }
+        if n <= args.max_eventos:
+            # Llegadas intercaladas: obliga a usar el motor de eventos
+            dispersas = np.sort(generador.integers(0, n * 5, size=n))
+            tiempos["eventos"] = _medir(
+                lambda: resolver_round_robin(dispersas, ejecuciones, q))
+        if n <= args.max_ticks:
+            config = ConfiguracionSimulacion(
+                tuple((i + 1, 0, int(e), None) for i, e in enumerate(ejecuciones)), quantum=q)
+
+            def por_ticks():
+                planificador = config.crear_planificador()
+                while planificador.tick():
+                    pass
+            tiempos["tick a tick"] = _medir(por_ticks)
+        for motor, segundos in tiempos.items():
+            print(f"{n:>10} {motor:>14} {segundos:>10.3f} {n / segundos:>12.0f}")
+        n *= 10
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
+import argparse
 import sys
 from PyQt6.QtWidgets import QApplication
 from src.gui.main_window import VentanaPrincipal
 
 def main():
-    app = QApplication(sys.argv)
-    ventana = VentanaPrincipal()
+    parser = argparse.ArgumentParser(description="Simulador de planificación Round Robin")
+    parser.add_argument("--perfilado", nargs="?", const="", default=None, metavar="TRAZA",
+                        help="Mide el rendimiento de la interfaz; con TRAZA guarda la traza al cerrar")
+    args, argumentos_qt = parser.parse_known_args()
+    app = QApplication(sys.argv[:1] + argumentos_qt)
+    ventana = VentanaPrincipal(perfilado=args.perfilado is not None,
+                               ruta_traza=args.perfilado or None)
     ventana.show()
     sys.exit(app.exec())
 
@@ -1,3 +1,5 @@
+import os
+
 # Configuración de la interfaz gráfica
 WINDOW_TITLE = "Simulador de Planificación Round Robin"
 WINDOW_MIN_WIDTH = 1200
@@ -12,6 +14,85 @@ MAX_ARRIVAL_TIME = 20
 
 # Intervalos de actualización
 SIMULATION_INTERVAL = 1000  # milisegundos
+PROGRESS_INTERVAL_TICKS = 1000  # ticks entre reportes de progreso sin interfaz
+LOCKSTEP_BATCH_SIZE = 4096  # simulaciones por lote en los barridos Round Robin
+LOCKSTEP_MAX_PROCESSES = 1000  # cargas más grandes se resuelven con el motor de eventos
+
+# Planificación proporcional (stride)
+STRIDE_BASE = 1 << 20  # numerador del paso: paso = STRIDE_BASE // boletos
+
+# Modo estacionario (horizonte infinito)
+STEADY_STATE_BATCH_SIZE = 5  # observaciones por lote inicial (MSER-5)
+STEADY_STATE_MAX_BATCHES = 1024  # medias de lotes guardadas por métrica
+STEADY_STATE_CI_BATCHES = 20  # lotes del intervalo de confianza
+STEADY_STATE_CONFIDENCE = 0.95  # nivel de confianza
+
+# Vista de comparación
+COMPARISON_MAX_WORKERS = None  # procesos trabajadores (None: uno por núcleo)
+
+# Ajuste automático del quantum
+QUANTUM_TUNING_GROWTH = 2  # factor de ampliación del rango si el óptimo cae en el máximo
+QUANTUM_TUNING_MAX_WIDENINGS = 6  # ampliaciones como máximo
+
+# Experimentos comparativos (números aleatorios comunes)
+EXPERIMENT_CONFIDENCE = 0.95  # nivel de confianza de los intervalos
+
+# Caché de resultados
+RESULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache",
+                                "round_robin_simulator", "resultados")
+RESULT_CACHE_MEMORY_ITEMS = 1024  # resultados en el nivel de memoria
+RESULT_CACHE_DISK_BYTES = 256 * 1024 * 1024  # tamaño máximo en disco
+
+# Almacén de resultados (SQLite)
+RESULT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".cache",
+                                 "round_robin_simulator", "resultados.db")
+RESULT_STORE_BATCH_SIZE = 500  # ejecuciones por transacción
+
+# Servicio de simulación (asyncio)
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_MAX_WORKERS = 4  # procesos del pool compartido
+SERVICE_QUEUE_SIZE = 64  # trabajos en espera antes de rechazar
+SERVICE_MAX_JOBS_PER_CLIENT = 8  # trabajos activos por conexión
+SERVICE_PROGRESS_MIN_INTERVAL = 0.25  # segundos entre mensajes de progreso
+SERVICE_CLIENT_BUFFER = 256  # mensajes pendientes por cliente
+
+# Cola de trabajos compartida (SQLite)
+WORK_QUEUE_LEASE_SECONDS = 60.0  # validez del préstamo de un trabajo
+WORK_QUEUE_MAX_ATTEMPTS = 3  # intentos antes de marcar un trabajo como fallido
+WORK_QUEUE_POLL_INTERVAL = 1.0  # segundos entre consultas a la cola
+WORK_QUEUE_STALL_SECONDS = 2 * WORK_QUEUE_LEASE_SECONDS  # espera máxima sin terminar ni renovar trabajos
+
+# Telemetría (formato de texto de Prometheus)
+TELEMETRY_HOST = "127.0.0.1"
+TELEMETRY_PORT = 9464
+TELEMETRY_SAMPLE_INTERVAL = 0.5  # segundos mínimos entre muestras
+TELEMETRY_WAIT_WINDOW = 1000  # últimos procesos finalizados para los percentiles de espera
+
+# Diagrama de Gantt de la ventana principal: 'historial' (interactivo, con
+# zoom y consultas) o 'matplotlib' (una barra por proceso finalizado)
+GANTT_VIEW = "historial"
+
+# Exportación del diagrama de Gantt a imagen
+GANTT_EXPORT_MAX_WIDTH = 16384  # píxeles máximos del eje de tiempo
+GANTT_EXPORT_TILE_WIDTH = 2048  # ancho de cada tesela renderizada en paralelo
+GANTT_EXPORT_STRIP_HEIGHT = 1024  # alto de las franjas que se dibujan y comprimen juntas
+
+# Índice de consultas sobre el historial
+HISTORY_INDEX_LEAF_SIZE = 64  # intervalos por hoja del árbol (se recorren completos)
+
+# Pirámide de ocupación del Gantt (vistas alejadas)
+GANTT_PYRAMID_MAX_BYTES = 256 * 1024 * 1024  # se duplica la cubeta base si se supera
+
+# Simulación con varias CPU (src/core/multicpu.py)
+MULTICPU_WINDOW = 32  # ticks entre barreras y entre actualizaciones de carga del despachador
+MULTICPU_JOIN_TIMEOUT = 5.0  # segundos que se espera a cada partición antes de terminarla
+
+# Instrumentación de la interfaz (opcional, --perfilado)
+GUI_FRAME_BUDGET_MS = 1000 / 60  # duración de un cuadro a 60 Hz
+GUI_TRACE_MAX_EVENTS = 200_000  # eventos guardados para la traza (se descartan los más viejos)
+GUI_PROFILE_WINDOW = 120  # mediciones recientes por nombre que resume el panel
+GUI_OVERLAY_REFRESH_MS = 500  # milisegundos entre actualizaciones del panel
 
 # Colores para el diagrama de Gantt
 PROCESS_COLORS = [
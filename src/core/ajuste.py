@@ -0,0 +1,267 @@
+"""
+Ajuste automático del quantum.
+
+Busca el quantum entero que minimiza un objetivo sobre una o varias cargas
+(por ejemplo, una carga generada con cada semilla) evaluando solo resultados
+finales con `ejecutar_barrido`: motor rápido, caché de resultados y
+procesos en paralelo.
+
+La búsqueda tiene dos fases:
+
+    1. Rejilla geométrica entre el mínimo y el máximo. Con varias cargas se
+       aplica reducción sucesiva a la mitad (successive halving): todos los
+       candidatos se evalúan con pocas cargas, sobrevive la mitad mejor y la
+       cantidad de cargas se duplica en cada ronda hasta usarlas todas.
+    2. Refinamiento entre los vecinos del mejor candidato: sección dorada
+       sobre enteros con un solo trabajador, o k-sección con un punto por
+       trabajador (el intervalo se reduce a 2 / (k + 1) por ronda paralela).
+
+Si el máximo no se fijó y el óptimo cae justo en él, el rango se amplía
+geométricamente (una rejilla entre el máximo anterior y el nuevo, con todas
+las cargas) y se vuelve a refinar, hasta que el óptimo quede en el interior.
+
+El objetivo no es unimodal en general; la rejilla inicial evita quedar
+atrapado en el mínimo local de un extremo del rango.
+"""
+
+import math
+import os
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from .ejecucion import ConfiguracionSimulacion, ejecutar_barrido
+from ..utils.estadistica import percentil
+from ..config.settings import QUANTUM_TUNING_GROWTH, QUANTUM_TUNING_MAX_WIDENINGS
+
+def _promedio_procesos(resultado: Dict[str, Any], clave: str) -> float:
+    """Promedio de un tiempo por proceso."""
+    procesos = resultado["procesos"]
+    return sum(p[clave] for p in procesos) / len(procesos)
+
+def _p99_retorno(resultado: Dict[str, Any]) -> float:
+    """Percentil 99 del tiempo de retorno."""
+    return percentil(sorted(p["tiempo_retorno"] for p in resultado["procesos"]), 99)
+
+# Objetivos simples por nombre; 'mixto' combina varios con pesos
+OBJETIVOS: Dict[str, Callable[[Dict[str, Any]], float]] = {
+    "espera_promedio": lambda r: r["metricas"]["tiempo_espera_promedio"],
+    "retorno_promedio": lambda r: r["metricas"]["tiempo_retorno_promedio"],
+    "respuesta_promedio": lambda r: _promedio_procesos(r, "tiempo_respuesta"),
+    "retorno_p99": _p99_retorno,
+}
+
+def valor_objetivo(resultado: Dict[str, Any], objetivo: str,
+                   pesos: Optional[Dict[str, float]] = None) -> float:
+    """
+    Evalúa un objetivo sobre el resultado de una simulación.
+
+    Args:
+        resultado: Resultado de `ejecutar_simulacion`
+        objetivo: Nombre en OBJETIVOS o 'mixto'
+        pesos: Para 'mixto', peso de cada objetivo simple
+
+    Returns:
+        Valor del objetivo (menor es mejor)
+
+    Raises:
+        ValueError: Si el objetivo o alguno de los pesos no existe
+    """
+    if objetivo == "mixto":
+        if not pesos:
+            raise ValueError("El objetivo 'mixto' necesita pesos")
+        return sum(peso * valor_objetivo(resultado, nombre) for nombre, peso in pesos.items())
+    if objetivo not in OBJETIVOS:
+        raise ValueError(f"Objetivo desconocido: {objetivo}")
+    return OBJETIVOS[objetivo](resultado)
+
+def rejilla_geometrica(minimo: int, maximo: int, puntos: int) -> List[int]:
+    """
+    Enteros distintos aproximadamente equiespaciados en escala logarítmica.
+
+    Args:
+        minimo: Primer valor (al menos 1)
+        maximo: Último valor
+        puntos: Cantidad de valores deseada
+
+    Returns:
+        Valores ordenados que incluyen ambos extremos
+    """
+    if maximo - minimo + 1 <= puntos:
+        return list(range(minimo, maximo + 1))
+    razon = (maximo / minimo) ** (1 / (puntos - 1))
+    return sorted({minimo, maximo} | {round(minimo * razon ** i) for i in range(puntos)})
+
+@dataclass
+class ResultadoAjuste:
+    """
+    Resultado de un ajuste de quantum.
+
+        quantum: Mejor quantum encontrado
+        valor: Objetivo promedio con ese quantum sobre todas las cargas
+        evaluaciones: Objetivo promedio de cada quantum evaluado con todas las cargas
+        simulaciones: Simulaciones pedidas (incluidas las resueltas por la caché)
+    """
+    quantum: int
+    valor: float
+    evaluaciones: Dict[int, float] = field(default_factory=dict)
+    simulaciones: int = 0
+
+class AjustadorQuantum:
+    """Busca el quantum que minimiza un objetivo sobre un conjunto de cargas."""
+
+    def __init__(self, cargas: Sequence[ConfiguracionSimulacion],
+                 objetivo: str = "espera_promedio",
+                 pesos: Optional[Dict[str, float]] = None,
+                 minimo: int = 1, maximo: Optional[int] = None,
+                 cache=None, max_trabajadores: Optional[int] = None):
+        """
+        Args:
+            cargas: Configuraciones a evaluar (se ignora su quantum)
+            objetivo: Nombre en OBJETIVOS o 'mixto'
+            pesos: Para 'mixto', peso de cada objetivo simple
+            minimo: Menor quantum a considerar
+            maximo: Mayor quantum a considerar (por defecto, la ejecución
+                más larga: con quantums mayores casi ninguna ráfaga se corta;
+                el rango por defecto se amplía si el óptimo cae en el borde)
+            cache: CacheResultados opcional
+            max_trabajadores: Procesos en paralelo (por defecto, uno por núcleo)
+
+        Raises:
+            ValueError: Si no hay cargas, el rango es inválido o el objetivo no existe
+        """
+        if not cargas:
+            raise ValueError("No hay cargas que evaluar")
+        if minimo < 1:
+            raise ValueError("El quantum mínimo debe ser mayor que cero")
+        if objetivo != "mixto" and objetivo not in OBJETIVOS:
+            raise ValueError(f"Objetivo desconocido: {objetivo}")
+        self.cargas = list(cargas)
+        self.objetivo = objetivo
+        self.pesos = pesos
+        self.minimo = minimo
+        # Un máximo explícito es una cota; el calculado, solo un punto de partida
+        self.ampliable = maximo is None
+        if maximo is None:
+            maximo = max(p[2] for c in self.cargas for p in c.procesos)
+        self.maximo = max(maximo, minimo)
+        self.cache = cache
+        self.max_trabajadores = max_trabajadores
+        self.trabajadores = max_trabajadores or os.cpu_count() or 1
+        # Objetivo promedio por (quantum, cantidad de cargas)
+        self.valores: Dict[tuple, float] = {}
+        self.simulaciones = 0
+
+    def evaluar(self, quantums: Sequence[int], cantidad: Optional[int] = None) -> Dict[int, float]:
+        """
+        Evalúa el objetivo promedio de varios quantums.
+
+        Args:
+            quantums: Quantums a evaluar
+            cantidad: Usar solo las primeras `cantidad` cargas (por defecto, todas)
+
+        Returns:
+            Objetivo promedio de cada quantum
+        """
+        cantidad = len(self.cargas) if cantidad is None else cantidad
+        nuevos = [q for q in dict.fromkeys(quantums) if (q, cantidad) not in self.valores]
+        cargas = self.cargas[:cantidad]
+        # Por tramos de un quantum por trabajador para acotar la memoria
+        for i in range(0, len(nuevos), self.trabajadores):
+            tramo = nuevos[i:i + self.trabajadores]
+            configs = [replace(c, quantum=q) for q in tramo for c in cargas]
+            resultados = ejecutar_barrido(configs, self.cache, self.max_trabajadores)
+            self.simulaciones += len(configs)
+            for j, q in enumerate(tramo):
+                bloque = resultados[j * cantidad:(j + 1) * cantidad]
+                self.valores[(q, cantidad)] = sum(
+                    valor_objetivo(r, self.objetivo, self.pesos) for r in bloque) / cantidad
+        return {q: self.valores[(q, cantidad)] for q in quantums}
+
+    def _puntos_rejilla(self) -> int:
+        """Cantidad de puntos de cada rejilla geométrica."""
+        return max(8, 2 * self.trabajadores)
+
+    def _explorar(self) -> List[int]:
+        """Rejilla inicial con reducción sucesiva a la mitad; devuelve la rejilla."""
+        rejilla = rejilla_geometrica(self.minimo, self.maximo, self._puntos_rejilla())
+        vivos = rejilla
+        cantidad = 1
+        while True:
+            cantidad = min(cantidad, len(self.cargas))
+            valores = self.evaluar(vivos, cantidad)
+            if cantidad == len(self.cargas):
+                return rejilla
+            if len(vivos) > 2:
+                vivos = sorted(vivos, key=valores.get)[:max(2, len(vivos) // 2)]
+            cantidad *= 2
+
+    def _seccion_dorada(self, a: int, b: int) -> None:
+        """Reduce [a, b] por sección dorada y evalúa los enteros que quedan."""
+        proporcion = (math.sqrt(5) - 1) / 2
+        while b - a > 3:
+            c = b - round((b - a) * proporcion)
+            d = a + round((b - a) * proporcion)
+            if c >= d:
+                break
+            valores = self.evaluar([c, d])
+            if valores[c] <= valores[d]:
+                b = d
+            else:
+                a = c
+        self.evaluar(range(a, b + 1))
+
+    def _k_seccion(self, a: int, b: int) -> None:
+        """Reduce [a, b] evaluando un punto interior por trabajador en cada ronda."""
+        k = self.trabajadores
+        while b - a > k + 1:
+            puntos = sorted({a + round((b - a) * j / (k + 1)) for j in range(1, k + 1)})
+            valores = self.evaluar(puntos)
+            i = min(range(len(puntos)), key=lambda j: valores[puntos[j]])
+            nuevo_a = puntos[i - 1] if i > 0 else a
+            nuevo_b = puntos[i + 1] if i + 1 < len(puntos) else b
+            if (nuevo_a, nuevo_b) == (a, b):
+                break
+            a, b = nuevo_a, nuevo_b
+        self.evaluar(range(a, b + 1))
+
+    def _refinar(self, rejilla: List[int]) -> None:
+        """Refina entre los vecinos del mejor punto de la rejilla evaluado con todas las cargas."""
+        todas = len(self.cargas)
+        mejor = min((q for q in rejilla if (q, todas) in self.valores),
+                    key=lambda q: self.valores[(q, todas)])
+        i = rejilla.index(mejor)
+        a = rejilla[i - 1] if i > 0 else rejilla[0]
+        b = rejilla[i + 1] if i + 1 < len(rejilla) else rejilla[-1]
+        if self.trabajadores > 1:
+            self._k_seccion(a, b)
+        else:
+            self._seccion_dorada(a, b)
+
+    def _mejor(self) -> int:
+        """Mejor quantum evaluado con todas las cargas (el menor si hay empate)."""
+        todas = len(self.cargas)
+        return min((q for q, n in self.valores if n == todas),
+                   key=lambda q: (self.valores[(q, todas)], q))
+
+    def ajustar(self) -> ResultadoAjuste:
+        """
+        Ejecuta la búsqueda completa.
+
+        Returns:
+            El mejor quantum y las evaluaciones realizadas
+        """
+        self._refinar(self._explorar())
+        quantum = self._mejor()
+        ampliaciones = 0
+        while (self.ampliable and quantum == self.maximo
+               and ampliaciones < QUANTUM_TUNING_MAX_WIDENINGS):
+            anterior, self.maximo = self.maximo, self.maximo * QUANTUM_TUNING_GROWTH
+            rejilla = rejilla_geometrica(anterior, self.maximo, self._puntos_rejilla())
+            self.evaluar(rejilla)
+            self._refinar(rejilla)
+            quantum = self._mejor()
+            ampliaciones += 1
+
+        todas = len(self.cargas)
+        evaluaciones = {q: v for (q, n), v in self.valores.items() if n == todas}
+        return ResultadoAjuste(quantum, evaluaciones[quantum], dict(sorted(evaluaciones.items())),
+                               self.simulaciones)
@@ -0,0 +1,407 @@
+"""
+Ejecución de simulaciones sin interfaz gráfica.
+
+Describe una simulación como datos serializables (carga de trabajo,
+planificador y parámetros) y la ejecuta hasta el final, devolviendo un
+resultado compacto apto para enviarse entre procesos o por la red.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from .process import Proceso, FabricaProcesos
+from .scheduler import PlanificadorBase, PlanificadorRoundRobin, ObservadorSimulacion
+from .proporcional import PlanificadorStride, PlanificadorLoteria
+from .historial import NivelHistorial, Transicion, nivel_requerido, transiciones_desde_rafagas
+from .indice_historial import IndiceHistorial
+from .rapido import resolver_round_robin
+from .lote import simular_lote
+from ..config.settings import (DEFAULT_QUANTUM, PROGRESS_INTERVAL_TICKS, LOCKSTEP_BATCH_SIZE,
+                               LOCKSTEP_MAX_PROCESSES)
+
+# (id, tiempo_llegada, tiempo_ejecucion, prioridad)
+DescripcionProceso = Tuple[int, int, int, Optional[int]]
+
+# Planificadores disponibles por nombre
+PLANIFICADORES: Dict[str, Callable[..., PlanificadorBase]] = {
+    "round_robin": lambda quantum, nivel_historial=None, **_:
+        PlanificadorRoundRobin(quantum, nivel_historial),
+    "stride": lambda quantum, nivel_historial=None, **_:
+        PlanificadorStride(quantum, nivel_historial),
+    "loteria": lambda quantum, nivel_historial=None, semilla=None, **_:
+        PlanificadorLoteria(quantum, nivel_historial, semilla),
+}
+
+class SimulacionCancelada(Exception):
+    """Se lanza desde un callback de progreso para abortar la simulación."""
+
+@dataclass(frozen=True)
+class ConfiguracionSimulacion:
+    """
+    Descripción completa de una simulación.
+
+        procesos: Carga de trabajo como tuplas (id, llegada, ejecución, prioridad)
+        planificador: Nombre del planificador en PLANIFICADORES
+        quantum: Quantum del planificador
+        parametros: Parámetros adicionales del planificador
+    """
+    procesos: Tuple[DescripcionProceso, ...]
+    planificador: str = "round_robin"
+    quantum: int = DEFAULT_QUANTUM
+    parametros: Tuple[Tuple[str, Any], ...] = field(default_factory=tuple)
+
+    @classmethod
+    def desde_dict(cls, datos: Dict[str, Any]) -> "ConfiguracionSimulacion":
+        """
+        Crea una configuración a partir de un diccionario (p. ej. JSON).
+
+        Args:
+            datos: Diccionario con las claves 'procesos', 'planificador',
+                'quantum' y opcionalmente 'parametros'
+
+        Returns:
+            La configuración validada
+
+        Raises:
+            ValueError: Si la configuración no es válida
+        """
+        planificador = datos.get("planificador", "round_robin")
+        if planificador not in PLANIFICADORES:
+            raise ValueError(f"Planificador desconocido: {planificador}")
+        quantum = int(datos.get("quantum", DEFAULT_QUANTUM))
+        if quantum < 1:
+            raise ValueError("El quantum debe ser mayor que cero")
+
+        procesos = []
+        for i, p in enumerate(datos.get("procesos", [])):
+            if isinstance(p, dict):
+                p = (p.get("id", i + 1), p["tiempo_llegada"],
+                     p["tiempo_ejecucion"], p.get("prioridad"))
+            id_proceso, llegada, ejecucion = int(p[0]), int(p[1]), int(p[2])
+            prioridad = p[3] if len(p) > 3 else None
+            if ejecucion < 1:
+                raise ValueError(f"P{id_proceso}: el tiempo de ejecución debe ser positivo")
+            procesos.append((id_proceso, llegada, ejecucion,
+                             None if prioridad is None else int(prioridad)))
+        if not procesos:
+            raise ValueError("La carga de trabajo no tiene procesos")
+
+        parametros = tuple(sorted(datos.get("parametros", {}).items()))
+        return cls(tuple(procesos), planificador, quantum, parametros)
+
+    @classmethod
+    def desde_procesos(cls, procesos: List[Proceso], planificador: str = "round_robin",
+                       quantum: int = DEFAULT_QUANTUM,
+                       **parametros) -> "ConfiguracionSimulacion":
+        """
+        Crea una configuración a partir de procesos ya construidos.
+
+        Args:
+            procesos: Procesos de la carga de trabajo
+            planificador: Nombre del planificador
+            quantum: Quantum del planificador
+            **parametros: Parámetros adicionales del planificador
+
+        Returns:
+            La configuración equivalente
+        """
+        return cls(
+            tuple((p.id, p.tiempo_llegada, p.tiempo_ejecucion, p.prioridad)
+                  for p in procesos),
+            planificador, quantum, tuple(sorted(parametros.items()))
+        )
+
+    def a_dict(self) -> Dict[str, Any]:
+        """Convierte la configuración en un diccionario aceptado por `desde_dict`."""
+        return {
+            "procesos": [list(p) for p in self.procesos],
+            "planificador": self.planificador,
+            "quantum": self.quantum,
+            "parametros": dict(self.parametros),
+        }
+
+    def crear_procesos(self) -> List[Proceso]:
+        """Crea instancias nuevas de los procesos de la carga de trabajo."""
+        return [FabricaProcesos.crear_proceso(*p) for p in self.procesos]
+
+    def crear_planificador(self, nivel_historial: Optional[NivelHistorial] = None,
+                           consumidores: Sequence[object] = ()) -> PlanificadorBase:
+        """
+        Crea el planificador configurado con sus procesos.
+
+        Args:
+            nivel_historial: Historial mínimo a registrar (por defecto, ninguno)
+            consumidores: Exportadores u otros destinos del resultado; se
+                registra también el historial que declaren necesitar
+                (NIVEL_HISTORIAL_REQUERIDO)
+
+        Returns:
+            El planificador listo para simular
+        """
+        nivel = max(nivel_historial or NivelHistorial.NINGUNO, nivel_requerido(*consumidores))
+        planificador = PLANIFICADORES[self.planificador](
+            quantum=self.quantum, nivel_historial=nivel,
+            **dict(self.parametros))
+        for proceso in self.crear_procesos():
+            planificador.agregar_proceso(proceso)
+        return planificador
+
+def resultado_planificador(planificador: PlanificadorBase) -> Dict[str, Any]:
+    """
+    Resume una simulación terminada en un diccionario serializable.
+
+    Args:
+        planificador: Planificador cuya simulación terminó
+
+    Returns:
+        Diccionario con las métricas y el resultado de cada proceso
+    """
+    return {
+        "metricas": planificador.obtener_metricas(),
+        "procesos": [{
+            "id": p.id,
+            "tiempo_comienzo": p.tiempo_comienzo,
+            "tiempo_finalizacion": p.tiempo_finalizacion,
+            "tiempo_espera": p.tiempo_espera,
+            "tiempo_respuesta": p.tiempo_respuesta,
+            "tiempo_retorno": p.tiempo_retorno,
+            **planificador.datos_proceso(p),
+        } for p in planificador.procesos]
+    }
+
+def _resultado_desde_tiempos(config: ConfiguracionSimulacion, comienzo: List[int],
+                             finalizacion: List[int], espera: List[int],
+                             respuesta: List[int]) -> Dict[str, Any]:
+    """Arma el resultado de una simulación a partir de los tiempos por proceso."""
+    retorno = [fin - p[1] for fin, p in zip(finalizacion, config.procesos)]
+    total = len(config.procesos)
+    tiempo_total = max(finalizacion)
+    return {
+        "metricas": {
+            "tiempo_total": tiempo_total,
+            "utilizacion_cpu": sum(p[2] for p in config.procesos) / tiempo_total * 100,
+            "tiempo_espera_promedio": sum(espera) / total,
+            "tiempo_retorno_promedio": sum(retorno) / total,
+            "total_procesos": total,
+            "procesos_finalizados": total,
+        },
+        "procesos": [{
+            "id": p[0],
+            "tiempo_comienzo": comienzo_p,
+            "tiempo_finalizacion": fin,
+            "tiempo_espera": espera_p,
+            "tiempo_respuesta": respuesta_p,
+            "tiempo_retorno": retorno_p,
+        } for p, comienzo_p, fin, espera_p, respuesta_p, retorno_p in zip(
+            config.procesos, comienzo, finalizacion, espera, respuesta, retorno)]
+    }
+
+def _resultado_round_robin(config: ConfiguracionSimulacion) -> Dict[str, Any]:
+    """Resultado de Round Robin calculado sin simular tick a tick."""
+    tiempos = resolver_round_robin([p[1] for p in config.procesos],
+                                   [p[2] for p in config.procesos], config.quantum)
+    return _resultado_desde_tiempos(
+        config, tiempos["comienzo"].tolist(), tiempos["finalizacion"].tolist(),
+        tiempos["espera"].tolist(), tiempos["respuesta"].tolist())
+
+def ejecutar_lote(configs: List[ConfiguracionSimulacion]) -> List[Dict[str, Any]]:
+    """
+    Simula a la vez muchas configuraciones Round Robin independientes.
+
+    Las simulaciones avanzan en paso sincronizado sobre arreglos de NumPy,
+    lo que conviene para barridos de muchas cargas pequeñas.
+
+    Args:
+        configs: Configuraciones con planificador 'round_robin'
+
+    Returns:
+        Resultados en el mismo orden que `configs`
+
+    Raises:
+        ValueError: Si alguna configuración usa otro planificador
+    """
+    if any(c.planificador != "round_robin" for c in configs):
+        raise ValueError("La simulación por lotes solo admite Round Robin")
+    if not configs:
+        return []
+    tiempos = simular_lote([[p[1] for p in c.procesos] for c in configs],
+                           [[p[2] for p in c.procesos] for c in configs],
+                           [c.quantum for c in configs])
+    columnas = {clave: tiempos[clave].tolist()
+                for clave in ("comienzo", "finalizacion", "espera", "respuesta")}
+    resultados = []
+    for i, config in enumerate(configs):
+        n = len(config.procesos)
+        resultados.append(_resultado_desde_tiempos(
+            config, *(columnas[clave][i][:n]
+                      for clave in ("comienzo", "finalizacion", "espera", "respuesta"))))
+    return resultados
+
+# Planificadores con un cálculo directo del resultado final
+SOLUCIONADORES: Dict[str, Callable[[ConfiguracionSimulacion], Dict[str, Any]]] = {
+    "round_robin": _resultado_round_robin,
+}
+
+def ejecutar_simulacion(config: ConfiguracionSimulacion,
+                        progreso: Optional[Callable[[Dict[str, Any]], None]] = None,
+                        intervalo_progreso: int = PROGRESS_INTERVAL_TICKS,
+                        cache=None,
+                        observadores: Optional[List[ObservadorSimulacion]] = None) -> Dict[str, Any]:
+    """
+    Ejecuta una simulación completa sin interfaz gráfica.
+
+    Args:
+        config: Configuración de la simulación
+        progreso: Callback opcional que recibe el avance cada
+            `intervalo_progreso` ticks; puede lanzar SimulacionCancelada
+        intervalo_progreso: Ticks entre llamadas al callback de progreso
+        cache: CacheResultados opcional consultada antes de simular
+        observadores: Observadores que reciben cada tick (p. ej. telemetría);
+            obligan a simular tick a tick salvo que el resultado esté en caché
+
+    Returns:
+        Diccionario con las métricas y el resultado de cada proceso
+    """
+    # Sin progreso que reportar no hace falta avanzar tick a tick
+    if (progreso is None and cache is None and not observadores
+            and config.planificador in SOLUCIONADORES):
+        return SOLUCIONADORES[config.planificador](config)
+    if cache is not None:
+        resultado = cache.obtener(config)
+        if resultado is None:
+            resultado = ejecutar_simulacion(config, progreso, intervalo_progreso,
+                                            observadores=observadores)
+            cache.guardar(config, resultado)
+        return resultado
+
+    planificador = config.crear_planificador()
+    for observador in observadores or []:
+        planificador.agregar_observador(observador)
+    total = len(planificador.procesos)
+    if progreso is None:
+        while planificador.tick():
+            pass
+    else:
+        while planificador.tick():
+            if planificador.tiempo_actual % intervalo_progreso == 0:
+                progreso({
+                    "tiempo_actual": planificador.tiempo_actual,
+                    "procesos_finalizados": len(planificador.procesos_finalizados),
+                    "total_procesos": total,
+                })
+    return resultado_planificador(planificador)
+
+def ejecutar_barrido(configs: List[ConfiguracionSimulacion], cache=None,
+                     max_trabajadores: Optional[int] = None,
+                     almacen=None) -> List[Dict[str, Any]]:
+    """
+    Ejecuta un conjunto de simulaciones en paralelo.
+
+    Las configuraciones presentes en la caché no se vuelven a simular y las
+    repetidas dentro del barrido se simulan una sola vez. Las de Round Robin
+    con pocos procesos se agrupan en lotes que avanzan en paso sincronizado
+    (ver ejecutar_lote); las cargas grandes usan el motor de eventos.
+
+    Args:
+        configs: Configuraciones a simular
+        cache: CacheResultados opcional
+        max_trabajadores: Número de procesos (por defecto, uno por núcleo)
+        almacen: AlmacenResultados opcional donde se registra cada ejecución
+            simulada (una por configuración distinta; las tomadas de la caché
+            ya se registraron cuando se simularon)
+
+    Returns:
+        Resultados en el mismo orden que `configs`
+    """
+    resultados: List[Optional[Dict[str, Any]]] = [None] * len(configs)
+    pendientes: Dict[ConfiguracionSimulacion, List[int]] = {}
+    for i, config in enumerate(configs):
+        if cache is not None:
+            resultados[i] = cache.obtener(config)
+        if resultados[i] is None:
+            pendientes.setdefault(config, []).append(i)
+
+    if pendientes:
+        en_lote = [c for c in pendientes if c.planificador == "round_robin"
+                   and len(c.procesos) <= LOCKSTEP_MAX_PROCESSES]
+        sueltas = [c for c in pendientes if c.planificador != "round_robin"
+                   or len(c.procesos) > LOCKSTEP_MAX_PROCESSES]
+        lotes = [en_lote[i:i + LOCKSTEP_BATCH_SIZE]
+                 for i in range(0, len(en_lote), LOCKSTEP_BATCH_SIZE)]
+        unicas = en_lote + sueltas
+        if len(lotes) + len(sueltas) == 1:
+            calculados = ejecutar_lote(lotes[0]) if lotes else [ejecutar_simulacion(sueltas[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=max_trabajadores) as pool:
+                calculados = [r for lote in pool.map(ejecutar_lote, lotes) for r in lote]
+                calculados += list(pool.map(ejecutar_simulacion, sueltas))
+        for config, resultado in zip(unicas, calculados):
+            if cache is not None:
+                cache.guardar(config, resultado)
+            if almacen is not None:
+                almacen.guardar(config, resultado)
+            for i in pendientes[config]:
+                resultados[i] = resultado
+        if almacen is not None:
+            almacen.vaciar()
+    return resultados
+
+def ejecutar_linea_cpu(config: ConfiguracionSimulacion) -> Dict[str, Any]:
+    """
+    Ejecuta una simulación y devuelve además la ocupación de la CPU.
+
+    Pensada para procesos trabajadores: el resultado es compacto y solo
+    contiene los intervalos en que cada proceso estuvo en ejecución. Los
+    planificadores con solucionador (Round Robin) no se simulan tick a tick:
+    las métricas salen de SOLUCIONADORES y las transiciones del motor de
+    eventos (ver `transiciones_simulacion`).
+
+    Args:
+        config: Configuración de la simulación
+
+    Returns:
+        Resultado de la simulación con la clave 'linea_cpu': lista de
+        intervalos (inicio, fin, id_proceso) ordenados por inicio
+    """
+    if config.planificador in SOLUCIONADORES:
+        resultado = SOLUCIONADORES[config.planificador](config)
+        transiciones, tiempo_final = transiciones_simulacion(config)
+    else:
+        planificador = config.crear_planificador(NivelHistorial.TRANSICIONES)
+        while planificador.tick():
+            pass
+        resultado = resultado_planificador(planificador)
+        transiciones, tiempo_final = planificador.transiciones, planificador.tiempo_actual
+    indice = IndiceHistorial(transiciones, tiempo_final)
+    resultado["linea_cpu"] = sorted(
+        (inicio, fin, int(clave[1:]))
+        for clave, inicio, fin, _ in indice.intervalos_entre(0, indice.tiempo_final, 'E')
+    )
+    return resultado
+
+def transiciones_simulacion(config: ConfiguracionSimulacion) -> Tuple[Dict[str, List[Transicion]], int]:
+    """
+    Simula una configuración y devuelve solo su historial de transiciones.
+
+    Round Robin se resuelve ráfaga a ráfaga con el motor de eventos; el resto
+    de los planificadores se simula tick a tick.
+
+    Args:
+        config: Configuración de la simulación
+
+    Returns:
+        (transiciones por proceso, tiempo final)
+    """
+    if config.planificador == "round_robin":
+        llegadas = [p[1] for p in config.procesos]
+        tiempos = resolver_round_robin(llegadas, [p[2] for p in config.procesos],
+                                       config.quantum, rafagas=True)
+        finalizacion = tiempos["finalizacion"].tolist()
+        transiciones = transiciones_desde_rafagas(
+            [f"P{p[0]}" for p in config.procesos], [max(t, 0) for t in llegadas],
+            finalizacion, tiempos["rafagas"])
+        return transiciones, max(finalizacion)
+    planificador = config.crear_planificador(NivelHistorial.TRANSICIONES)
+    while planificador.tick():
+        pass
+    return planificador.transiciones, planificador.tiempo_actual
@@ -0,0 +1,188 @@
+"""
+Simulación Round Robin de sistema abierto con horizonte infinito.
+
+Los procesos llegan desde un iterador (potencialmente infinito) de pares
+(llegada, ejecución) ordenados por llegada. La simulación avanza ráfaga a
+ráfaga con la misma semántica que `PlanificadorRoundRobin.tick()` (ver
+`rapido.py`), y cada proceso que termina se incorpora a estadísticas
+acumuladas y se descarta. La memoria depende solo de la cola de listos y
+de tamaños fijos de configuración, no del tiempo simulado.
+
+Para cada métrica por proceso (espera y retorno, en orden de finalización)
+se mantienen:
+
+    - Media, desviación, mínimo y máximo de todas las observaciones
+      (algoritmo de Welford).
+    - Una serie acotada de medias de lotes sobre la que se detecta el
+      calentamiento (MSER-5) y se calcula la media estacionaria con un
+      intervalo de confianza por medias de lotes.
+"""
+
+import random
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from ..utils.estadistica import EstadisticaWelford, SerieLotes
+from ..config.settings import (STEADY_STATE_BATCH_SIZE, STEADY_STATE_MAX_BATCHES,
+                               STEADY_STATE_CI_BATCHES, STEADY_STATE_CONFIDENCE)
+
+# Métricas por proceso que se resumen
+METRICAS_ESTACIONARIAS = ("espera", "retorno")
+
+def llegadas_poisson(tasa: float, ejecucion_media: float,
+                     semilla: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Flujo infinito de llegadas de Poisson con ejecuciones exponenciales.
+
+    Args:
+        tasa: Llegadas por tick
+        ejecucion_media: Media de la ejecución (se redondea, mínimo 1)
+        semilla: Semilla del generador
+
+    Returns:
+        Iterador de pares (llegada, ejecución)
+    """
+    aleatorio = random.Random(semilla)
+    t = 0.0
+    while True:
+        t += aleatorio.expovariate(tasa)
+        yield int(t), max(1, round(aleatorio.expovariate(1 / ejecucion_media)))
+
+class SimulacionEstacionaria:
+    """Round Robin sobre un flujo de llegadas con memoria acotada."""
+
+    def __init__(self, llegadas: Iterable[Tuple[int, int]], quantum: int,
+                 lotes: int = STEADY_STATE_CI_BATCHES,
+                 confianza: float = STEADY_STATE_CONFIDENCE):
+        """
+        Args:
+            llegadas: Pares (llegada, ejecución) con llegadas no decrecientes
+            quantum: Quantum del planificador
+            lotes: Lotes del intervalo de confianza
+            confianza: Nivel de confianza del intervalo
+
+        Raises:
+            ValueError: Si el quantum no es positivo
+        """
+        if quantum < 1:
+            raise ValueError("El quantum debe ser mayor que cero")
+        self.quantum = quantum
+        self.lotes = lotes
+        self.confianza = confianza
+        self._llegadas = iter(llegadas)
+        self._ultima_llegada = None
+        self._siguiente = self._leer()
+        # [llegada, entrada, ejecucion, restante, despachos] de cada proceso en cola
+        self.cola: deque = deque()
+        self.tiempo = 0
+        self.tiempo_cpu_ocupada = 0
+        self.llegados = 0
+        self.finalizados = 0
+        self.estadisticas = {m: EstadisticaWelford() for m in METRICAS_ESTACIONARIAS}
+        self.series = {m: SerieLotes(STEADY_STATE_BATCH_SIZE, STEADY_STATE_MAX_BATCHES)
+                       for m in METRICAS_ESTACIONARIAS}
+
+    def _leer(self) -> Optional[list]:
+        """Siguiente proceso del flujo, o None si se agotó."""
+        par = next(self._llegadas, None)
+        if par is None:
+            return None
+        llegada, ejecucion = int(par[0]), int(par[1])
+        if ejecucion < 1:
+            raise ValueError("El tiempo de ejecución debe ser positivo")
+        if self._ultima_llegada is not None and llegada < self._ultima_llegada:
+            raise ValueError("Las llegadas deben estar ordenadas por tiempo")
+        self._ultima_llegada = llegada
+        return [llegada, max(llegada, 0), ejecucion, ejecucion, 0]
+
+    def _admitir(self, limite: int, inclusivo: bool) -> None:
+        """Encola las llegadas con entrada < limite (o <= si es inclusivo)."""
+        siguiente = self._siguiente
+        while siguiente is not None and (siguiente[1] < limite or
+                                         (inclusivo and siguiente[1] == limite)):
+            self.cola.append(siguiente)
+            self.llegados += 1
+            siguiente = self._leer()
+        self._siguiente = siguiente
+
+    def _registrar(self, proceso: list, fin: int) -> None:
+        """Incorpora un proceso terminado a las estadísticas."""
+        llegada, entrada, ejecucion, _, despachos = proceso
+        for metrica, valor in (("espera", fin - entrada - ejecucion + despachos),
+                               ("retorno", fin - llegada)):
+            self.estadisticas[metrica].agregar(valor)
+            self.series[metrica].agregar(valor)
+        self.finalizados += 1
+
+    def avanzar(self, max_finalizados: Optional[int] = None,
+                tiempo_maximo: Optional[int] = None) -> bool:
+        """
+        Simula hasta alcanzar un límite o agotar el flujo.
+
+        Puede llamarse varias veces; cada llamada continúa donde terminó la
+        anterior. Los límites se comprueban entre ráfagas, así que el tiempo
+        puede pasarse del máximo en menos de un quantum.
+
+        Args:
+            max_finalizados: Detenerse al llegar a esta cantidad total de finalizados
+            tiempo_maximo: Detenerse al alcanzar este tiempo simulado
+
+        Returns:
+            True si quedan procesos por simular
+        """
+        q = self.quantum
+        cola = self.cola
+        t = self.tiempo
+        while True:
+            if max_finalizados is not None and self.finalizados >= max_finalizados:
+                break
+            if tiempo_maximo is not None and t >= tiempo_maximo:
+                break
+            self._admitir(t, True)
+            if not cola:
+                if self._siguiente is None:
+                    break
+                # CPU ociosa hasta la próxima llegada (sin pasar del tiempo máximo)
+                t = self._siguiente[1]
+                if tiempo_maximo is not None:
+                    t = min(t, tiempo_maximo)
+                continue
+            proceso = cola.popleft()
+            proceso[4] += 1
+            fin = min(t + proceso[3], (t // q + 1) * q)
+            proceso[3] -= fin - t
+            self.tiempo_cpu_ocupada += fin - t
+            # Los que llegan durante la ráfaga se encolan antes que el expulsado
+            self._admitir(fin, False)
+            if proceso[3] == 0:
+                self._registrar(proceso, fin)
+            else:
+                cola.append(proceso)
+            t = fin
+        self.tiempo = t
+        return bool(cola) or self._siguiente is not None
+
+    def resumen(self) -> Dict[str, Any]:
+        """
+        Resume la simulación hasta el momento.
+
+        Returns:
+            'tiempo', 'llegados', 'finalizados', 'en_sistema',
+            'utilizacion_cpu' (%), 'productividad' (finalizados por tick) y,
+            por cada métrica, 'total' (todas las observaciones) y
+            'estacionario' (media sin calentamiento con su intervalo)
+        """
+        resultado: Dict[str, Any] = {
+            "tiempo": self.tiempo,
+            "llegados": self.llegados,
+            "finalizados": self.finalizados,
+            "en_sistema": len(self.cola),
+            "utilizacion_cpu": (self.tiempo_cpu_ocupada / self.tiempo * 100
+                                if self.tiempo else 0.0),
+            "productividad": self.finalizados / self.tiempo if self.tiempo else 0.0,
+        }
+        for metrica in METRICAS_ESTACIONARIAS:
+            resultado[metrica] = {
+                "total": self.estadisticas[metrica].resumen(),
+                "estacionario": self.series[metrica].estacionario(self.lotes, self.confianza),
+            }
+        return resultado
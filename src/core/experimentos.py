@@ -0,0 +1,256 @@
+"""
+Experimentos comparativos con números aleatorios comunes.
+
+Comparar dos configuraciones (dos quantums, dos planificadores) con cargas
+aleatorias independientes exige muchas réplicas: la variabilidad entre
+cargas tapa la diferencia entre configuraciones. Con números aleatorios
+comunes cada réplica genera una sola carga con su propio flujo
+(`random.Random` con una semilla derivada de la réplica) y todas las
+configuraciones la simulan, así que la diferencia se estima réplica a
+réplica y su intervalo de confianza es el de la t de Student pareada.
+
+Con variables antitéticas las réplicas van de a pares: la segunda usa el
+flujo espejo de la primera (`AleatorioAntitetico`), de modo que una carga
+pesada se compensa con una liviana, y la observación es el promedio del par.
+
+Para cada par de configuraciones se informa también cuántas simulaciones
+con cargas independientes harían falta para la misma precisión
+('replicas_equivalentes').
+
+Uso:
+    python -m src.core.experimentos --quantum 2 3 --replicas 40
+    python -m src.core.experimentos --planificador round_robin stride --antiteticas
+"""
+
+import argparse
+import itertools
+import math
+import random
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from .process import FabricaProcesos
+from .ejecucion import ConfiguracionSimulacion, DescripcionProceso, PLANIFICADORES, ejecutar_barrido
+from .ajuste import OBJETIVOS, valor_objetivo
+from ..utils.estadistica import intervalo_t, intervalo_diferencia
+from ..config.settings import DEFAULT_QUANTUM, EXPERIMENT_CONFIDENCE
+
+# Genera la carga de una réplica a partir de su flujo de números aleatorios
+GeneradorCarga = Callable[[random.Random], Sequence[DescripcionProceso]]
+
+class AleatorioAntitetico(random.Random):
+    """
+    Flujo espejo de `random.Random` con la misma semilla.
+
+    random() devuelve 1 - u y los enteros uniformes (randint, randrange,
+    choice) el valor simétrico del rango, así que toda variable generada por
+    inversión (uniformes, exponenciales, enteros) cae en el extremo opuesto
+    de su distribución. getrandbits no se refleja.
+    """
+
+    def random(self) -> float:
+        u = super().random()
+        return 1.0 - u if u > 0.0 else 0.0
+
+    def _randbelow(self, n: int) -> int:
+        return n - 1 - super()._randbelow(n)
+
+def carga_aleatoria(num_procesos: int, max_ejecucion: int = 10,
+                    max_llegada: int = 20) -> GeneradorCarga:
+    """
+    Generador de cargas de `FabricaProcesos.crear_procesos_aleatorios`.
+
+    Args:
+        num_procesos: Procesos por carga
+        max_ejecucion: Tiempo máximo de ejecución
+        max_llegada: Tiempo máximo de llegada
+
+    Returns:
+        Función que crea la carga con el flujo recibido
+    """
+    def generar(aleatorio: random.Random) -> List[DescripcionProceso]:
+        return [(p.id, p.tiempo_llegada, p.tiempo_ejecucion, p.prioridad)
+                for p in FabricaProcesos.crear_procesos_aleatorios(
+                    num_procesos, max_ejecucion, max_llegada, aleatorio)]
+    return generar
+
+class ExperimentoComparativo:
+    """Compara configuraciones de planificador con réplicas de cargas aleatorias."""
+
+    def __init__(self, alternativas: Dict[str, Dict[str, Any]], generador: GeneradorCarga,
+                 objetivo: str = "espera_promedio", pesos: Optional[Dict[str, float]] = None,
+                 comunes: bool = True, antiteticas: bool = False, semilla: int = 0,
+                 confianza: float = EXPERIMENT_CONFIDENCE, cache=None,
+                 max_trabajadores: Optional[int] = None):
+        """
+        Args:
+            alternativas: Por nombre, 'planificador', 'quantum' y 'parametros'
+                (como en `ConfiguracionSimulacion.desde_dict`, sin 'procesos')
+            generador: Crea la carga de cada réplica a partir de su flujo
+            objetivo: Nombre en OBJETIVOS o 'mixto'
+            pesos: Para 'mixto', peso de cada objetivo simple
+            comunes: Si todas las alternativas simulan la misma carga en cada
+                réplica (False: un flujo independiente por alternativa)
+            antiteticas: Si las réplicas van de a pares con flujos espejo
+            semilla: Semilla de la que se derivan los flujos de las réplicas
+            confianza: Nivel de confianza de los intervalos
+            cache: CacheResultados opcional
+            max_trabajadores: Procesos en paralelo (por defecto, uno por núcleo)
+
+        Raises:
+            ValueError: Si hay menos de dos alternativas o el objetivo no existe
+        """
+        if len(alternativas) < 2:
+            raise ValueError("Se necesitan al menos dos alternativas")
+        if objetivo != "mixto" and objetivo not in OBJETIVOS:
+            raise ValueError(f"Objetivo desconocido: {objetivo}")
+        self.alternativas = alternativas
+        self.generador = generador
+        self.objetivo = objetivo
+        self.pesos = pesos
+        self.comunes = comunes
+        self.antiteticas = antiteticas
+        self.semilla = semilla
+        self.confianza = confianza
+        self.cache = cache
+        self.max_trabajadores = max_trabajadores
+
+    def flujo(self, replica: int, alternativa: Optional[str] = None) -> random.Random:
+        """
+        Flujo de números aleatorios de una réplica.
+
+        Args:
+            replica: Índice de la réplica
+            alternativa: Alternativa que lo usa (solo cuenta sin números comunes)
+
+        Returns:
+            El generador; con variables antitéticas, las réplicas impares
+            reciben el espejo de la réplica anterior
+        """
+        base = replica // 2 if self.antiteticas else replica
+        semilla = f"{self.semilla}:{base}" if self.comunes else f"{self.semilla}:{alternativa}:{base}"
+        if self.antiteticas and replica % 2:
+            return AleatorioAntitetico(semilla)
+        return random.Random(semilla)
+
+    def _configuracion(self, nombre: str, flujo: random.Random) -> ConfiguracionSimulacion:
+        """Carga de la réplica con la configuración de una alternativa."""
+        carga = self.generador(flujo)
+        datos = dict(self.alternativas[nombre])
+        parametros = dict(datos.get("parametros", {}))
+        if datos.get("planificador") == "loteria" and "semilla" not in parametros:
+            # Los sorteos también comparten flujo entre alternativas
+            parametros["semilla"] = flujo.getrandbits(32)
+        datos.update(procesos=list(carga), parametros=parametros)
+        return ConfiguracionSimulacion.desde_dict(datos)
+
+    def configuraciones(self, replicas: int) -> Dict[str, List[ConfiguracionSimulacion]]:
+        """
+        Configuraciones de cada alternativa, réplica por réplica.
+
+        Args:
+            replicas: Simulaciones por alternativa
+
+        Returns:
+            Por nombre, una configuración por réplica
+        """
+        configs: Dict[str, List[ConfiguracionSimulacion]] = {n: [] for n in self.alternativas}
+        for replica in range(replicas):
+            for nombre in self.alternativas:
+                # Con números comunes cada alternativa recrea el mismo flujo
+                configs[nombre].append(self._configuracion(nombre, self.flujo(replica, nombre)))
+        return configs
+
+    def _observaciones(self, valores: List[float]) -> List[float]:
+        """Observaciones independientes: cada réplica o el promedio de cada par antitético."""
+        if not self.antiteticas:
+            return valores
+        return [(a + b) / 2 for a, b in zip(valores[::2], valores[1::2])]
+
+    def ejecutar(self, replicas: int) -> Dict[str, Any]:
+        """
+        Simula todas las réplicas y resume la comparación.
+
+        Args:
+            replicas: Simulaciones por alternativa (par con variables antitéticas)
+
+        Returns:
+            'replicas', 'observaciones', 'alternativas' (intervalo de la media
+            de cada una, ver `intervalo_t`) y 'diferencias': una por par de
+            alternativas, con 'a', 'b', el intervalo de b - a, 'significativa'
+            y 'replicas_equivalentes'
+
+        Raises:
+            ValueError: Si no alcanzan las réplicas para dos observaciones o
+                son impares con variables antitéticas
+        """
+        if self.antiteticas and replicas % 2:
+            raise ValueError("Con variables antitéticas las réplicas deben ser pares")
+        if replicas < (4 if self.antiteticas else 2):
+            raise ValueError("Se necesitan al menos dos observaciones por alternativa")
+
+        configs = self.configuraciones(replicas)
+        orden = [c for nombre in self.alternativas for c in configs[nombre]]
+        resultados = ejecutar_barrido(orden, self.cache, self.max_trabajadores)
+        valores: Dict[str, List[float]] = {}
+        for i, nombre in enumerate(self.alternativas):
+            valores[nombre] = [valor_objetivo(r, self.objetivo, self.pesos)
+                               for r in resultados[i * replicas:(i + 1) * replicas]]
+        observaciones = {n: self._observaciones(v) for n, v in valores.items()}
+
+        diferencias = []
+        for a, b in itertools.combinations(self.alternativas, 2):
+            intervalo = intervalo_diferencia(observaciones[a], observaciones[b],
+                                             self.comunes, self.confianza)
+            # Réplicas independientes por alternativa con el mismo error estándar
+            varianza_simple = (intervalo_t(valores[a])["desviacion"] ** 2
+                               + intervalo_t(valores[b])["desviacion"] ** 2)
+            error = intervalo["error"]
+            equivalentes = varianza_simple / error ** 2 if error > 0 else math.inf
+            diferencias.append({"a": a, "b": b, **intervalo,
+                                "significativa": not intervalo["inferior"] <= 0 <= intervalo["superior"],
+                                "replicas_equivalentes": equivalentes})
+        return {
+            "replicas": replicas,
+            "observaciones": len(next(iter(observaciones.values()))),
+            "alternativas": {n: intervalo_t(o, self.confianza) for n, o in observaciones.items()},
+            "diferencias": diferencias,
+        }
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Comparación de configuraciones con réplicas")
+    parser.add_argument("--planificador", nargs="+", choices=sorted(PLANIFICADORES),
+                        default=["round_robin"])
+    parser.add_argument("--quantum", type=int, nargs="+", default=[DEFAULT_QUANTUM])
+    parser.add_argument("--procesos", type=int, default=20)
+    parser.add_argument("--max-ejecucion", type=int, default=10)
+    parser.add_argument("--max-llegada", type=int, default=20)
+    parser.add_argument("--replicas", type=int, default=40)
+    parser.add_argument("--objetivo", choices=sorted(OBJETIVOS), default="espera_promedio")
+    parser.add_argument("--independientes", action="store_true",
+                        help="Cargas independientes por alternativa (sin números comunes)")
+    parser.add_argument("--antiteticas", action="store_true")
+    parser.add_argument("--confianza", type=float, default=EXPERIMENT_CONFIDENCE)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--trabajadores", type=int, default=None)
+    args = parser.parse_args()
+
+    alternativas = {f"{planificador} q={quantum}": {"planificador": planificador, "quantum": quantum}
+                    for planificador in args.planificador for quantum in args.quantum}
+    experimento = ExperimentoComparativo(
+        alternativas, carga_aleatoria(args.procesos, args.max_ejecucion, args.max_llegada),
+        args.objetivo, comunes=not args.independientes, antiteticas=args.antiteticas,
+        semilla=args.semilla, confianza=args.confianza, max_trabajadores=args.trabajadores)
+    resultado = experimento.ejecutar(args.replicas)
+
+    print(f"{args.objetivo}: {resultado['replicas']} réplicas, "
+          f"{resultado['observaciones']} observaciones por alternativa")
+    for nombre, intervalo in resultado["alternativas"].items():
+        print(f"  {nombre:<24} {intervalo['media']:10.3f} ± {intervalo['semiamplitud']:.3f}")
+    for diferencia in resultado["diferencias"]:
+        marca = "*" if diferencia["significativa"] else " "
+        print(f"{marca} {diferencia['b']} - {diferencia['a']}: {diferencia['media']:.3f} "
+              f"± {diferencia['semiamplitud']:.3f} "
+              f"(equivale a {diferencia['replicas_equivalentes']:.0f} réplicas independientes)")
+
+if __name__ == "__main__":
+    main()
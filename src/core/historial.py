@@ -0,0 +1,96 @@
+"""
+Niveles de registro del historial de estados y utilidades sobre transiciones.
+"""
+
+from enum import IntEnum
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# (tiempo, estado) en que un proceso cambia de estado
+Transicion = Tuple[int, str]
+# (inicio, fin, estado) con fin excluido
+Segmento = Tuple[int, int, str]
+
+class NivelHistorial(IntEnum):
+    """
+    Cantidad de historial que registra un planificador.
+
+        NINGUNO: Solo métricas; no se registra historial
+        TRANSICIONES: Solo los cambios de estado de cada proceso
+        COMPLETO: Además, la matriz tiempo x proceso en historial_estados
+    """
+    NINGUNO = 0
+    TRANSICIONES = 1
+    COMPLETO = 2
+
+def nivel_requerido(*consumidores: object) -> NivelHistorial:
+    """
+    Historial que necesitan todos los consumidores de una simulación.
+
+    Args:
+        *consumidores: Observadores, exportadores u otros objetos (o clases)
+            que declaran NIVEL_HISTORIAL_REQUERIDO; los demás no requieren nada
+
+    Returns:
+        El mayor nivel declarado (NINGUNO si no hay consumidores)
+    """
+    return max((getattr(c, 'NIVEL_HISTORIAL_REQUERIDO', NivelHistorial.NINGUNO)
+                for c in consumidores), default=NivelHistorial.NINGUNO)
+
+def calcular_segmentos(transiciones: Dict[str, List[Transicion]],
+                       tiempo_final: int) -> Dict[str, List[Segmento]]:
+    """
+    Convierte las transiciones de cada proceso en intervalos de estado.
+
+    Args:
+        transiciones: Cambios de estado por proceso, ordenados por tiempo
+        tiempo_final: Tiempo en que termina el último intervalo abierto
+
+    Returns:
+        Intervalos (inicio, fin, estado) por proceso
+    """
+    segmentos: Dict[str, List[Segmento]] = {}
+    for proceso, cambios in transiciones.items():
+        lista = []
+        for i, (inicio, estado) in enumerate(cambios):
+            fin = cambios[i + 1][0] if i + 1 < len(cambios) else tiempo_final
+            if fin > inicio:
+                lista.append((inicio, fin, estado))
+        segmentos[proceso] = lista
+    return segmentos
+
+def transiciones_desde_rafagas(claves: Sequence[str], entradas: Sequence[int],
+                               finalizacion: Sequence[int],
+                               rafagas: Iterable[Tuple[int, int, int]]) -> Dict[str, List[Transicion]]:
+    """
+    Reconstruye las transiciones que registraría el planificador tick a tick.
+
+    Un proceso está sin llegar ('') hasta su entrada, en ejecución ('E')
+    durante sus ráfagas, listo ('L') entre ellas y finalizado ('F') desde
+    su finalización, salvo que termine en el último instante.
+
+    Args:
+        claves: Clave de cada proceso ('P{id}')
+        entradas: Tick de entrada de cada proceso
+        finalizacion: Tiempo de finalización de cada proceso
+        rafagas: Ráfagas (inicio, fin, índice del proceso) en orden de tiempo
+
+    Returns:
+        Cambios de estado por proceso, como `PlanificadorBase.transiciones`
+    """
+    tiempo_final = max(finalizacion)
+    cambios: List[List[Transicion]] = [[(0, '')] if e > 0 else [] for e in entradas]
+    ultimo_fin = list(entradas)
+    for inicio, fin, i in rafagas:
+        lista = cambios[i]
+        # Una ráfaga pegada a la anterior continúa el mismo intervalo en ejecución
+        if lista and lista[-1][1] == 'E' and ultimo_fin[i] == inicio:
+            ultimo_fin[i] = fin
+            continue
+        if inicio > ultimo_fin[i]:
+            lista.append((ultimo_fin[i], 'L'))
+        lista.append((inicio, 'E'))
+        ultimo_fin[i] = fin
+    for i, fin in enumerate(finalizacion):
+        if fin < tiempo_final:
+            cambios[i].append((fin, 'F'))
+    return dict(zip(claves, cambios))
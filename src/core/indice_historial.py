@@ -0,0 +1,378 @@
+"""
+Índice de consultas sobre el historial de estados.
+
+Convierte las transiciones de cada proceso en intervalos de estado
+[inicio, fin) guardados en arreglos ordenados por proceso y tiempo, y
+construye (bajo demanda) un árbol de intervalos centrado por estado. Con
+ellos responde sin recorrer el historial completo:
+
+    - Estado de un proceso en un instante: búsqueda binaria, O(log m).
+    - Procesos en un estado en un instante (quién tenía la CPU, el conjunto
+      de listos): O(log n + k).
+    - Intervalos que se solapan con un rango de tiempo: O(log n + k).
+    - Expulsiones de un proceso en un rango: O(log m + k).
+
+donde n es la cantidad de intervalos, m la de un proceso y k la de resultados.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .historial import Transicion, Segmento
+from ..config.settings import HISTORY_INDEX_LEAF_SIZE
+
+# (proceso, inicio, fin, estado) de un intervalo del historial
+IntervaloProceso = Tuple[str, int, int, str]
+
+class _ArbolIntervalos:
+    """
+    Árbol de intervalos centrado, estático, sobre intervalos [inicio, fin).
+
+    Cada nodo interno guarda los intervalos que contienen su centro dos
+    veces: ordenados por inicio creciente y por fin decreciente, de modo que
+    los que contienen un instante son siempre un prefijo de una de las dos
+    listas. Los intervalos que terminan antes del centro van al hijo
+    izquierdo y los que empiezan después, al derecho. Las hojas guardan a lo
+    sumo `hoja` intervalos y se recorren completas.
+    """
+
+    def __init__(self, inicio: np.ndarray, fin: np.ndarray, ids: np.ndarray,
+                 hoja: int = HISTORY_INDEX_LEAF_SIZE):
+        """
+        Args:
+            inicio: Inicio de cada intervalo
+            fin: Fin (excluido) de cada intervalo
+            ids: Identificador que se devuelve por cada intervalo
+            hoja: Intervalos máximos por hoja
+        """
+        # Por nodo: centro (None en hojas), hijos y tramo en los arreglos ordenados
+        self.centro: List[Optional[int]] = []
+        self.izquierdo: List[int] = []
+        self.derecho: List[int] = []
+        self.tramo: List[Tuple[int, int]] = []
+        por_inicio: List[np.ndarray] = []
+        por_fin: List[np.ndarray] = []
+        desplazamiento = 0
+
+        pendientes = [(-1, False, np.arange(inicio.size))]
+        while pendientes:
+            padre, es_derecho, indices = pendientes.pop()
+            nodo = len(self.centro)
+            if padre >= 0:
+                (self.derecho if es_derecho else self.izquierdo)[padre] = nodo
+            self.izquierdo.append(-1)
+            self.derecho.append(-1)
+            inicios, fines = inicio[indices], fin[indices]
+            if indices.size <= hoja:
+                self.centro.append(None)
+                propios = indices
+            else:
+                k = indices.size // 2
+                centro = int(np.partition(inicios, k)[k])
+                self.centro.append(centro)
+                propios = indices[(inicios <= centro) & (fines > centro)]
+                # Los de la izquierda terminan antes del centro; los de la derecha empiezan después
+                pendientes.append((nodo, False, indices[fines <= centro]))
+                pendientes.append((nodo, True, indices[inicios > centro]))
+            por_inicio.append(propios[np.argsort(inicio[propios], kind="stable")])
+            por_fin.append(propios[np.argsort(-fin[propios], kind="stable")])
+            self.tramo.append((desplazamiento, desplazamiento + propios.size))
+            desplazamiento += propios.size
+
+        orden_inicio = np.concatenate(por_inicio) if por_inicio else np.empty(0, dtype=np.int64)
+        orden_fin = np.concatenate(por_fin) if por_fin else np.empty(0, dtype=np.int64)
+        self._inicio_ordenado = inicio[orden_inicio]
+        self._fin_ordenado = fin[orden_inicio]
+        self._ids_por_inicio = ids[orden_inicio]
+        # Fin negado para buscar con searchsorted sobre un arreglo creciente
+        self._menos_fin = -fin[orden_fin]
+        self._ids_por_fin = ids[orden_fin]
+
+    def en(self, t: int) -> List[np.ndarray]:
+        """
+        Intervalos que contienen un instante.
+
+        Args:
+            t: Instante consultado
+
+        Returns:
+            Trozos de arreglo con los ids encontrados
+        """
+        encontrados = []
+        nodo = 0 if self.centro else -1
+        while nodo >= 0:
+            a, b = self.tramo[nodo]
+            centro = self.centro[nodo]
+            if centro is None:
+                corte = a + int(np.searchsorted(self._inicio_ordenado[a:b], t, side="right"))
+                mascara = self._fin_ordenado[a:corte] > t
+                encontrados.append(self._ids_por_inicio[a:corte][mascara])
+                break
+            if t < centro:
+                corte = a + int(np.searchsorted(self._inicio_ordenado[a:b], t, side="right"))
+                encontrados.append(self._ids_por_inicio[a:corte])
+                nodo = self.izquierdo[nodo]
+            else:
+                corte = a + int(np.searchsorted(self._menos_fin[a:b], -t, side="left"))
+                encontrados.append(self._ids_por_fin[a:corte])
+                nodo = self.derecho[nodo]
+        return encontrados
+
+    def entre(self, desde: int, hasta: int) -> List[np.ndarray]:
+        """
+        Intervalos que se solapan con [desde, hasta).
+
+        Args:
+            desde: Inicio del rango
+            hasta: Fin (excluido) del rango
+
+        Returns:
+            Trozos de arreglo con los ids encontrados
+        """
+        encontrados = []
+        pendientes = [0] if self.centro and desde < hasta else []
+        while pendientes:
+            nodo = pendientes.pop()
+            a, b = self.tramo[nodo]
+            centro = self.centro[nodo]
+            if centro is None:
+                corte = a + int(np.searchsorted(self._inicio_ordenado[a:b], hasta, side="left"))
+                mascara = self._fin_ordenado[a:corte] > desde
+                encontrados.append(self._ids_por_inicio[a:corte][mascara])
+                continue
+            if hasta <= centro:
+                corte = a + int(np.searchsorted(self._inicio_ordenado[a:b], hasta, side="left"))
+                encontrados.append(self._ids_por_inicio[a:corte])
+                siguientes = (self.izquierdo[nodo],)
+            elif desde >= centro:
+                corte = a + int(np.searchsorted(self._menos_fin[a:b], -desde, side="left"))
+                encontrados.append(self._ids_por_fin[a:corte])
+                siguientes = (self.derecho[nodo],)
+            else:
+                # El rango contiene el centro: todos los intervalos del nodo se solapan
+                encontrados.append(self._ids_por_inicio[a:b])
+                siguientes = (self.izquierdo[nodo], self.derecho[nodo])
+            pendientes.extend(n for n in siguientes if n >= 0)
+        return encontrados
+
+class IndiceHistorial:
+    """
+    Índice de intervalos de estado por proceso.
+
+        procesos: Claves de los procesos, en el orden del historial
+        estados: Estados presentes; `estado` guarda el índice en esta tupla
+        tiempo_final: Fin del último intervalo abierto
+        inicio, fin, proceso, estado: Un elemento por intervalo, ordenados
+            por proceso y luego por tiempo
+    """
+
+    def __init__(self, transiciones: Dict[str, List[Transicion]], tiempo_final: int):
+        """
+        Args:
+            transiciones: Cambios de estado por proceso, ordenados por tiempo
+            tiempo_final: Tiempo en que termina el último intervalo abierto
+        """
+        self.procesos = list(transiciones)
+        self.tiempo_final = tiempo_final
+        self._posicion = {clave: i for i, clave in enumerate(self.procesos)}
+
+        cantidades = np.fromiter((len(c) for c in transiciones.values()), dtype=np.int64,
+                                 count=len(self.procesos))
+        total = int(cantidades.sum())
+        tiempos = np.fromiter((t for c in transiciones.values() for t, _ in c),
+                              dtype=np.int64, count=total)
+        nombres = [e for c in transiciones.values() for _, e in c]
+        self.estados: Tuple[str, ...] = tuple(dict.fromkeys(nombres))
+        codigo = {e: i for i, e in enumerate(self.estados)}
+        codigos = np.fromiter((codigo[e] for e in nombres), dtype=np.int8, count=total)
+        procesos = np.repeat(np.arange(len(self.procesos), dtype=np.int32), cantidades)
+
+        # Cada intervalo termina en la transición siguiente del mismo proceso
+        fines = np.full(total, tiempo_final, dtype=np.int64)
+        if total:
+            mismo = procesos[1:] == procesos[:-1]
+            fines[:-1][mismo] = tiempos[1:][mismo]
+        validos = fines > tiempos
+        self.inicio = tiempos[validos]
+        self.fin = fines[validos]
+        self.proceso = procesos[validos]
+        self.estado = codigos[validos]
+        # Intervalos de cada proceso: [limites[i], limites[i + 1])
+        self._limites = np.searchsorted(self.proceso, np.arange(len(self.procesos) + 1))
+        self._arboles: Dict[int, _ArbolIntervalos] = {}
+
+    def __len__(self) -> int:
+        return int(self.inicio.size)
+
+    def _arbol(self, codigo: int) -> _ArbolIntervalos:
+        """Árbol de intervalos de un estado (se construye en la primera consulta)."""
+        arbol = self._arboles.get(codigo)
+        if arbol is None:
+            ids = np.flatnonzero(self.estado == codigo)
+            arbol = self._arboles[codigo] = _ArbolIntervalos(self.inicio[ids], self.fin[ids], ids)
+        return arbol
+
+    def _codigos(self, estado: Optional[str]) -> List[int]:
+        """Códigos de un estado, o de todos si es None."""
+        if estado is None:
+            return list(range(len(self.estados)))
+        return [self.estados.index(estado)] if estado in self.estados else []
+
+    def _tramo(self, clave: str) -> Tuple[int, int]:
+        """Intervalos de un proceso en los arreglos del índice."""
+        i = self._posicion[clave]
+        return int(self._limites[i]), int(self._limites[i + 1])
+
+    @staticmethod
+    def _unir(trozos: List[np.ndarray]) -> np.ndarray:
+        """Une los ids encontrados en orden de proceso y tiempo."""
+        if not trozos:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(trozos))
+
+    def estado_en(self, clave: str, t: int) -> str:
+        """
+        Estado de un proceso en un instante.
+
+        Args:
+            clave: Clave del proceso ('P{id}')
+            t: Instante consultado
+
+        Returns:
+            Código del estado, o '' si el proceso no tiene intervalo en t
+
+        Raises:
+            KeyError: Si el proceso no está en el historial
+        """
+        a, b = self._tramo(clave)
+        j = a + int(np.searchsorted(self.inicio[a:b], t, side="right")) - 1
+        if j < a or self.fin[j] <= t:
+            return ''
+        return self.estados[self.estado[j]]
+
+    def procesos_en(self, estado: str, t: int) -> List[str]:
+        """
+        Procesos que estaban en un estado en un instante.
+
+        Args:
+            estado: Código del estado ('E', 'L', 'F')
+            t: Instante consultado
+
+        Returns:
+            Claves de los procesos, en el orden del historial
+        """
+        trozos = [trozo for c in self._codigos(estado) for trozo in self._arbol(c).en(t)]
+        return [self.procesos[p] for p in self.proceso[self._unir(trozos)]]
+
+    def en_ejecucion(self, t: int) -> List[str]:
+        """Procesos que tenían la CPU en un instante."""
+        return self.procesos_en('E', t)
+
+    def listos(self, t: int) -> List[str]:
+        """Procesos en la cola de listos en un instante."""
+        return self.procesos_en('L', t)
+
+    def estados_en(self, t: int) -> Dict[str, str]:
+        """
+        Estado de todos los procesos en un instante.
+
+        Args:
+            t: Instante consultado
+
+        Returns:
+            Estado por clave de proceso (solo los que tienen intervalo en t)
+        """
+        resultado = {}
+        for codigo in self._codigos(None):
+            ids = self._unir(self._arbol(codigo).en(t))
+            for p in self.proceso[ids]:
+                resultado[self.procesos[p]] = self.estados[codigo]
+        return resultado
+
+    def intervalos_entre(self, desde: int, hasta: int,
+                         estado: Optional[str] = None) -> List[IntervaloProceso]:
+        """
+        Intervalos que se solapan con un rango de tiempo.
+
+        Args:
+            desde: Inicio del rango
+            hasta: Fin (excluido) del rango
+            estado: Solo los de este estado (por defecto, todos)
+
+        Returns:
+            Intervalos (proceso, inicio, fin, estado) ordenados por inicio
+        """
+        trozos = [trozo for c in self._codigos(estado) for trozo in self._arbol(c).entre(desde, hasta)]
+        ids = self._unir(trozos)
+        ids = ids[np.argsort(self.inicio[ids], kind="stable")]
+        return [(self.procesos[p], int(i), int(f), self.estados[e])
+                for p, i, f, e in zip(self.proceso[ids], self.inicio[ids],
+                                      self.fin[ids], self.estado[ids])]
+
+    def segmentos_proceso(self, clave: str, desde: int = 0,
+                          hasta: Optional[int] = None) -> List[Segmento]:
+        """
+        Intervalos de un proceso que se solapan con un rango de tiempo.
+
+        Args:
+            clave: Clave del proceso
+            desde: Inicio del rango
+            hasta: Fin (excluido) del rango (por defecto, el tiempo final)
+
+        Returns:
+            Intervalos (inicio, fin, estado) en orden de tiempo
+        """
+        hasta = self.tiempo_final if hasta is None else hasta
+        a, b = self._tramo(clave)
+        # Los intervalos de un proceso son disjuntos: basta acotar por inicio y fin
+        primero = a + int(np.searchsorted(self.fin[a:b], desde, side="right"))
+        ultimo = a + int(np.searchsorted(self.inicio[a:b], hasta, side="left"))
+        return [(int(i), int(f), self.estados[e]) for i, f, e in
+                zip(self.inicio[primero:ultimo], self.fin[primero:ultimo],
+                    self.estado[primero:ultimo])]
+
+    def expulsiones(self, clave: str, desde: int = 0, hasta: Optional[int] = None) -> List[int]:
+        """
+        Instantes en que un proceso dejó la CPU sin terminar.
+
+        Args:
+            clave: Clave del proceso
+            desde: Inicio del rango
+            hasta: Fin (excluido) del rango (por defecto, el tiempo final)
+
+        Returns:
+            Instantes de paso de ejecución ('E') a listo ('L') en el rango
+        """
+        if 'E' not in self.estados or 'L' not in self.estados:
+            return []
+        hasta = self.tiempo_final if hasta is None else hasta
+        ejecutando, listo = self.estados.index('E'), self.estados.index('L')
+        a, b = self._tramo(clave)
+        # Intervalos en ejecución cuyo fin cae en el rango, seguidos de uno listo
+        primero = a + int(np.searchsorted(self.fin[a:b], desde, side="left"))
+        ultimo = min(b - 1, a + int(np.searchsorted(self.fin[a:b], hasta, side="left")))
+        if primero >= ultimo:
+            return []
+        estados = self.estado[primero:ultimo + 1]
+        mascara = ((estados[:-1] == ejecutando) & (estados[1:] == listo)
+                   & (self.fin[primero:ultimo] == self.inicio[primero + 1:ultimo + 1]))
+        return self.fin[primero:ultimo][mascara].tolist()
+
+    def matriz_estados(self, hasta: Optional[int] = None) -> Dict[str, List[str]]:
+        """
+        Estado de cada proceso en cada tick, como columnas.
+
+        Args:
+            hasta: Ticks de cada columna (por defecto, el tiempo final)
+
+        Returns:
+            Lista de estados por tick ('' sin intervalo) por clave de proceso
+        """
+        hasta = self.tiempo_final if hasta is None else hasta
+        columnas = {}
+        for clave in self.procesos:
+            columna = [''] * hasta
+            for inicio, fin, estado in self.segmentos_proceso(clave, 0, hasta):
+                fin = min(fin, hasta)
+                columna[inicio:fin] = [estado] * (fin - inicio)
+            columnas[clave] = columna
+        return columnas
@@ -0,0 +1,364 @@
+"""
+Simulación de sistemas con muchas CPU, repartida entre procesos del SO.
+
+Cada CPU simulada tiene su propio planificador (cualquiera de
+`PLANIFICADORES`) con su cola de listos. Un despachador asigna cada proceso
+que llega a la CPU con menos trabajo pendiente, pero solo conoce la carga
+de las CPU al comienzo de cada ventana de `ventana` ticks, como un
+balanceador periódico: las llegadas de [T, T + ventana) se reparten con las
+cargas medidas en T.
+
+Ese retraso de información es la anticipación (lookahead) que permite una
+sincronización conservadora sin vuelta atrás: dentro de una ventana ninguna
+CPU depende de otra, así que cada partición avanza sus CPU hasta el final
+de la ventana y en la barrera informa cargas y procesos terminados al
+coordinador, que reparte las llegadas de la ventana siguiente. El resultado
+no depende de cuántas particiones haya; con `particiones=1` la misma
+simulación corre en el proceso actual y sirve de referencia secuencial.
+
+Uso:
+    python -m src.core.multicpu carga.json --cpus 64 --particiones 4
+"""
+
+import argparse
+import heapq
+import json
+import multiprocessing
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .process import EstadoProceso, FabricaProcesos
+from .historial import NivelHistorial
+from .scheduler import PlanificadorBase
+from .ejecucion import ConfiguracionSimulacion, PLANIFICADORES
+from ..config.settings import MULTICPU_WINDOW, MULTICPU_JOIN_TIMEOUT
+
+# (cpu, índice del proceso, llegada, ejecución, prioridad)
+Asignacion = Tuple[int, int, int, int, Optional[int]]
+# (índice del proceso, comienzo, finalización, espera, respuesta)
+Terminado = Tuple[int, int, int, int, int]
+# Informe de una partición al final de una ventana:
+# (trabajo pendiente de cada CPU, procesos terminados, ticks de CPU ocupada)
+Informe = Tuple[List[int], List[Terminado], int]
+
+class Particion:
+    """
+    CPU simuladas que avanza un mismo proceso del SO.
+
+        cpus: Índices globales de las CPU de la partición
+        planificadores: Planificador de cada CPU, en el orden de `cpus`
+    """
+
+    def __init__(self, cpus: Sequence[int], planificador: str, quantum: int,
+                 parametros: Dict[str, Any]):
+        """
+        Args:
+            cpus: Índices globales de las CPU de la partición
+            planificador: Nombre del planificador en PLANIFICADORES
+            quantum: Quantum de cada CPU
+            parametros: Parámetros adicionales del planificador
+        """
+        self.cpus = list(cpus)
+        self._posicion = {cpu: i for i, cpu in enumerate(self.cpus)}
+        self.planificadores: List[PlanificadorBase] = []
+        for cpu in self.cpus:
+            propios = dict(parametros)
+            if propios.get("semilla") is not None:
+                # Sorteos independientes por CPU, iguales con cualquier partición
+                propios["semilla"] = propios["semilla"] + cpu
+            self.planificadores.append(PLANIFICADORES[planificador](
+                quantum=quantum, nivel_historial=NivelHistorial.NINGUNO, **propios))
+
+    def avanzar(self, desde: int, hasta: int, asignaciones: List[Asignacion]) -> Informe:
+        """
+        Agrega las llegadas asignadas y simula las CPU hasta `hasta`.
+
+        Las CPU sin procesos pendientes no se simulan tick a tick: su reloj
+        salta al final de la ventana. Los procesos terminados se informan y
+        se quitan del planificador, para que cada tick recorra solo los
+        procesos activos.
+
+        Args:
+            desde: Primer tick de la ventana
+            hasta: Tick siguiente al último de la ventana
+            asignaciones: Llegadas de la ventana asignadas a CPU de la partición
+
+        Returns:
+            Trabajo pendiente de cada CPU, procesos terminados y ticks de CPU ocupada
+        """
+        for planificador in self.planificadores:
+            # Si el coordinador saltó ventanas vacías, todas las CPU estaban inactivas
+            planificador.tiempo_actual = max(planificador.tiempo_actual, desde)
+        for cpu, indice, llegada, ejecucion, prioridad in asignaciones:
+            self.planificadores[self._posicion[cpu]].agregar_proceso(
+                FabricaProcesos.crear_proceso(indice, llegada, ejecucion, prioridad))
+
+        cargas: List[int] = []
+        terminados: List[Terminado] = []
+        ocupado = 0
+        for planificador in self.planificadores:
+            if len(planificador.procesos_finalizados) == len(planificador.procesos):
+                # Inactiva: cada tick solo avanzaría el reloj
+                planificador.tiempo_actual = hasta
+                cargas.append(0)
+                continue
+            antes = planificador.tiempo_cpu_ocupada
+            while planificador.tiempo_actual < hasta:
+                planificador.tick()
+            ocupado += planificador.tiempo_cpu_ocupada - antes
+            if planificador.procesos_finalizados:
+                terminados.extend((p.id, p.tiempo_comienzo, p.tiempo_finalizacion,
+                                   p.tiempo_espera, p.tiempo_respuesta)
+                                  for p in planificador.procesos_finalizados)
+                planificador.procesos = [p for p in planificador.procesos
+                                         if p.estado != EstadoProceso.FINALIZADO]
+                planificador.procesos_finalizados = []
+            cargas.append(sum(p.tiempo_restante for p in planificador.procesos))
+        return cargas, terminados, ocupado
+
+def _trabajador(conexion, cpus: List[int], planificador: str, quantum: int,
+                parametros: Dict[str, Any]) -> None:
+    """Atiende ventanas de una partición hasta recibir None; los errores se devuelven."""
+    particion = Particion(cpus, planificador, quantum, parametros)
+    while True:
+        mensaje = conexion.recv()
+        if mensaje is None:
+            break
+        try:
+            informe = particion.avanzar(*mensaje)
+        except Exception as error:
+            informe = error
+        conexion.send(informe)
+    conexion.close()
+
+def _fallo_particion(indice: int, trabajador: multiprocessing.Process,
+                     causa: BaseException) -> RuntimeError:
+    """Error que describe la falla de una partición remota."""
+    if isinstance(causa, (EOFError, OSError)):
+        # El proceso murió: se espera un momento para conocer su código de salida
+        trabajador.join(MULTICPU_JOIN_TIMEOUT)
+        return RuntimeError(f"La partición {indice} terminó inesperadamente "
+                            f"(código de salida {trabajador.exitcode})")
+    return RuntimeError(f"Falló la partición {indice}: {causa!r}")
+
+class SimulacionMultiCPU:
+    """
+    Coordinador de una simulación con varias CPU y despacho a la menos cargada.
+
+        config: Carga de trabajo, planificador y quantum de cada CPU
+        cpus: Cantidad de CPU simuladas
+        ventana: Ticks entre barreras (y entre actualizaciones del despachador)
+        particiones: Procesos del SO entre los que se reparten las CPU
+    """
+
+    def __init__(self, config: ConfiguracionSimulacion, cpus: int,
+                 ventana: int = MULTICPU_WINDOW, particiones: int = 1):
+        """
+        Args:
+            config: Carga de trabajo, planificador y quantum de cada CPU
+            cpus: Cantidad de CPU simuladas
+            ventana: Ticks entre barreras
+            particiones: Procesos del SO (1: todo en el proceso actual)
+
+        Raises:
+            ValueError: Si algún parámetro no es positivo
+        """
+        if cpus < 1 or ventana < 1 or particiones < 1:
+            raise ValueError("cpus, ventana y particiones deben ser positivos")
+        self.config = config
+        self.cpus = cpus
+        self.ventana = ventana
+        self.particiones = min(particiones, cpus)
+
+    def _rangos(self) -> List[List[int]]:
+        """CPU contiguas de cada partición, en bloques de tamaño parejo."""
+        limites = np.linspace(0, self.cpus, self.particiones + 1).astype(int)
+        return [list(range(a, b)) for a, b in zip(limites[:-1], limites[1:])]
+
+    def ejecutar(self) -> Dict[str, Any]:
+        """
+        Simula la carga hasta que terminan todos los procesos.
+
+        Returns:
+            'metricas' (las de `resultado_planificador`, con la utilización
+            promediada entre CPU, más 'cpus', 'ventanas' y 'segundos') y
+            'procesos' con el resultado y la 'cpu' de cada proceso, en el
+            orden de la carga
+
+        Raises:
+            RuntimeError: Si una partición falla o su proceso termina; el
+                mensaje indica cuál y la causa queda encadenada
+        """
+        procesos = self.config.procesos
+        total = len(procesos)
+        # Orden de llegada estable: a igual llegada, el orden de la carga
+        orden = sorted(range(total), key=lambda i: max(procesos[i][1], 0))
+        entradas = [max(procesos[i][1], 0) for i in orden]
+
+        rangos = self._rangos()
+        particion_de = np.repeat(np.arange(len(rangos)), [len(r) for r in rangos])
+        parametros = dict(self.config.parametros)
+        locales: List[Particion] = []
+        conexiones = []
+        trabajadores = []
+        if len(rangos) == 1:
+            locales.append(Particion(rangos[0], self.config.planificador,
+                                     self.config.quantum, parametros))
+        else:
+            for rango in rangos:
+                propia, remota = multiprocessing.Pipe()
+                trabajador = multiprocessing.Process(
+                    target=_trabajador, daemon=True,
+                    args=(remota, rango, self.config.planificador, self.config.quantum, parametros))
+                trabajador.start()
+                remota.close()
+                conexiones.append(propia)
+                trabajadores.append(trabajador)
+
+        cpu = np.zeros(total, dtype=np.int64)
+        comienzo = np.zeros(total, dtype=np.int64)
+        finalizacion = np.zeros(total, dtype=np.int64)
+        espera = np.zeros(total, dtype=np.int64)
+        respuesta = np.zeros(total, dtype=np.int64)
+        cargas = [0] * self.cpus
+        ocupado = terminados = ventanas = siguiente = 0
+        inicio_reloj = time.perf_counter()
+        t = 0
+        try:
+            while terminados < total:
+                if not any(cargas) and siguiente < total:
+                    # Sistema vacío: se salta a la ventana de la próxima llegada
+                    t = max(t, entradas[siguiente] // self.ventana * self.ventana)
+                hasta = t + self.ventana
+                fin = bisect_left(entradas, hasta, lo=siguiente)
+
+                # Despacho a la CPU con menos trabajo pendiente (a igualdad, la de menor índice)
+                monticulo = [(carga, c) for c, carga in enumerate(cargas)]
+                heapq.heapify(monticulo)
+                asignaciones: List[List[Asignacion]] = [[] for _ in rangos]
+                for i in orden[siguiente:fin]:
+                    carga, c = heapq.heappop(monticulo)
+                    id_proceso, llegada, ejecucion, prioridad = procesos[i]
+                    cpu[i] = c
+                    asignaciones[particion_de[c]].append((c, i, llegada, ejecucion, prioridad))
+                    heapq.heappush(monticulo, (carga + ejecucion, c))
+                siguiente = fin
+
+                if locales:
+                    informes = [locales[0].avanzar(t, hasta, asignaciones[0])]
+                else:
+                    # Todas las particiones avanzan la ventana a la vez
+                    for k, (conexion, propias) in enumerate(zip(conexiones, asignaciones)):
+                        try:
+                            conexion.send((t, hasta, propias))
+                        except (BrokenPipeError, OSError) as error:
+                            raise _fallo_particion(k, trabajadores[k], error) from error
+                    informes = []
+                    for k, conexion in enumerate(conexiones):
+                        try:
+                            informe = conexion.recv()
+                        except (EOFError, OSError) as error:
+                            raise _fallo_particion(k, trabajadores[k], error) from error
+                        if isinstance(informe, BaseException):
+                            raise _fallo_particion(k, trabajadores[k], informe) from informe
+                        informes.append(informe)
+
+                for rango, (cargas_particion, terminados_particion, ocupado_particion) in zip(
+                        rangos, informes):
+                    cargas[rango[0]:rango[-1] + 1] = cargas_particion
+                    ocupado += ocupado_particion
+                    terminados += len(terminados_particion)
+                    for indice, inicio, final, espera_p, respuesta_p in terminados_particion:
+                        comienzo[indice] = inicio
+                        finalizacion[indice] = final
+                        espera[indice] = espera_p
+                        respuesta[indice] = respuesta_p
+                t = hasta
+                ventanas += 1
+        finally:
+            # Una partición caída no debe ocultar el error original ni dejar procesos vivos
+            for conexion in conexiones:
+                try:
+                    conexion.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                try:
+                    conexion.close()
+                except OSError:
+                    pass
+            for trabajador in trabajadores:
+                trabajador.join(MULTICPU_JOIN_TIMEOUT)
+                if trabajador.is_alive():
+                    trabajador.terminate()
+                    trabajador.join()
+
+        return self._resultado(cpu, comienzo, finalizacion, espera, respuesta, ocupado,
+                               ventanas, time.perf_counter() - inicio_reloj)
+
+    def _resultado(self, cpu: np.ndarray, comienzo: np.ndarray, finalizacion: np.ndarray,
+                   espera: np.ndarray, respuesta: np.ndarray, ocupado: int, ventanas: int,
+                   segundos: float) -> Dict[str, Any]:
+        """Arma el resultado con el formato de `resultado_planificador`."""
+        procesos = self.config.procesos
+        total = len(procesos)
+        llegadas = np.array([p[1] for p in procesos], dtype=np.int64)
+        retorno = finalizacion - llegadas
+        tiempo_total = int(finalizacion.max())
+        return {
+            "metricas": {
+                "tiempo_total": tiempo_total,
+                "utilizacion_cpu": ocupado / (tiempo_total * self.cpus) * 100,
+                "tiempo_espera_promedio": int(espera.sum()) / total,
+                "tiempo_retorno_promedio": int(retorno.sum()) / total,
+                "total_procesos": total,
+                "procesos_finalizados": total,
+                "cpus": self.cpus,
+                "ventanas": ventanas,
+                "segundos": segundos,
+            },
+            "procesos": [{
+                "id": p[0],
+                "cpu": c,
+                "tiempo_comienzo": inicio,
+                "tiempo_finalizacion": final,
+                "tiempo_espera": espera_p,
+                "tiempo_respuesta": respuesta_p,
+                "tiempo_retorno": retorno_p,
+            } for p, c, inicio, final, espera_p, respuesta_p, retorno_p in zip(
+                procesos, cpu.tolist(), comienzo.tolist(), finalizacion.tolist(),
+                espera.tolist(), respuesta.tolist(), retorno.tolist())]
+        }
+
+def simular_multicpu(config: ConfiguracionSimulacion, cpus: int, ventana: int = MULTICPU_WINDOW,
+                     particiones: int = 1) -> Dict[str, Any]:
+    """
+    Simula una carga en un sistema de varias CPU (ver `SimulacionMultiCPU`).
+
+    Args:
+        config: Carga de trabajo, planificador y quantum de cada CPU
+        cpus: Cantidad de CPU simuladas
+        ventana: Ticks entre barreras
+        particiones: Procesos del SO entre los que se reparten las CPU
+
+    Returns:
+        Métricas y resultado por proceso
+    """
+    return SimulacionMultiCPU(config, cpus, ventana, particiones).ejecutar()
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulación con varias CPU en varios procesos")
+    parser.add_argument("archivo", help="Configuración JSON de la simulación")
+    parser.add_argument("--cpus", type=int, required=True)
+    parser.add_argument("--ventana", type=int, default=MULTICPU_WINDOW)
+    parser.add_argument("--particiones", type=int, default=1)
+    args = parser.parse_args()
+
+    with open(args.archivo, encoding="utf-8") as archivo:
+        config = ConfiguracionSimulacion.desde_dict(json.load(archivo))
+    resultado = simular_multicpu(config, args.cpus, args.ventana, args.particiones)
+    print(json.dumps(resultado["metricas"], indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Resumen multirresolución del historial para dibujar líneas de tiempo largas.
+
+Cada nivel de la pirámide divide el tiempo en cubetas del doble de tamaño que
+el nivel anterior y guarda, por proceso y cubeta, la fracción de tiempo que
+el proceso pasó en cada estado. Una vista alejada elige el nivel cuyas
+cubetas miden al menos un píxel, de modo que el costo de dibujo depende del
+ancho en pantalla y no del tiempo simulado.
+
+Cada fila guarda solo las cubetas entre el primer y el último cambio de
+estado de su proceso: antes no hay nada que dibujar y después el proceso
+sigue en su último estado (la 'cola'). La memoria es proporcional a la vida
+de los procesos, y si supera GANTT_PYRAMID_MAX_BYTES se descarta el nivel más
+fino (la cubeta base se duplica). Durante una simulación en curso la
+pirámide se extiende con `actualizar`, que solo recalcula las cubetas
+posteriores al último cambio visto de cada fila.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+import numpy as np
+from .historial import Transicion
+from ..config.settings import GANTT_PYRAMID_MAX_BYTES
+
+class _Nivel:
+    """Filas de un nivel empaquetadas en un solo arreglo (posición y capacidad por fila)."""
+
+    def __init__(self, estados: int):
+        self.datos = np.zeros((0, estados), dtype=np.float32)
+        self.posicion: List[int] = []
+        self.capacidad: List[int] = []
+        self.usado = 0
+
+    def agregar_fila(self) -> None:
+        """Agrega una fila vacía."""
+        self.posicion.append(0)
+        self.capacidad.append(0)
+
+    def ampliar(self, celdas: int) -> None:
+        """Asegura lugar para `celdas` cubetas más al final del arreglo."""
+        if self.usado + celdas > len(self.datos):
+            datos = np.zeros((max(self.usado + celdas, 2 * len(self.datos)), self.datos.shape[1]),
+                             dtype=np.float32)
+            datos[:self.usado] = self.datos[:self.usado]
+            self.datos = datos
+
+    def reservar(self, i: int, celdas: int) -> None:
+        """Da a la fila al menos `celdas` cubetas; si no caben, la mueve al final."""
+        if celdas <= self.capacidad[i]:
+            return
+        # Las filas vivas crecen al doble para no moverse en cada tick
+        nueva = max(celdas, 2 * self.capacidad[i])
+        self.ampliar(nueva)
+        anterior, capacidad = self.posicion[i], self.capacidad[i]
+        self.datos[self.usado:self.usado + capacidad] = self.datos[anterior:anterior + capacidad]
+        self.posicion[i], self.capacidad[i] = self.usado, nueva
+        self.usado += nueva
+
+    def fila(self, i: int) -> np.ndarray:
+        """Vista de las cubetas reservadas de una fila."""
+        return self.datos[self.posicion[i]:self.posicion[i] + self.capacidad[i]]
+
+class PiramideOcupacion:
+    """
+    Pirámide de ocupación por proceso y estado.
+
+        procesos: Claves de los procesos, en el orden de las filas
+        estados: Estados resumidos, en el orden de la última dimensión
+        cubeta_base: Ticks por cubeta en el nivel 0
+        tiempo_final: Tiempo hasta el que se resumió el historial
+        niveles: Filas de cada nivel empaquetadas, con fracciones 0..1;
+            usar `fila` para leerlas
+    """
+
+    ESTADOS = ('E', 'L', 'F')
+
+    def __init__(self, transiciones: Dict[str, List[Transicion]], tiempo_final: int,
+                 cubeta_base: int = 8, max_bytes: int = GANTT_PYRAMID_MAX_BYTES):
+        """
+        Args:
+            transiciones: Cambios de estado por proceso
+            tiempo_final: Tiempo final del historial
+            cubeta_base: Ticks por cubeta deseados en el nivel 0 (se duplican
+                mientras la estimación de memoria supere `max_bytes`)
+            max_bytes: Memoria máxima de la pirámide
+        """
+        self.estados = self.ESTADOS
+        self.max_bytes = max_bytes
+        self.cubeta_base = self._cubeta_para(transiciones, cubeta_base)
+        self._reiniciar(transiciones)
+        self.actualizar(transiciones, tiempo_final)
+
+    def _cubeta_para(self, transiciones: Dict[str, List[Transicion]], cubeta: int) -> int:
+        """Menor cubeta base (cubeta * 2^k) cuya pirámide estimada entra en la memoria."""
+        primeros = np.fromiter((c[0][0] for c in transiciones.values() if c), dtype=np.int64)
+        ultimos = np.fromiter((c[-1][0] for c in transiciones.values() if c), dtype=np.int64)
+        # Los niveles superiores suman a lo sumo lo mismo que el nivel 0
+        por_cubeta = 2 * len(self.estados) * np.dtype(np.float32).itemsize
+        while int((ultimos // cubeta - primeros // cubeta + 1).sum()) * por_cubeta > self.max_bytes:
+            cubeta *= 2
+        return cubeta
+
+    def _reiniciar(self, transiciones: Dict[str, List[Transicion]]) -> None:
+        """Vacía la pirámide para resumir otro historial."""
+        self._origen = transiciones
+        self.procesos: List[str] = []
+        self.tiempo_final = 0
+        self.niveles: List[_Nivel] = [_Nivel(len(self.estados))]
+        # Por fila: primera y última cubeta base guardadas, estado de la cola
+        # y (cantidad de cambios, último cambio) ya resumidos
+        self._inicio: List[int] = []
+        self._fin: List[int] = []
+        self._cola: List[int] = []
+        self._vistos: List[Tuple[int, Transicion]] = []
+
+    def actualizar(self, transiciones: Dict[str, List[Transicion]], tiempo_final: int) -> None:
+        """
+        Incorpora los cambios nuevos de un historial que solo crece.
+
+        Otro diccionario de transiciones (otra simulación) reinicia la pirámide.
+
+        Args:
+            transiciones: Cambios de estado por proceso
+            tiempo_final: Tiempo final del historial
+        """
+        if transiciones is not self._origen or len(transiciones) < len(self.procesos):
+            self._reiniciar(transiciones)
+        self.tiempo_final = tiempo_final
+        claves = list(transiciones)
+        nuevas = claves[len(self.procesos):]
+        for clave in nuevas:
+            self.procesos.append(clave)
+            self._inicio.append(-1)
+            self._fin.append(-1)
+            self._cola.append(-1)
+            self._vistos.append((0, (0, '')))
+            for nivel in self.niveles:
+                nivel.agregar_fila()
+        # Lugar para las filas nuevas de una sola vez
+        c = self.cubeta_base
+        self.niveles[0].ampliar(sum(transiciones[k][-1][0] // c - transiciones[k][0][0] // c + 1
+                                    for k in nuevas if transiciones[k]))
+        for i, clave in enumerate(claves):
+            cambios = transiciones[clave]
+            if cambios and (len(cambios), cambios[-1]) != self._vistos[i]:
+                self._recalcular(i, cambios)
+
+        # Niveles hasta que una sola cubeta cubra todas las filas
+        ultima = max(self._fin, default=0)
+        while ultima >> (len(self.niveles) - 1) > 0:
+            self._agregar_nivel()
+        while self.bytes > self.max_bytes and len(self.niveles) > 1:
+            self._descartar_nivel_base()
+
+    def _cubetas(self, cambios: List[Transicion], desde: int, hasta: int) -> np.ndarray:
+        """Fracciones de cada estado en las cubetas base desde..hasta (inclusive)."""
+        c = self.cubeta_base
+        a = max(0, bisect_right(cambios, (desde * c, '\uffff')) - 1)
+        tramo = cambios[a:]
+        tiempos = np.fromiter((t for t, _ in tramo), dtype=np.float64, count=len(tramo))
+        # La cola dura al menos hasta el final de la última cubeta
+        fines = np.append(tiempos[1:], (hasta + 1) * c)
+        bordes = np.arange(desde, hasta + 2, dtype=np.float64) * c
+        valores = np.zeros((hasta - desde + 1, len(self.estados)), dtype=np.float32)
+        codigos = [e for _, e in tramo]
+        for j, estado in enumerate(self.estados):
+            mascara = np.fromiter((e == estado for e in codigos), dtype=bool, count=len(codigos))
+            if mascara.any():
+                valores[:, j] = self._ocupacion(tiempos[mascara], fines[mascara], bordes)
+        return valores
+
+    def _recalcular(self, i: int, cambios: List[Transicion]) -> None:
+        """Recalcula una fila desde su último cambio ya resumido, en todos los niveles."""
+        c = self.cubeta_base
+        vistos, (ultimo_tiempo, _) = self._vistos[i]
+        if vistos == 0:
+            self._inicio[i] = cambios[0][0] // c
+            desde = self._inicio[i]
+        else:
+            # Solo el último cambio puede haberse reemplazado (mismo tick)
+            desde = max(self._inicio[i], min(ultimo_tiempo, cambios[-1][0]) // c)
+        hasta = max(self._fin[i], cambios[-1][0] // c)
+        self._fin[i] = cambios[-1][0] // c
+        self._cola[i] = self.estados.index(cambios[-1][1]) if cambios[-1][1] in self.estados else -1
+        self._vistos[i] = (len(cambios), cambios[-1])
+
+        self._escribir(0, i, desde, self._cubetas(cambios, desde, hasta))
+        for k in range(1, len(self.niveles)):
+            desde, hasta = desde >> 1, hasta >> 1
+            self._escribir(k, i, desde, self._promediar(k - 1, i, desde, hasta))
+
+    def _promediar(self, nivel: int, i: int, desde: int, hasta: int) -> np.ndarray:
+        """Cubetas desde..hasta del nivel siguiente, a partir de pares de este nivel."""
+        hijos = self.fila(nivel, i, 2 * desde, 2 * hasta + 2)
+        return (hijos[0::2] + hijos[1::2]) * np.float32(0.5)
+
+    def _escribir(self, nivel: int, i: int, desde: int, valores: np.ndarray) -> None:
+        """Guarda cubetas de una fila, agrandando su lugar si hace falta."""
+        relativo = desde - (self._inicio[i] >> nivel)
+        self.niveles[nivel].reservar(i, relativo + len(valores))
+        self.niveles[nivel].fila(i)[relativo:relativo + len(valores)] = valores
+
+    def _agregar_nivel(self) -> None:
+        """Agrega un nivel con cubetas del doble de tamaño que el último."""
+        k = len(self.niveles)
+        nivel = _Nivel(len(self.estados))
+        for _ in self.procesos:
+            nivel.agregar_fila()
+        nivel.ampliar(sum((fin >> k) - (inicio >> k) + 1
+                          for inicio, fin in zip(self._inicio, self._fin) if fin >= 0))
+        self.niveles.append(nivel)
+        for i in range(len(self.procesos)):
+            if self._fin[i] >= 0:
+                self._escribir(k, i, self._inicio[i] >> k,
+                               self._promediar(k - 1, i, self._inicio[i] >> k, self._fin[i] >> k))
+
+    def _descartar_nivel_base(self) -> None:
+        """Descarta el nivel más fino: el nivel 1 pasa a ser la base."""
+        self.niveles.pop(0)
+        self.cubeta_base *= 2
+        self._inicio = [inicio >> 1 for inicio in self._inicio]
+        self._fin = [fin >> 1 for fin in self._fin]
+
+    @property
+    def bytes(self) -> int:
+        """Memoria reservada por los niveles."""
+        return sum(nivel.datos.nbytes for nivel in self.niveles)
+
+    def fila(self, nivel: int, i: int, primera: int, ultima: int) -> np.ndarray:
+        """
+        Fracciones de una fila en un rango de cubetas.
+
+        Args:
+            nivel: Nivel de la pirámide
+            i: Fila (índice en `procesos`)
+            primera: Primera cubeta del rango
+            ultima: Cubeta siguiente a la última del rango
+
+        Returns:
+            Arreglo (ultima - primera, estados); ceros antes del primer cambio
+            y el estado de la cola después del último
+        """
+        salida = np.zeros((max(0, ultima - primera), len(self.estados)), dtype=np.float32)
+        if self._fin[i] < 0:
+            return salida
+        inicio, fin = self._inicio[i] >> nivel, self._fin[i] >> nivel
+        a, b = max(primera, inicio), min(ultima, fin + 1)
+        if a < b:
+            salida[a - primera:b - primera] = self.niveles[nivel].fila(i)[a - inicio:b - inicio]
+        if self._cola[i] >= 0 and ultima > fin + 1:
+            salida[max(fin + 1, primera) - primera:, self._cola[i]] = 1.0
+        return salida
+
+    @staticmethod
+    def _ocupacion(inicios: np.ndarray, fines: np.ndarray, bordes: np.ndarray) -> np.ndarray:
+        """
+        Fracción de cada cubeta cubierta por intervalos disjuntos y ordenados.
+
+        Usa la función acumulada de ocupación, lineal a trozos, evaluada en
+        los bordes de las cubetas.
+        """
+        puntos = np.empty(inicios.size * 2)
+        puntos[0::2] = inicios
+        puntos[1::2] = fines
+        acumulado = np.zeros(puntos.size)
+        acumulado[1::2] = np.cumsum(fines - inicios)
+        acumulado[2::2] = acumulado[1:-1:2]
+        valores = np.interp(bordes, puntos, acumulado, left=0.0, right=acumulado[-1])
+        return np.diff(valores) / (bordes[1] - bordes[0])
+
+    def nivel_para(self, ticks_por_pixel: float) -> Tuple[int, int]:
+        """
+        Elige el nivel más detallado cuyas cubetas miden al menos un píxel.
+
+        Args:
+            ticks_por_pixel: Escala actual de la vista
+
+        Returns:
+            (índice del nivel, ticks por cubeta)
+        """
+        nivel = 0
+        tamano = self.cubeta_base
+        while tamano < ticks_por_pixel and nivel + 1 < len(self.niveles):
+            nivel += 1
+            tamano *= 2
+        return nivel, tamano
@@ -62,8 +62,15 @@ class FabricaProcesos:
     
     _next_id = 1
     
-    def __init__(self):
-        """Inicializa la fábrica de procesos."""
+    def __init__(self, aleatorio: Optional[random.Random] = None):
+        """
+        Inicializa la fábrica de procesos.
+
+        Args:
+            aleatorio: Generador a usar (por defecto, el global del módulo random);
+                uno propio con semilla hace reproducible la carga
+        """
+        self.aleatorio = aleatorio or random
         self.min_llegada = 0
         self.max_llegada = 10
         self.min_duracion = 2
@@ -79,8 +86,8 @@ class FabricaProcesos:
         id_proceso = FabricaProcesos._next_id
         FabricaProcesos._next_id += 1
         
-        tiempo_llegada = random.randint(self.min_llegada, self.max_llegada)
-        tiempo_ejecucion = random.randint(self.min_duracion, self.max_duracion)
+        tiempo_llegada = self.aleatorio.randint(self.min_llegada, self.max_llegada)
+        tiempo_ejecucion = self.aleatorio.randint(self.min_duracion, self.max_duracion)
         
         return Proceso(
             id=id_proceso,
@@ -108,7 +115,8 @@ class FabricaProcesos:
     @staticmethod
     def crear_procesos_aleatorios(num_procesos: int, 
                                  max_ejecucion: int = 10, 
-                                 max_llegada: int = 20) -> list[Proceso]:
+                                 max_llegada: int = 20,
+                                 aleatorio: Optional[random.Random] = None) -> list[Proceso]:
         """
         Crea un conjunto de procesos con tiempos aleatorios.
         
@@ -116,14 +124,16 @@ class FabricaProcesos:
             num_procesos: Número de procesos a crear
             max_ejecucion: Tiempo máximo de ejecución
             max_llegada: Tiempo máximo de llegada
+            aleatorio: Generador a usar (por defecto, el global del módulo random)
             
         Returns:
             Lista de procesos creados
         """
+        aleatorio = aleatorio or random
         procesos = []
         for i in range(num_procesos):
-            tiempo_llegada = random.randint(0, max_llegada)
-            tiempo_ejecucion = random.randint(1, max_ejecucion)
+            tiempo_llegada = aleatorio.randint(0, max_llegada)
+            tiempo_ejecucion = aleatorio.randint(1, max_ejecucion)
             proceso = FabricaProcesos.crear_proceso(i + 1, tiempo_llegada, tiempo_ejecucion)
             procesos.append(proceso)
         return procesos 
\ No newline at end of file
@@ -0,0 +1,368 @@
+"""
+Planificadores de participación proporcional: stride y lotería.
+
+Cada proceso recibe boletos según su prioridad y obtiene una fracción de la
+CPU proporcional a ellos. Ambos planificadores evitan recorrer la lista de
+procesos en cada tick:
+
+    - Las llegadas salen de un montículo ordenado por tick de entrada.
+    - La espera se acumula de forma diferida: se guarda desde cuándo está
+      listo cada proceso y se suma al despacharlo, también con observadores
+      (el `tiempo_espera` de un proceso listo es el de su último despacho).
+    - La cuota de CPU de cada proceso se calcula solo para el resultado
+      (`datos_proceso`), no en cada notificación.
+    - Stride elige el proceso con menor pase en un montículo, O(log n).
+    - Lotería sortea un boleto con un árbol de Fenwick sobre los boletos de
+      los procesos listos; cada sorteo y cada cambio de boletos es O(log n).
+
+La expulsión por quantum sigue la misma regla global que
+`PlanificadorRoundRobin`: el proceso deja la CPU al final del tick t si
+(t + 1) % quantum == 0.
+"""
+
+import heapq
+import random
+from abc import abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+from .process import Proceso, EstadoProceso
+from .scheduler import PlanificadorBase
+from .historial import NivelHistorial
+from ..config.settings import STRIDE_BASE
+
+def boletos_proceso(proceso: Proceso) -> int:
+    """
+    Boletos de un proceso: su prioridad, o 1 si no tiene o no es positiva.
+
+    Args:
+        proceso: Proceso a consultar
+
+    Returns:
+        Cantidad de boletos (al menos 1)
+    """
+    if proceso.prioridad is None or proceso.prioridad < 1:
+        return 1
+    return proceso.prioridad
+
+class PlanificadorProporcional(PlanificadorBase):
+    """
+    Base de los planificadores proporcionales.
+
+    Las subclases solo definen cómo se encola y se elige un proceso listo.
+    """
+
+    def __init__(self, quantum: int, nivel_historial: Optional[NivelHistorial] = None):
+        super().__init__(nivel_historial)
+        self.quantum = quantum
+        # (tick de entrada, orden, proceso) de los procesos que aún no llegan
+        self._pendientes: List[Tuple[int, int, Proceso]] = []
+        self._pendiente: set = set()
+        self._orden = 0
+        # Procesos listos y tick desde el que esperan, por id()
+        self._listos: Dict[int, Tuple[Proceso, int]] = {}
+        # Procesos cuyo estado cambió y aún no se registró en las transiciones
+        self._por_registrar: List[Proceso] = []
+
+    def agregar_proceso(self, proceso: Proceso) -> None:
+        """Agrega un proceso al planificador."""
+        super().agregar_proceso(proceso)
+        entrada = max(proceso.tiempo_llegada, self.tiempo_actual)
+        heapq.heappush(self._pendientes, (entrada, self._orden, proceso))
+        self._orden += 1
+        self._pendiente.add(id(proceso))
+        self._por_registrar.append(proceso)
+
+    def _retirar_de_cola(self, proceso: Proceso) -> None:
+        """Invalida el proceso en las estructuras del planificador."""
+        self._pendiente.discard(id(proceso))
+        self._listos.pop(id(proceso), None)
+        self._por_registrar = [p for p in self._por_registrar if p is not proceso]
+
+    def _bifurcar_estado(self, rama: "PlanificadorBase", copias: Dict[int, Proceso]) -> None:
+        """Copia las llegadas pendientes y los procesos listos con los de la rama."""
+        rama._pendientes = list(self._pendientes)
+        rama._pendiente = set(self._pendiente)
+        rama._listos = {}
+        for proceso, desde in self._listos.values():
+            copia = copias[id(proceso)]
+            rama._listos[id(copia)] = (copia, desde)
+        rama._por_registrar = [copias.get(id(p), p) for p in self._por_registrar]
+
+    def longitud_cola(self) -> int:
+        """Cantidad de procesos listos esperando la CPU."""
+        return len(self._listos)
+
+    def _buscar_indice(self, proceso: Proceso) -> int:
+        """Posición del proceso (por identidad) en la lista de procesos."""
+        for i, candidato in enumerate(self.procesos):
+            if candidato is proceso:
+                return i
+        raise ValueError(f"No existe el proceso P{proceso.id}")
+
+    @abstractmethod
+    def _encolar(self, proceso: Proceso) -> None:
+        """Agrega un proceso listo a la estructura de selección."""
+        pass
+
+    @abstractmethod
+    def _elegir(self) -> Optional[Proceso]:
+        """Quita y devuelve el próximo proceso a ejecutar (None si no hay)."""
+        pass
+
+    def _consumir(self, proceso: Proceso, ticks: int) -> None:
+        """Contabiliza los ticks de CPU usados por el proceso en ejecución."""
+        pass
+
+    def _poner_listo(self, proceso: Proceso, desde: int) -> None:
+        """Marca un proceso como listo desde el tick indicado y lo encola."""
+        proceso.estado = EstadoProceso.LISTO
+        self._listos[id(proceso)] = (proceso, desde)
+        self._encolar(proceso)
+
+    def tick(self) -> bool:
+        """
+        Ejecuta un tick de la simulación proporcional.
+
+        Es True si la simulación debe continuar, False si ha terminado
+        """
+        t = self.tiempo_actual
+        nivel = self.nivel_historial
+        if self._por_registrar:
+            if nivel == NivelHistorial.TRANSICIONES:
+                for proceso in self._por_registrar:
+                    self.registrar_estado_proceso(proceso)
+            self._por_registrar = []
+
+        # Llegadas
+        while self._pendientes and self._pendientes[0][0] <= t:
+            proceso = heapq.heappop(self._pendientes)[2]
+            if id(proceso) not in self._pendiente:
+                continue
+            self._pendiente.discard(id(proceso))
+            if self._compartidos and id(proceso) in self._compartidos:
+                proceso = self._materializar(self._buscar_indice(proceso))
+            if proceso.tiempo_respuesta is None:
+                proceso.tiempo_respuesta = t - proceso.tiempo_llegada
+            self._poner_listo(proceso, t)
+            if nivel == NivelHistorial.TRANSICIONES:
+                self.registrar_estado_proceso(proceso)
+
+        # Despacho
+        if self.proceso_actual is None:
+            proceso = self._elegir()
+            if proceso is not None:
+                _, desde = self._listos.pop(id(proceso))
+                proceso.tiempo_espera += t - desde + 1
+                proceso.estado = EstadoProceso.EJECUTANDO
+                if proceso.tiempo_comienzo is None:
+                    proceso.tiempo_comienzo = t
+                self.proceso_actual = proceso
+                if nivel == NivelHistorial.TRANSICIONES:
+                    self.registrar_estado_proceso(proceso)
+
+        if nivel == NivelHistorial.COMPLETO:
+            for proceso in self.procesos:
+                self.registrar_estado_proceso(proceso)
+
+        actual = self.proceso_actual
+        if actual is not None:
+            actual.tiempo_restante -= 1
+            self.tiempo_cpu_ocupada += 1
+            self._consumir(actual, 1)
+            if actual.tiempo_restante == 0:
+                actual.estado = EstadoProceso.FINALIZADO
+                actual.tiempo_finalizacion = t + 1
+                self.procesos_finalizados.append(actual)
+                self.proceso_actual = None
+                self._por_registrar.append(actual)
+            elif (t + 1) % self.quantum == 0:
+                self.proceso_actual = None
+                self._poner_listo(actual, t + 1)
+                self._por_registrar.append(actual)
+
+        self.tiempo_actual += 1
+        self.notificar_observadores()
+        return len(self.procesos_finalizados) < len(self.procesos)
+
+    def datos_proceso(self, proceso: Proceso) -> Dict[str, Any]:
+        """
+        Cuota de CPU del proceso para su entrada en el resultado.
+
+        Returns:
+            'cuota_cpu': fracción del tiempo de CPU ocupada que recibió
+        """
+        ocupada = self.tiempo_cpu_ocupada or 1
+        return {"cuota_cpu": (proceso.tiempo_ejecucion - proceso.tiempo_restante) / ocupada}
+
+class PlanificadorStride(PlanificadorProporcional):
+    """
+    Planificación stride: ejecuta siempre el proceso listo con menor pase.
+
+    Cada tick de CPU suma al pase del proceso su paso, STRIDE_BASE // boletos,
+    de modo que los procesos con más boletos avanzan más despacio y reciben
+    más CPU. Un proceso que llega empieza con el pase del último despachado.
+    """
+
+    def __init__(self, quantum: int, nivel_historial: Optional[NivelHistorial] = None):
+        super().__init__(quantum, nivel_historial)
+        # (pase, secuencia, proceso); las entradas de procesos retirados se descartan al salir
+        self._monticulo: List[Tuple[int, int, Proceso]] = []
+        self._pases: Dict[int, int] = {}
+        self._secuencia = 0
+        self._pase_global = 0
+
+    def _bifurcar_estado(self, rama: "PlanificadorBase", copias: Dict[int, Proceso]) -> None:
+        """Copia además el montículo de pases con los procesos de la rama."""
+        super()._bifurcar_estado(rama, copias)
+        rama._monticulo = [(pase, s, copias.get(id(p), p)) for pase, s, p in self._monticulo]
+        rama._pases = {}
+        for proceso in self.procesos:
+            if id(proceso) in self._pases:
+                rama._pases[id(copias.get(id(proceso), proceso))] = self._pases[id(proceso)]
+
+    def _retirar_de_cola(self, proceso: Proceso) -> None:
+        """Olvida el pase del proceso retirado."""
+        super()._retirar_de_cola(proceso)
+        self._pases.pop(id(proceso), None)
+
+    def _encolar(self, proceso: Proceso) -> None:
+        """Agrega el proceso al montículo con su pase actual."""
+        pase = self._pases.setdefault(id(proceso), self._pase_global)
+        heapq.heappush(self._monticulo, (pase, self._secuencia, proceso))
+        self._secuencia += 1
+
+    def _elegir(self) -> Optional[Proceso]:
+        """Quita del montículo el proceso listo con menor pase."""
+        while self._monticulo:
+            pase, _, proceso = heapq.heappop(self._monticulo)
+            if id(proceso) in self._listos:
+                self._pase_global = pase
+                return proceso
+        return None
+
+    def _consumir(self, proceso: Proceso, ticks: int) -> None:
+        """Avanza el pase del proceso según sus boletos."""
+        clave = id(proceso)
+        self._pases[clave] += ticks * (STRIDE_BASE // boletos_proceso(proceso))
+        if proceso.tiempo_restante == 0:
+            del self._pases[clave]
+
+class _ArbolFenwick:
+    """Árbol de Fenwick de sumas de prefijos sobre pesos enteros."""
+
+    def __init__(self, capacidad: int = 16):
+        self.arbol = [0] * (capacidad + 1)
+        self.pesos = [0] * capacidad
+        self.total = 0
+
+    def copiar(self) -> "_ArbolFenwick":
+        """Copia independiente del árbol."""
+        copia = _ArbolFenwick.__new__(_ArbolFenwick)
+        copia.arbol = list(self.arbol)
+        copia.pesos = list(self.pesos)
+        copia.total = self.total
+        return copia
+
+    def _ampliar(self, capacidad: int) -> None:
+        """Duplica la capacidad hasta cubrir la indicada y reconstruye en O(n)."""
+        nueva = len(self.pesos)
+        while nueva < capacidad:
+            nueva *= 2
+        self.pesos += [0] * (nueva - len(self.pesos))
+        arbol = [0] + self.pesos
+        for i in range(1, nueva + 1):
+            padre = i + (i & -i)
+            if padre <= nueva:
+                arbol[padre] += arbol[i]
+        self.arbol = arbol
+
+    def asignar(self, indice: int, peso: int) -> None:
+        """Cambia el peso de una posición en O(log n)."""
+        if indice >= len(self.pesos):
+            self._ampliar(indice + 1)
+        delta = peso - self.pesos[indice]
+        if not delta:
+            return
+        self.pesos[indice] = peso
+        self.total += delta
+        i = indice + 1
+        n = len(self.arbol) - 1
+        while i <= n:
+            self.arbol[i] += delta
+            i += i & -i
+
+    def buscar(self, valor: int) -> int:
+        """
+        Posición cuyo intervalo acumulado contiene el valor, en O(log n).
+
+        Args:
+            valor: Entero en [0, total)
+
+        Returns:
+            Menor índice i con suma(pesos[0..i]) > valor
+        """
+        posicion = 0
+        n = len(self.arbol) - 1
+        paso = 1 << (n.bit_length() - 1)
+        while paso:
+            siguiente = posicion + paso
+            if siguiente <= n and self.arbol[siguiente] <= valor:
+                posicion = siguiente
+                valor -= self.arbol[siguiente]
+            paso >>= 1
+        return posicion
+
+class PlanificadorLoteria(PlanificadorProporcional):
+    """
+    Planificación por lotería: en cada despacho sortea un boleto entre los
+    procesos listos; cada proceso gana con probabilidad proporcional a sus
+    boletos.
+    """
+
+    def __init__(self, quantum: int, nivel_historial: Optional[NivelHistorial] = None,
+                 semilla: Optional[int] = None):
+        """
+        Args:
+            quantum: Quantum del planificador
+            nivel_historial: Historial a registrar
+            semilla: Semilla del sorteo (None: no reproducible)
+        """
+        super().__init__(quantum, nivel_historial)
+        self._aleatorio = random.Random(semilla)
+        self._arbol = _ArbolFenwick()
+        # Posición de cada proceso en el árbol, asignada en su primera llegada
+        self._ranuras: List[Optional[Proceso]] = []
+        self._ranura: Dict[int, int] = {}
+
+    def _bifurcar_estado(self, rama: "PlanificadorBase", copias: Dict[int, Proceso]) -> None:
+        """Copia además el árbol de boletos y el estado del sorteo."""
+        super()._bifurcar_estado(rama, copias)
+        rama._aleatorio = random.Random()
+        rama._aleatorio.setstate(self._aleatorio.getstate())
+        rama._arbol = self._arbol.copiar()
+        rama._ranuras = [copias.get(id(p), p) if p is not None else None
+                         for p in self._ranuras]
+        rama._ranura = {id(p): i for i, p in enumerate(rama._ranuras) if p is not None}
+
+    def _retirar_de_cola(self, proceso: Proceso) -> None:
+        """Retira los boletos del proceso y libera su posición."""
+        super()._retirar_de_cola(proceso)
+        indice = self._ranura.pop(id(proceso), None)
+        if indice is not None:
+            self._arbol.asignar(indice, 0)
+            self._ranuras[indice] = None
+
+    def _encolar(self, proceso: Proceso) -> None:
+        """Pone en juego los boletos del proceso."""
+        indice = self._ranura.get(id(proceso))
+        if indice is None:
+            indice = self._ranura[id(proceso)] = len(self._ranuras)
+            self._ranuras.append(proceso)
+        self._arbol.asignar(indice, boletos_proceso(proceso))
+
+    def _elegir(self) -> Optional[Proceso]:
+        """Sortea el próximo proceso y retira sus boletos mientras ejecuta."""
+        if self._arbol.total == 0:
+            return None
+        indice = self._arbol.buscar(self._aleatorio.randrange(self._arbol.total))
+        self._arbol.asignar(indice, 0)
+        return self._ranuras[indice]
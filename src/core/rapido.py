@@ -0,0 +1,191 @@
+"""
+Resolución rápida de Round Robin cuando solo interesan los resultados finales.
+
+Reproduce exactamente la semántica de `PlanificadorRoundRobin.tick()`:
+
+    - Un proceso entra a la cola en el tick max(llegada, 0), en el orden de la
+      lista de procesos.
+    - Los límites del quantum son globales: una ráfaga que empieza en t
+      termina en min(t + restante, (t // q + 1) * q).
+    - Un proceso expulsado al final del tick e - 1 se encola antes que los
+      que llegan en el tick e.
+    - La espera cuenta cada tick en cola, incluido el tick en que el proceso
+      vuelve a la CPU, por lo que
+      espera = finalizacion - entrada - ejecucion + despachos.
+
+Hay dos caminos:
+
+    - Forma cerrada, O(N log N): todos los procesos entran en el mismo tick
+      t0 múltiplo del quantum y todas las ejecuciones son múltiplos del
+      quantum. Cada ronda da un quantum completo a cada proceso vivo, así que
+      el proceso i con r_i = ejecucion_i / q termina en
+      t0 + q * (sum_j min(r_j, r_i - 1) + #{j < i : r_j >= r_i} + 1).
+    - Motor de eventos: avanza ráfaga a ráfaga (no tick a tick) para
+      cualquier otra carga.
+"""
+
+from collections import deque
+from typing import Any, Dict, Sequence
+import numpy as np
+
+def aplica_forma_cerrada(llegadas: np.ndarray, ejecuciones: np.ndarray, quantum: int) -> bool:
+    """
+    Indica si la carga cumple las condiciones de la forma cerrada.
+
+    Args:
+        llegadas: Tiempo de llegada de cada proceso
+        ejecuciones: Tiempo de ejecución de cada proceso
+        quantum: Quantum del planificador
+
+    Returns:
+        True si todos entran juntos en un límite de quantum y las ejecuciones
+        son múltiplos del quantum
+    """
+    if llegadas.size == 0:
+        return False
+    entradas = np.maximum(llegadas, 0)
+    t0 = int(entradas[0])
+    return (t0 % quantum == 0 and bool(np.all(entradas == t0)) and
+            (quantum == 1 or not np.any(ejecuciones % quantum)))
+
+def _dominancia_previa(rondas: np.ndarray, valores: np.ndarray) -> np.ndarray:
+    """
+    Cuenta, para cada i, los j < i con rondas[j] >= rondas[i].
+
+    Con pocos valores distintos (lo habitual: ráfagas acotadas) basta una suma
+    acumulada por valor. En otro caso recorre los bits del índice de mayor a menor: j < i si y solo si, en el
+    bit más alto en que difieren, j tiene 0 e i tiene 1. En cada nivel los
+    elementos están agrupados por prefijo del índice y, dentro del grupo,
+    ordenados por rondas descendentes (empates por índice), de modo que el
+    conteo de cada nivel es una suma acumulada. Cada nivel separa los grupos
+    en dos de forma estable en O(N), para un total de O(N log N).
+    """
+    n = rondas.size
+    conteo = np.zeros(n, dtype=np.int64)
+    if n < 2:
+        return conteo
+    if valores.size <= int(n).bit_length():
+        vivos = np.zeros(n, dtype=bool)
+        for valor in valores[::-1]:
+            iguales = rondas == valor
+            vivos |= iguales
+            acumulado = np.cumsum(vivos)
+            conteo[iguales] = acumulado[iguales] - 1
+        return conteo
+    orden = np.argsort(-rondas, kind="stable")
+    posiciones = np.arange(n, dtype=np.int64)
+    for k in range(int(n - 1).bit_length() - 1, -1, -1):
+        # Grupo actual: índices con el mismo valor de i >> (k + 1)
+        inicio = (orden >> (k + 1)) << (k + 1)
+        bit = (orden >> k) & 1
+        ceros = np.empty(n + 1, dtype=np.int64)
+        ceros[0] = 0
+        np.cumsum(bit == 0, out=ceros[1:])
+        ceros_antes = ceros[:-1] - ceros[inicio]
+        conteo[orden] += ceros_antes * bit
+        # Separación estable del grupo por el bit k
+        izquierda = np.minimum(1 << k, n - inicio)
+        nueva = np.where(bit == 0, inicio + ceros_antes,
+                         inicio + izquierda + (posiciones - inicio - ceros_antes))
+        siguiente = np.empty_like(orden)
+        siguiente[nueva] = orden
+        orden = siguiente
+    return conteo
+
+def _forma_cerrada(entradas: np.ndarray, ejecuciones: np.ndarray,
+                   quantum: int) -> Dict[str, np.ndarray]:
+    """Resultados de un lote que entra junto en un límite de quantum."""
+    t0 = int(entradas[0])
+    rondas = ejecuciones // quantum
+    ordenadas = np.sort(rondas)
+    acumuladas = np.concatenate(([0], np.cumsum(ordenadas)))
+    # sum_j min(r_j, r_i - 1)
+    limite = rondas - 1
+    menores = np.searchsorted(ordenadas, limite, side="right")
+    previas = acumuladas[menores] + limite * (rondas.size - menores)
+    valores = ordenadas[np.concatenate(([True], ordenadas[1:] != ordenadas[:-1]))]
+    servidos = previas + _dominancia_previa(rondas, valores) + 1
+    finalizacion = t0 + quantum * servidos
+    return {
+        "comienzo": t0 + quantum * np.arange(rondas.size, dtype=np.int64),
+        "finalizacion": finalizacion,
+        "despachos": rondas,
+    }
+
+def _motor_eventos(entradas: Sequence[int], ejecuciones: Sequence[int],
+                   quantum: int, rafagas: bool = False) -> Dict[str, Any]:
+    """Simula ráfaga a ráfaga una carga cualquiera."""
+    n = len(entradas)
+    orden = sorted(range(n), key=entradas.__getitem__)
+    restante = list(ejecuciones)
+    comienzo = [-1] * n
+    finalizacion = [0] * n
+    despachos = [0] * n
+    cola: deque = deque()
+    registro = [] if rafagas else None
+    t = 0
+    k = 0
+    pendientes = n
+    while pendientes:
+        while k < n and entradas[orden[k]] <= t:
+            cola.append(orden[k])
+            k += 1
+        if not cola:
+            t = entradas[orden[k]]
+            continue
+        i = cola.popleft()
+        despachos[i] += 1
+        if comienzo[i] < 0:
+            comienzo[i] = t
+        fin = min(t + restante[i], (t // quantum + 1) * quantum)
+        restante[i] -= fin - t
+        if registro is not None:
+            registro.append((t, fin, i))
+        # Los que llegan durante la ráfaga se encolan antes que el expulsado
+        while k < n and entradas[orden[k]] < fin:
+            cola.append(orden[k])
+            k += 1
+        if restante[i] == 0:
+            finalizacion[i] = fin
+            pendientes -= 1
+        else:
+            cola.append(i)
+        t = fin
+    resultado: Dict[str, Any] = {
+        "comienzo": np.array(comienzo, dtype=np.int64),
+        "finalizacion": np.array(finalizacion, dtype=np.int64),
+        "despachos": np.array(despachos, dtype=np.int64),
+    }
+    if registro is not None:
+        resultado["rafagas"] = registro
+    return resultado
+
+def resolver_round_robin(llegadas: Sequence[int], ejecuciones: Sequence[int],
+                         quantum: int, rafagas: bool = False) -> Dict[str, Any]:
+    """
+    Calcula los tiempos finales de cada proceso sin simular tick a tick.
+
+    Args:
+        llegadas: Tiempo de llegada de cada proceso, en el orden de la lista
+        ejecuciones: Tiempo de ejecución (positivo) de cada proceso
+        quantum: Quantum del planificador
+        rafagas: Si es True, usa siempre el motor de eventos y devuelve
+            además 'rafagas': lista de (inicio, fin, índice del proceso)
+
+    Returns:
+        Arreglos por proceso: 'comienzo', 'finalizacion', 'espera',
+        'respuesta' y 'despachos'
+    """
+    llegadas = np.asarray(llegadas, dtype=np.int64)
+    ejecuciones = np.asarray(ejecuciones, dtype=np.int64)
+    entradas = np.maximum(llegadas, 0)
+    if rafagas:
+        resultado = _motor_eventos(entradas.tolist(), ejecuciones.tolist(), quantum, True)
+    elif aplica_forma_cerrada(llegadas, ejecuciones, quantum):
+        resultado = _forma_cerrada(entradas, ejecuciones, quantum)
+    else:
+        resultado = _motor_eventos(entradas.tolist(), ejecuciones.tolist(), quantum)
+    resultado["espera"] = (resultado["finalizacion"] - entradas - ejecuciones
+                           + resultado["despachos"])
+    resultado["respuesta"] = entradas - llegadas
+    return resultado
@@ -1,10 +1,20 @@
 # Módulo que implementa el planificador de procesos. (Strategy & Observer)
 
+import copy
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
-from collections import deque
+from collections import deque, ChainMap
 from PyQt6.QtCore import QObject, QMetaObject
 from .process import Proceso, EstadoProceso, FabricaProcesos
+from .historial import NivelHistorial, Transicion, nivel_requerido
+
+# Código de cada estado en el historial
+CODIGOS_ESTADO = {
+    EstadoProceso.NUEVO: '',
+    EstadoProceso.EJECUTANDO: 'E',
+    EstadoProceso.LISTO: 'L',
+    EstadoProceso.FINALIZADO: 'F',
+}
 
 class ABCQObjectMeta(type(QObject), type(ABC)):
     """Metaclase que combina QObject y ABC."""
@@ -13,6 +23,9 @@ class ABCQObjectMeta(type(QObject), type(ABC)):
 class ObservadorSimulacion(QObject, ABC, metaclass=ABCQObjectMeta):
     """Interfaz para los observadores de la simulación."""
     
+    # Historial que el observador necesita que registre el planificador
+    NIVEL_HISTORIAL_REQUERIDO = NivelHistorial.NINGUNO
+    
     @abstractmethod
     def actualizar(self, datos: Dict[str, Any]) -> None:
         """
@@ -25,7 +38,12 @@ class ObservadorSimulacion(QObject, ABC, metaclass=ABCQObjectMeta):
 class PlanificadorBase(ABC):
     """Clase base abstracta para planificadores de procesos."""
     
-    def __init__(self):
+    def __init__(self, nivel_historial: Optional[NivelHistorial] = None):
+        """
+        Args:
+            nivel_historial: Historial a registrar. Si se omite, se usa el
+                mayor nivel requerido por los observadores (ninguno si no hay)
+        """
         self.procesos: List[Proceso] = []
         self.proceso_actual: Optional[Proceso] = None
         self.tiempo_actual = 0
@@ -33,45 +51,186 @@ class PlanificadorBase(ABC):
         self.procesos_finalizados: List[Proceso] = []
         self.observadores: List[ObservadorSimulacion] = []
         self.historial_estados: Dict[int, Dict[str, str]] = {}
+        self.transiciones: Dict[str, List[Transicion]] = {}
+        self.nivel_historial = (NivelHistorial.NINGUNO if nivel_historial is None
+                                else nivel_historial)
+        # Procesos y transiciones compartidos con otras ramas (copy-on-write)
+        self._compartidos: Dict[int, Proceso] = {}
+        self._transiciones_compartidas: set = set()
+        # Sumas de los procesos finalizados ya contados en las métricas
+        self._finalizados_contados = 0
+        self._suma_espera = 0
+        self._suma_retorno = 0
     
     def agregar_proceso(self, proceso: Proceso) -> None:
         """Agrega un proceso al planificador."""
         self.procesos.append(proceso)
     
+    def retirar_proceso(self, id_proceso: int) -> Proceso:
+        """
+        Retira un proceso que aún no ha finalizado.
+        
+        Args:
+            id_proceso: Identificador del proceso
+            
+        Returns:
+            El proceso retirado
+            
+        Raises:
+            ValueError: Si el proceso no existe o ya finalizó
+        """
+        for i, proceso in enumerate(self.procesos):
+            if proceso.id == id_proceso:
+                break
+        else:
+            raise ValueError(f"No existe el proceso P{id_proceso}")
+        if proceso.estado == EstadoProceso.FINALIZADO:
+            raise ValueError(f"El proceso P{id_proceso} ya finalizó")
+        
+        del self.procesos[i]
+        self._compartidos.pop(id(proceso), None)
+        if proceso is self.proceso_actual:
+            self.proceso_actual = None
+        self._retirar_de_cola(proceso)
+        return proceso
+    
+    def _retirar_de_cola(self, proceso: Proceso) -> None:
+        """Quita un proceso de las estructuras propias del algoritmo."""
+        pass
+    
+    def longitud_cola(self) -> int:
+        """Cantidad de procesos listos esperando la CPU."""
+        return sum(1 for p in self.procesos if p.estado == EstadoProceso.LISTO)
+    
+    def bifurcar(self) -> "PlanificadorBase":
+        """
+        Crea una rama independiente de la simulación en el instante actual.
+        
+        La rama continúa desde el mismo estado, sin observadores, y puede
+        modificarse (quantum, procesos agregados o retirados) sin afectar al
+        original. Los procesos finalizados y los que aún no llegan se
+        comparten entre ambas ramas y solo se copian cuando una de ellas los
+        modifica; el historial anterior a la bifurcación también se comparte.
+        
+        Returns:
+            Un planificador del mismo tipo con el estado actual
+        """
+        rama = copy.copy(self)
+        
+        # Los procesos listos o en ejecución cambian en cada tick: se copian ya
+        copias: Dict[int, Proceso] = {}
+        for proceso in self.procesos:
+            if proceso.estado in (EstadoProceso.LISTO, EstadoProceso.EJECUTANDO):
+                copias[id(proceso)] = copy.copy(proceso)
+            elif proceso.estado == EstadoProceso.NUEVO:
+                self._compartidos[id(proceso)] = proceso
+        
+        rama.procesos = [copias.get(id(p), p) for p in self.procesos]
+        rama.procesos_finalizados = list(self.procesos_finalizados)
+        if self.proceso_actual is not None:
+            rama.proceso_actual = copias[id(self.proceso_actual)]
+        rama.observadores = []
+        rama._compartidos = dict(self._compartidos)
+        
+        # El historial previo queda congelado y compartido por ambas ramas
+        capas = (self.historial_estados.maps
+                 if isinstance(self.historial_estados, ChainMap)
+                 else [self.historial_estados])
+        self.historial_estados = ChainMap({}, *capas)
+        rama.historial_estados = ChainMap({}, *capas)
+        
+        # Las listas de transiciones se copian al primer cambio de cada rama
+        compartidas = set(self.transiciones)
+        self._transiciones_compartidas = compartidas
+        rama._transiciones_compartidas = set(compartidas)
+        rama.transiciones = dict(self.transiciones)
+        
+        self._bifurcar_estado(rama, copias)
+        return rama
+    
+    def _bifurcar_estado(self, rama: "PlanificadorBase", copias: Dict[int, Proceso]) -> None:
+        """
+        Copia en la rama las estructuras propias del algoritmo.
+        
+        Args:
+            rama: Planificador recién bifurcado
+            copias: Procesos copiados, indexados por id() del original
+        """
+        pass
+    
+    def _materializar(self, indice: int) -> Proceso:
+        """
+        Reemplaza un proceso compartido por una copia propia antes de modificarlo.
+        
+        Args:
+            indice: Posición del proceso en la lista de procesos
+            
+        Returns:
+            La copia propia del proceso
+        """
+        proceso = self._compartidos.pop(id(self.procesos[indice]))
+        copia = copy.copy(proceso)
+        self.procesos[indice] = copia
+        return copia
+    
     def agregar_observador(self, observador: ObservadorSimulacion) -> None:
         """Agrega un observador al planificador."""
         self.observadores.append(observador)
+        self.nivel_historial = max(self.nivel_historial, nivel_requerido(observador))
     
     def registrar_estado_proceso(self, proceso: Proceso) -> None:
         """
         Registra el estado de un proceso en el historial.
         
+        Según el nivel de historial se guardan solo las transiciones o
+        también la matriz completa tiempo x proceso.
+        
         Args:
             proceso: Proceso cuyo estado se va a registrar
         """
-        if self.tiempo_actual not in self.historial_estados:
-            self.historial_estados[self.tiempo_actual] = {}
+        if self.nivel_historial == NivelHistorial.NINGUNO:
+            return
         
-        estado = ''
-        if proceso.estado == EstadoProceso.EJECUTANDO:
-            estado = 'E'
-        elif proceso.estado == EstadoProceso.LISTO:
-            estado = 'L'
-        elif proceso.estado == EstadoProceso.FINALIZADO:
-            estado = 'F'
-            
-        self.historial_estados[self.tiempo_actual][f"P{proceso.id}"] = estado
+        estado = CODIGOS_ESTADO[proceso.estado]
+        clave = f"P{proceso.id}"
+        if self.nivel_historial == NivelHistorial.COMPLETO:
+            if self.tiempo_actual not in self.historial_estados:
+                self.historial_estados[self.tiempo_actual] = {}
+            self.historial_estados[self.tiempo_actual][clave] = estado
+        
+        cambios = self.transiciones.get(clave)
+        if cambios is None:
+            self.transiciones[clave] = [(self.tiempo_actual, estado)]
+            return
+        ultimo_tiempo, ultimo_estado = cambios[-1]
+        if ultimo_tiempo != self.tiempo_actual and ultimo_estado == estado:
+            return
+        if self._transiciones_compartidas and clave in self._transiciones_compartidas:
+            cambios = self.transiciones[clave] = list(cambios)
+            self._transiciones_compartidas.discard(clave)
+        if ultimo_tiempo != self.tiempo_actual:
+            cambios.append((self.tiempo_actual, estado))
+            return
+        # Varios registros en el mismo tick: prevalece el último
+        if len(cambios) > 1 and cambios[-2][1] == estado:
+            cambios.pop()
+        else:
+            cambios[-1] = (self.tiempo_actual, estado)
     
     def notificar_observadores(self) -> None:
         """Notifica a todos los observadores con el estado actual."""
+        if not self.observadores:
+            return
         datos = {
             'procesos': self.procesos,
             'proceso_actual': self.proceso_actual,
             'tiempo_actual': self.tiempo_actual,
             'tiempo_cpu_ocupada': self.tiempo_cpu_ocupada,
             'procesos_finalizados': self.procesos_finalizados,
+            'longitud_cola': self.longitud_cola(),
             'metricas': self.obtener_metricas(),
-            'historial_estados': self.historial_estados
+            'historial_estados': self.historial_estados,
+            'transiciones': self.transiciones
         }
         for observador in self.observadores:
             observador.actualizar(datos)
@@ -85,6 +244,19 @@ class PlanificadorBase(ABC):
         """
         pass
     
+    def datos_proceso(self, proceso: Proceso) -> Dict[str, Any]:
+        """
+        Datos propios del algoritmo para la entrada de un proceso en el resultado.
+        
+        Args:
+            proceso: Proceso de la simulación
+        
+        Returns:
+            Diccionario que `resultado_planificador` agrega a los tiempos del
+            proceso (vacío por defecto)
+        """
+        return {}
+    
     def obtener_metricas(self) -> Dict[str, float]:
         """
         Calcula y retorna las métricas de la simulación.
@@ -94,11 +266,16 @@ class PlanificadorBase(ABC):
         """
         if not self.procesos_finalizados:
             return {}
-            
-        tiempo_espera_total = sum(p.tiempo_espera for p in self.procesos_finalizados)
-        tiempo_retorno_total = sum(p.tiempo_retorno for p in self.procesos_finalizados)
-        tiempo_espera_promedio = tiempo_espera_total / len(self.procesos_finalizados)
-        tiempo_retorno_promedio = tiempo_retorno_total / len(self.procesos_finalizados)
+        
+        # Los finalizados ya no cambian: solo se suman los nuevos desde la última llamada
+        if self._finalizados_contados > len(self.procesos_finalizados):
+            self._finalizados_contados = self._suma_espera = self._suma_retorno = 0
+        for p in self.procesos_finalizados[self._finalizados_contados:]:
+            self._suma_espera += p.tiempo_espera
+            self._suma_retorno += p.tiempo_retorno
+        self._finalizados_contados = len(self.procesos_finalizados)
+        tiempo_espera_promedio = self._suma_espera / len(self.procesos_finalizados)
+        tiempo_retorno_promedio = self._suma_retorno / len(self.procesos_finalizados)
         utilizacion_cpu = (self.tiempo_cpu_ocupada / self.tiempo_actual * 100 
                           if self.tiempo_actual > 0 else 0)
         
@@ -117,21 +294,40 @@ class PlanificadorRoundRobin(PlanificadorBase):
     Implementa el patrón Strategy.
     """
     
-    def __init__(self, quantum: int):
-        super().__init__()
+    def __init__(self, quantum: int, nivel_historial: Optional[NivelHistorial] = None):
+        super().__init__(nivel_historial)
         self.quantum = quantum
         self.cola_listos: deque[Proceso] = deque()
     
+    def _retirar_de_cola(self, proceso: Proceso) -> None:
+        """Quita un proceso de la cola de listos si está en ella."""
+        for i, en_cola in enumerate(self.cola_listos):
+            if en_cola is proceso:
+                del self.cola_listos[i]
+                return
+    
+    def longitud_cola(self) -> int:
+        """Cantidad de procesos en la cola de listos."""
+        return len(self.cola_listos)
+    
+    def _bifurcar_estado(self, rama: "PlanificadorBase", copias: Dict[int, Proceso]) -> None:
+        """Copia la cola de listos con los procesos de la rama."""
+        rama.cola_listos = deque(copias[id(p)] for p in self.cola_listos)
+    
     def tick(self) -> bool:
         """
         Ejecuta un tick de la simulación Round Robin.
         
         Es True si la simulación debe continuar, False si ha terminado
         """
+        registrar = self.nivel_historial != NivelHistorial.NINGUNO
+        
         # Agregar nuevos procesos que han llegado
-        for proceso in self.procesos:
+        for i, proceso in enumerate(self.procesos):
             if (proceso.estado == EstadoProceso.NUEVO and 
                 proceso.tiempo_llegada <= self.tiempo_actual):
+                if self._compartidos and id(proceso) in self._compartidos:
+                    proceso = self._materializar(i)
                 proceso.estado = EstadoProceso.LISTO
                 self.cola_listos.append(proceso)
                 if proceso.tiempo_respuesta is None:
@@ -141,7 +337,8 @@ class PlanificadorRoundRobin(PlanificadorBase):
             if proceso.estado == EstadoProceso.LISTO:
                 proceso.tiempo_espera += 1
                 
-            self.registrar_estado_proceso(proceso)
+            if registrar:
+                self.registrar_estado_proceso(proceso)
         
         # Manejar proceso actual
         if self.proceso_actual is None:
@@ -158,7 +355,8 @@ class PlanificadorRoundRobin(PlanificadorBase):
         # Ejecutar proceso actual
         self.proceso_actual.tiempo_restante -= 1
         self.tiempo_cpu_ocupada += 1
-        self.registrar_estado_proceso(self.proceso_actual)
+        if registrar:
+            self.registrar_estado_proceso(self.proceso_actual)
         
         # Verificar si el proceso terminó o expiró el quantum
         if self.proceso_actual.tiempo_restante == 0:
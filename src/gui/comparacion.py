@@ -0,0 +1,313 @@
+"""
+Vista de comparación de varios planificadores sobre la misma carga de trabajo.
+
+Cada configuración se simula en un proceso trabajador; la interfaz solo
+recibe resultados compactos (métricas y ocupación de la CPU) y los dibuja.
+"""
+
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+from PyQt6.QtWidgets import (
+    QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QListWidget, QAbstractItemView, QTableWidget, QTableWidgetItem,
+    QHeaderView, QScrollBar, QMessageBox
+)
+from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtCore import Qt, QRect, pyqtSignal
+from ..core.ejecucion import (ConfiguracionSimulacion, PLANIFICADORES,
+                              ejecutar_linea_cpu)
+from ..core.process import Proceso
+from ..config.settings import PROCESS_COLORS, COMPARISON_MAX_WORKERS
+
+class CarrilesGantt(QWidget):
+    """
+    Diagrama de Gantt con un carril por configuración y eje de tiempo común.
+
+    Solo se dibujan los intervalos visibles, localizados por búsqueda binaria,
+    por lo que el costo depende del ancho de la ventana y no de la duración.
+    """
+
+    ALTURA_CARRIL = 30
+    MARGEN_IZQUIERDO = 120
+    MARGEN = 20
+
+    # Emitida al cambiar los ticks visibles (zoom o tamaño)
+    escala_cambiada = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.carriles: List[Optional[List[tuple]]] = []
+        self.nombres: List[str] = []
+        self.pixeles_por_tick = 10.0
+        self.inicio = 0
+        self.tiempo_maximo = 0
+        self.setMouseTracking(True)
+
+    def configurar(self, nombres: List[str]) -> None:
+        """
+        Prepara un carril vacío por configuración.
+
+        Args:
+            nombres: Nombre de cada configuración
+        """
+        self.nombres = nombres
+        self.carriles = [None] * len(nombres)
+        self.tiempo_maximo = 0
+        self.inicio = 0
+        self.setMinimumHeight(self.MARGEN * 2 + len(nombres) * self.ALTURA_CARRIL)
+        self.update()
+
+    def establecer_carril(self, indice: int, linea_cpu: List[tuple]) -> None:
+        """
+        Asigna los intervalos de ejecución de una configuración.
+
+        Args:
+            indice: Carril de la configuración
+            linea_cpu: Intervalos (inicio, fin, id_proceso) ordenados
+        """
+        self.carriles[indice] = linea_cpu
+        if linea_cpu:
+            self.tiempo_maximo = max(self.tiempo_maximo, linea_cpu[-1][1])
+        self.update()
+
+    def ticks_visibles(self) -> int:
+        """Cantidad de ticks que caben en el ancho actual."""
+        ancho = max(1, self.width() - self.MARGEN_IZQUIERDO - self.MARGEN)
+        return max(1, int(ancho / self.pixeles_por_tick))
+
+    def paintEvent(self, event):
+        """Dibuja los carriles visibles."""
+        painter = QPainter(self)
+        fin = self.inicio + self.ticks_visibles() + 1
+        for i, nombre in enumerate(self.nombres):
+            y = self.MARGEN + i * self.ALTURA_CARRIL
+            painter.setPen(QPen(Qt.GlobalColor.black))
+            painter.drawText(5, y + self.ALTURA_CARRIL // 2 + 5, nombre)
+            linea = self.carriles[i]
+            if linea is None:
+                painter.drawText(self.MARGEN_IZQUIERDO, y + self.ALTURA_CARRIL // 2 + 5,
+                                 "Simulando...")
+                continue
+            # Primer intervalo que termina después del inicio visible
+            desde = max(0, bisect_left(linea, (self.inicio,)) - 1)
+            for inicio, fin_intervalo, id_proceso in linea[desde:]:
+                if inicio >= fin:
+                    break
+                if fin_intervalo <= self.inicio:
+                    continue
+                x1 = self.MARGEN_IZQUIERDO + (max(inicio, self.inicio) - self.inicio) * self.pixeles_por_tick
+                x2 = self.MARGEN_IZQUIERDO + (min(fin_intervalo, fin) - self.inicio) * self.pixeles_por_tick
+                rect = QRect(int(x1), y, max(1, int(x2) - int(x1)), self.ALTURA_CARRIL - 4)
+                painter.fillRect(rect, QColor(PROCESS_COLORS[(id_proceso - 1) % len(PROCESS_COLORS)]))
+                if rect.width() > 25:
+                    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, f"P{id_proceso}")
+
+        # Eje de tiempo común
+        y_eje = self.MARGEN + len(self.nombres) * self.ALTURA_CARRIL
+        painter.setPen(QPen(Qt.GlobalColor.black, 1))
+        painter.drawLine(self.MARGEN_IZQUIERDO, y_eje, self.width() - self.MARGEN, y_eje)
+        paso = max(1, int(60 / self.pixeles_por_tick))
+        for t in range(self.inicio - self.inicio % paso, fin, paso):
+            if t < self.inicio:
+                continue
+            x = self.MARGEN_IZQUIERDO + (t - self.inicio) * self.pixeles_por_tick
+            painter.drawText(int(x), y_eje + 15, str(t))
+
+    def wheelEvent(self, event):
+        """Ctrl + rueda cambia el zoom de todos los carriles a la vez."""
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+            self.pixeles_por_tick = min(60.0, max(0.01, self.pixeles_por_tick * factor))
+            self.escala_cambiada.emit()
+            self.update()
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    def resizeEvent(self, event):
+        """El ancho nuevo cambia cuántos ticks entran."""
+        super().resizeEvent(event)
+        self.escala_cambiada.emit()
+
+class VentanaComparacion(QDialog):
+    """
+    Diálogo que simula la misma carga con varias configuraciones en paralelo:
+    cada planificador elegido con cada quantum indicado.
+
+    Muestra los carriles de Gantt sincronizados y una tabla de métricas con
+    la diferencia de cada configuración respecto de la primera.
+    """
+
+    METRICAS = [
+        ("tiempo_total", "Tiempo total"),
+        ("utilizacion_cpu", "Uso CPU (%)"),
+        ("tiempo_espera_promedio", "T. Espera prom."),
+        ("tiempo_retorno_promedio", "T. Retorno prom."),
+    ]
+
+    # Emitida desde los hilos del pool; Qt la entrega en el hilo de la interfaz
+    resultado_recibido = pyqtSignal(int, int, object)
+
+    def __init__(self, procesos: List[Proceso], parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Comparación de planificadores")
+        self.resize(1000, 600)
+        self.procesos = procesos
+        self.configuraciones: List[ConfiguracionSimulacion] = []
+        self.resultados: List[Optional[Dict[str, Any]]] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._futuros = []
+        self._lote = 0
+        self.resultado_recibido.connect(self._mostrar_resultado)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Configura la interfaz del diálogo."""
+        layout = QVBoxLayout(self)
+
+        controles = QHBoxLayout()
+        controles.addWidget(QLabel("Planificadores:"))
+        self.lista_planificadores = QListWidget()
+        self.lista_planificadores.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        self.lista_planificadores.addItems(list(PLANIFICADORES))
+        self.lista_planificadores.item(0).setSelected(True)
+        self.lista_planificadores.setMaximumHeight(
+            self.lista_planificadores.sizeHintForRow(0) * len(PLANIFICADORES) + 4)
+        controles.addWidget(self.lista_planificadores)
+        controles.addWidget(QLabel("Quantums:"))
+        self.campo_quantums = QLineEdit("1, 2, 4, 8")
+        controles.addWidget(self.campo_quantums)
+        self.boton_comparar = QPushButton("Comparar")
+        self.boton_comparar.clicked.connect(self._comparar)
+        controles.addWidget(self.boton_comparar)
+        controles.addWidget(QLabel(f"{len(self.procesos)} procesos"))
+        controles.addStretch()
+        layout.addLayout(controles)
+
+        self.carriles = CarrilesGantt()
+        self.carriles.escala_cambiada.connect(self._ajustar_barra)
+        layout.addWidget(self.carriles)
+        self.barra = QScrollBar(Qt.Orientation.Horizontal)
+        self.barra.valueChanged.connect(self._desplazar)
+        layout.addWidget(self.barra)
+
+        self.tabla = QTableWidget()
+        self.tabla.setColumnCount(1 + 2 * len(self.METRICAS))
+        cabeceras = ["Configuración"]
+        for _, nombre in self.METRICAS:
+            cabeceras += [nombre, "Δ"]
+        self.tabla.setHorizontalHeaderLabels(cabeceras)
+        self.tabla.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self.tabla)
+
+    def _comparar(self):
+        """Lanza una simulación por configuración en el pool de procesos."""
+        try:
+            quantums = [int(q) for q in self.campo_quantums.text().replace(";", ",").split(",")
+                        if q.strip()]
+        except ValueError:
+            QMessageBox.warning(self, "Advertencia", "Los quantums deben ser enteros.")
+            return
+        if not quantums or min(quantums) < 1:
+            QMessageBox.warning(self, "Advertencia", "Indique al menos un quantum positivo.")
+            return
+
+        planificadores = [item.text() for item in self.lista_planificadores.selectedItems()]
+        if not planificadores:
+            QMessageBox.warning(self, "Advertencia", "Seleccione al menos un planificador.")
+            return
+
+        # Producto planificadores × quantums, en el orden de la lista
+        planificadores.sort(key=list(PLANIFICADORES).index)
+        self.configuraciones = [
+            ConfiguracionSimulacion.desde_procesos(self.procesos, planificador, q)
+            for planificador in planificadores for q in quantums
+        ]
+        self.resultados = [None] * len(self.configuraciones)
+        nombres = [f"{c.planificador} q={c.quantum}" for c in self.configuraciones]
+        self.carriles.configurar(nombres)
+        self.tabla.setRowCount(len(nombres))
+        for fila, nombre in enumerate(nombres):
+            self.tabla.setItem(fila, 0, QTableWidgetItem(nombre))
+
+        # Los resultados de un lote anterior que lleguen tarde se ignoran
+        for futuro in self._futuros:
+            futuro.cancel()
+        self._lote += 1
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=COMPARISON_MAX_WORKERS)
+        self._futuros = []
+        for indice, config in enumerate(self.configuraciones):
+            futuro = self._pool.submit(ejecutar_linea_cpu, config)
+            futuro.add_done_callback(
+                lambda f, i=indice, lote=self._lote: self._al_terminar(lote, i, f))
+            self._futuros.append(futuro)
+
+    def _al_terminar(self, lote: int, indice: int, futuro) -> None:
+        """Callback del pool (otro hilo): reenvía el resultado por señal."""
+        if futuro.cancelled():
+            return
+        error = futuro.exception()
+        self.resultado_recibido.emit(lote, indice, error if error else futuro.result())
+
+    def _mostrar_resultado(self, lote: int, indice: int, resultado) -> None:
+        """Dibuja el resultado de una configuración (hilo de la interfaz)."""
+        if lote != self._lote:
+            return
+        if isinstance(resultado, BaseException):
+            self.tabla.setItem(indice, 1, QTableWidgetItem(f"Error: {resultado}"))
+            return
+        self.resultados[indice] = resultado
+        self.carriles.establecer_carril(indice, resultado["linea_cpu"])
+        self._ajustar_barra()
+        self._actualizar_tabla()
+
+    def _actualizar_tabla(self) -> None:
+        """Rellena la tabla de métricas y las diferencias con la primera fila."""
+        base = self.resultados[0]["metricas"] if self.resultados and self.resultados[0] else None
+        for fila, resultado in enumerate(self.resultados):
+            if resultado is None:
+                continue
+            metricas = resultado["metricas"]
+            for j, (clave, _) in enumerate(self.METRICAS):
+                valor = metricas.get(clave, 0)
+                self.tabla.setItem(fila, 1 + 2 * j, QTableWidgetItem(f"{valor:.2f}"))
+                diferencia = "-" if base is None else f"{valor - base.get(clave, 0):+.2f}"
+                self.tabla.setItem(fila, 2 + 2 * j, QTableWidgetItem(diferencia))
+
+    def _ajustar_barra(self) -> None:
+        """Actualiza el rango de la barra horizontal según el zoom y la duración."""
+        visibles = self.carriles.ticks_visibles()
+        self.barra.blockSignals(True)
+        self.barra.setRange(0, max(0, self.carriles.tiempo_maximo - visibles))
+        self.barra.setPageStep(visibles)
+        self.barra.setSingleStep(max(1, visibles // 20))
+        self.barra.blockSignals(False)
+        # El rango nuevo puede haber recortado el inicio
+        if self.carriles.inicio != self.barra.value():
+            self._desplazar(self.barra.value())
+
+    def _desplazar(self, valor: int) -> None:
+        """Mueve todos los carriles a la vez."""
+        self.carriles.inicio = valor
+        self.carriles.update()
+
+    def _liberar_pool(self) -> None:
+        """Cancela las simulaciones pendientes y libera el pool de procesos."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        # Los resultados que ya estaban en curso se ignoran
+        self._futuros = []
+        self._lote += 1
+
+    def done(self, resultado: int) -> None:
+        """Libera el pool al cerrar el diálogo (aceptar, rechazar o Escape)."""
+        self._liberar_pool()
+        super().done(resultado)
+
+    def closeEvent(self, event):
+        """Libera el pool de procesos al cerrar la ventana."""
+        self._liberar_pool()
+        super().closeEvent(event)
@@ -0,0 +1,287 @@
+"""
+Renderizado del diagrama de Gantt sin pantalla, a PNG o SVG.
+
+Usa el mismo `PintorGantt` que el widget, sobre una QImage o un
+QSvgGenerator, con la plataforma 'offscreen' de Qt si no hay pantalla. El
+PNG se dibuja en franjas horizontales que se comprimen a medida que se
+completan, así que la imagen entera nunca está en memoria; cada franja se
+divide en teselas verticales (franjas de tiempo) que se dibujan en procesos
+trabajadores. El SVG se genera en un solo proceso: a escalas alejadas
+contiene una imagen de densidad por fila, no un rectángulo por tick. Ambos
+formatos se escriben en un archivo temporal que reemplaza al destino solo
+si el dibujo termina bien.
+
+Uso:
+    python -m src.gui.gantt_imagen carga.json gantt.png
+    python -m src.gui.gantt_imagen carga.json gantt.svg --pixeles-por-tick 2
+"""
+
+import argparse
+import json
+import math
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Tuple
+import numpy as np
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter, QColor
+from PyQt6.QtCore import QRect, QSize
+from ..core.historial import Transicion
+from ..core.scheduler import PlanificadorBase
+from ..core.ejecucion import ConfiguracionSimulacion, transiciones_simulacion
+from .pintor_gantt import PintorGantt
+from ..config.settings import (GANTT_EXPORT_MAX_WIDTH, GANTT_EXPORT_TILE_WIDTH,
+                               GANTT_EXPORT_STRIP_HEIGHT)
+
+# (x, y, ancho, alto) de una tesela en coordenadas de la imagen final
+Tesela = Tuple[int, int, int, int]
+
+_aplicacion = None
+# Pintor de cada proceso trabajador (lo fija el inicializador del pool)
+_pintor_trabajador: Optional[PintorGantt] = None
+
+def _asegurar_aplicacion() -> None:
+    """Crea una QGuiApplication (offscreen si no hay pantalla) para dibujar texto."""
+    global _aplicacion
+    if QGuiApplication.instance() is not None:
+        return
+    argumentos = ["gantt_imagen"]
+    if not (os.environ.get("QT_QPA_PLATFORM") or os.environ.get("DISPLAY")
+            or os.environ.get("WAYLAND_DISPLAY")):
+        argumentos += ["-platform", "offscreen"]
+    _aplicacion = QGuiApplication(argumentos)
+
+def crear_pintor(transiciones: Dict[str, List[Transicion]], tiempo_final: int,
+                 pixeles_por_tick: Optional[float] = None,
+                 ancho_maximo: int = GANTT_EXPORT_MAX_WIDTH) -> PintorGantt:
+    """
+    Prepara un pintor que cubre toda la línea de tiempo.
+
+    Args:
+        transiciones: Cambios de estado por proceso
+        tiempo_final: Tiempo final de la simulación
+        pixeles_por_tick: Escala deseada (por defecto, la del widget)
+        ancho_maximo: Ancho máximo del área de barras; reduce la escala si hace falta
+
+    Returns:
+        Pintor con ancho y alto de la imagen completa
+    """
+    pintor = PintorGantt()
+    pintor.transiciones = transiciones
+    pintor.tiempo_maximo = tiempo_final
+    escala = pixeles_por_tick or float(PintorGantt.ANCHO_UNIDAD_TIEMPO)
+    pintor.pixeles_por_tick = min(escala, ancho_maximo / max(1, tiempo_final))
+    pintor.ancho = 2 * PintorGantt.MARGEN + math.ceil(tiempo_final * pintor.pixeles_por_tick)
+    pintor.alto = pintor.altura_total()
+    return pintor
+
+def _dibujar_tesela(pintor: PintorGantt, tesela: Tesela) -> bytes:
+    """Dibuja una región del diagrama y devuelve sus píxeles crudos (RGB32)."""
+    x, y, ancho, alto = tesela
+    imagen = QImage(ancho, alto, QImage.Format.Format_RGB32)
+    imagen.fill(QColor(255, 255, 255))
+    painter = QPainter(imagen)
+    try:
+        painter.translate(-x, -y)
+        pintor.dibujar(painter, QRect(x, y, ancho, alto))
+    finally:
+        painter.end()
+    return imagen.constBits().asstring(imagen.sizeInBytes())
+
+def _inicializar_trabajador(pintor: PintorGantt) -> None:
+    """Guarda el pintor en el proceso trabajador y prepara Qt."""
+    global _pintor_trabajador
+    _asegurar_aplicacion()
+    _pintor_trabajador = pintor
+
+def _tesela_en_trabajador(tesela: Tesela) -> Tuple[Tesela, bytes]:
+    """Dibuja una tesela en el proceso trabajador."""
+    return tesela, _dibujar_tesela(_pintor_trabajador, tesela)
+
+def _teselas(ancho: int, y: int, alto: int, ancho_tesela: int) -> List[Tesela]:
+    """Divide una franja en teselas verticales de a lo sumo `ancho_tesela` píxeles."""
+    return [(x, y, min(ancho_tesela, ancho - x), alto) for x in range(0, ancho, ancho_tesela)]
+
+def _unir_franja(teselas: List[Tuple[Tesela, bytes]], ancho: int) -> np.ndarray:
+    """Une las teselas de una franja en un arreglo RGB (alto, ancho, 3)."""
+    alto = teselas[0][0][3]
+    franja = np.empty((alto, ancho, 3), dtype=np.uint8)
+    for (x, _, ancho_tesela, _), pixeles in teselas:
+        # RGB32 se guarda como B, G, R, 0xFF en memoria
+        bgra = np.frombuffer(pixeles, dtype=np.uint8).reshape(alto, ancho_tesela, 4)
+        franja[:, x:x + ancho_tesela] = bgra[:, :, 2::-1]
+    return franja
+
+class _EscritorPng:
+    """Escribe un PNG RGB de a franjas horizontales, sin la imagen completa en memoria."""
+
+    def __init__(self, archivo: BinaryIO, ancho: int, alto: int):
+        """
+        Args:
+            archivo: Archivo binario abierto para escritura
+            ancho: Ancho de la imagen
+            alto: Alto de la imagen
+        """
+        self.archivo = archivo
+        self._compresor = zlib.compressobj()
+        self._anterior = np.zeros((ancho, 3), dtype=np.uint8)
+        archivo.write(b"\x89PNG\r\n\x1a\n")
+        self._bloque(b"IHDR", struct.pack(">IIBBBBB", ancho, alto, 8, 2, 0, 0, 0))
+
+    def _bloque(self, tipo: bytes, datos: bytes) -> None:
+        """Escribe un bloque con su longitud y CRC."""
+        self.archivo.write(struct.pack(">I", len(datos)) + tipo + datos
+                           + struct.pack(">I", zlib.crc32(tipo + datos)))
+
+    def agregar(self, filas: np.ndarray) -> None:
+        """
+        Comprime las filas siguientes de la imagen.
+
+        Args:
+            filas: Arreglo RGB (alto, ancho, 3)
+        """
+        # Filtro 'Up': las filas de una misma barra son casi iguales y se comprimen a nada
+        filtradas = np.empty((len(filas), filas.shape[1] * 3 + 1), dtype=np.uint8)
+        filtradas[:, 0] = 2
+        filtradas[0, 1:] = (filas[0] - self._anterior).ravel()
+        filtradas[1:, 1:] = (filas[1:] - filas[:-1]).reshape(len(filas) - 1, -1)
+        self._anterior = filas[-1].copy()
+        datos = self._compresor.compress(filtradas.tobytes())
+        if datos:
+            self._bloque(b"IDAT", datos)
+
+    def cerrar(self) -> None:
+        """Escribe el final de los datos comprimidos y el bloque final."""
+        self._bloque(b"IDAT", self._compresor.flush())
+        self._bloque(b"IEND", b"")
+
+def _renderizar_png(pintor: PintorGantt, ruta: str, ancho_tesela: int, alto_franja: int,
+                    max_trabajadores: Optional[int]) -> None:
+    """Dibuja el PNG por franjas y teselas, en paralelo si hay más de una tesela."""
+    franjas = [_teselas(pintor.ancho, y, min(alto_franja, pintor.alto - y), ancho_tesela)
+               for y in range(0, pintor.alto, alto_franja)]
+    with open(ruta, "wb") as archivo:
+        escritor = _EscritorPng(archivo, pintor.ancho, pintor.alto)
+        if max(map(len, franjas)) == 1 or max_trabajadores == 1:
+            for franja in franjas:
+                _, y, _, alto = franja[0]
+                tesela = (0, y, pintor.ancho, alto)
+                escritor.agregar(_unir_franja([(tesela, _dibujar_tesela(pintor, tesela))],
+                                              pintor.ancho))
+        else:
+            # La pirámide se calcula una vez y viaja con el pintor a cada trabajador
+            if 1.0 / pintor.pixeles_por_tick > pintor.MAX_TICKS_POR_PIXEL_DETALLE:
+                pintor.piramide()
+            with ProcessPoolExecutor(max_workers=max_trabajadores,
+                                     initializer=_inicializar_trabajador,
+                                     initargs=(pintor,)) as pool:
+                # Se dibuja una franja por adelantado mientras se comprime la anterior
+                pendientes: deque = deque()
+                for franja in franjas:
+                    pendientes.append([pool.submit(_tesela_en_trabajador, t) for t in franja])
+                    if len(pendientes) > 1:
+                        escritor.agregar(_unir_franja([f.result() for f in pendientes.popleft()],
+                                                      pintor.ancho))
+                while pendientes:
+                    escritor.agregar(_unir_franja([f.result() for f in pendientes.popleft()],
+                                                  pintor.ancho))
+        escritor.cerrar()
+
+def _renderizar_svg(pintor: PintorGantt, ruta: str) -> None:
+    """Dibuja el diagrama completo como SVG."""
+    from PyQt6.QtSvg import QSvgGenerator
+    generador = QSvgGenerator()
+    generador.setFileName(ruta)
+    generador.setSize(QSize(pintor.ancho, pintor.alto))
+    generador.setViewBox(QRect(0, 0, pintor.ancho, pintor.alto))
+    generador.setTitle("Diagrama de Gantt")
+    painter = QPainter(generador)
+    if not painter.isActive():
+        raise OSError(f"No se pudo escribir {ruta}")
+    try:
+        pintor.dibujar(painter, QRect(0, 0, pintor.ancho, pintor.alto))
+    finally:
+        escrito = painter.end()
+    if not escrito:
+        raise OSError(f"No se pudo escribir {ruta}")
+
+def renderizar_gantt(transiciones: Dict[str, List[Transicion]], tiempo_final: int, ruta: str,
+                     pixeles_por_tick: Optional[float] = None,
+                     ancho_maximo: int = GANTT_EXPORT_MAX_WIDTH,
+                     ancho_tesela: int = GANTT_EXPORT_TILE_WIDTH,
+                     max_trabajadores: Optional[int] = None,
+                     alto_franja: int = GANTT_EXPORT_STRIP_HEIGHT) -> str:
+    """
+    Guarda el diagrama de Gantt de un historial como PNG o SVG.
+
+    Args:
+        transiciones: Cambios de estado por proceso
+        tiempo_final: Tiempo final de la simulación
+        ruta: Archivo de salida; la extensión (.png o .svg) elige el formato
+        pixeles_por_tick: Escala deseada (por defecto, la del widget)
+        ancho_maximo: Ancho máximo del área de barras
+        ancho_tesela: Ancho de cada tesela del PNG
+        max_trabajadores: Procesos para las teselas (por defecto, uno por núcleo)
+        alto_franja: Alto de las franjas del PNG que se comprimen juntas
+
+    Returns:
+        La ruta escrita (si el dibujo falla, queda el archivo anterior)
+
+    Raises:
+        ValueError: Si no hay historial o el formato no es PNG ni SVG
+        OSError: Si no se pudo escribir el archivo
+    """
+    if not transiciones:
+        raise ValueError("No hay transiciones que dibujar")
+    formato = os.path.splitext(ruta)[1].lower()
+    if formato not in (".png", ".svg"):
+        raise ValueError(f"Formato no soportado: {formato or ruta}")
+    _asegurar_aplicacion()
+    pintor = crear_pintor(transiciones, tiempo_final, pixeles_por_tick, ancho_maximo)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        if formato == ".svg":
+            _renderizar_svg(pintor, temporal)
+        else:
+            _renderizar_png(pintor, temporal, ancho_tesela, alto_franja, max_trabajadores)
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    return ruta
+
+def renderizar_planificador(planificador: PlanificadorBase, ruta: str, **opciones) -> str:
+    """
+    Guarda el diagrama de Gantt de un planificador (con historial de transiciones).
+
+    Args:
+        planificador: Planificador simulado con nivel de historial TRANSICIONES o mayor
+        ruta: Archivo de salida (.png o .svg)
+        **opciones: Opciones de `renderizar_gantt`
+
+    Returns:
+        La ruta escrita
+    """
+    return renderizar_gantt(planificador.transiciones, planificador.tiempo_actual, ruta, **opciones)
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Diagrama de Gantt a PNG o SVG sin pantalla")
+    parser.add_argument("archivo", help="Configuración JSON de la simulación")
+    parser.add_argument("salida", help="Imagen de salida (.png o .svg)")
+    parser.add_argument("--pixeles-por-tick", type=float, default=None)
+    parser.add_argument("--ancho-maximo", type=int, default=GANTT_EXPORT_MAX_WIDTH)
+    parser.add_argument("--ancho-tesela", type=int, default=GANTT_EXPORT_TILE_WIDTH)
+    parser.add_argument("--trabajadores", type=int, default=None)
+    args = parser.parse_args()
+
+    with open(args.archivo, encoding="utf-8") as archivo:
+        config = ConfiguracionSimulacion.desde_dict(json.load(archivo))
+    transiciones, tiempo_final = transiciones_simulacion(config)
+    print(renderizar_gantt(transiciones, tiempo_final, args.salida, args.pixeles_por_tick,
+                           args.ancho_maximo, args.ancho_tesela, args.trabajadores))
+
+if __name__ == "__main__":
+    main()
@@ -1,148 +1,271 @@
 """
 Widget que muestra el diagrama de Gantt de la simulación.
+
+La vista es ampliable: con zoom cercano dibuja cada intervalo de estado y,
+al alejarse, bandas de densidad tomadas de una pirámide de ocupación. El
+dibujo lo hace `PintorGantt` solo sobre la región expuesta, así que el costo
+depende de los píxeles en pantalla y no del tiempo simulado.
+
+Al pasar el cursor sobre una barra se muestra el estado del proceso en ese
+instante; un clic (o arrastre) fija el instante y muestra quién tenía la CPU
+y la cola de listos. Ambas consultas usan el índice del historial.
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
-from PyQt6.QtGui import QPainter, QColor, QPen
-from PyQt6.QtCore import Qt, QRect, QSize
-from typing import Dict, Any
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QScrollBar, QLabel, QToolTip
+from PyQt6.QtGui import QPainter
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
+from typing import Dict, Any, List, Optional
 from ..core.scheduler import ObservadorSimulacion
+from ..core.historial import NivelHistorial, Transicion
+from .pintor_gantt import PintorGantt
+from ..config.settings import PROCESS_STATES
+
+# Procesos listos que se nombran en la línea del instante seleccionado
+MAX_LISTOS_MOSTRADOS = 10
+AYUDA_INSTANTE = "Clic en el diagrama para consultar un instante"
 
 class DiagramaGanttContenido(QWidget):
     """Widget que contiene el diagrama de Gantt."""
-    
-    ALTURA_PROCESO = 30
-    ANCHO_UNIDAD_TIEMPO = 30
-    MARGEN = 50
-    
+
+    ALTURA_PROCESO = PintorGantt.ALTURA_PROCESO
+    ANCHO_UNIDAD_TIEMPO = PintorGantt.ANCHO_UNIDAD_TIEMPO
+    MARGEN = PintorGantt.MARGEN
+    MIN_PIXELES_POR_TICK = 1e-4
+    MAX_PIXELES_POR_TICK = 120.0
+
+    escala_cambiada = pyqtSignal()
+    instante_seleccionado = pyqtSignal(int)
+
     def __init__(self):
         super().__init__()
-        self.historial: Dict[int, Dict[str, str]] = {}
-        self.tiempo_maximo = 0
-        self.num_procesos = 0
-        
-        # Colores para los diferentes estados
-        self.colores = {
-            'E': QColor(46, 204, 113),  # Verde para ejecutando
-            'L': QColor(241, 196, 15),  # Amarillo para listo
-            'F': QColor(231, 76, 60)    # Rojo para finalizado
-        }
-        
+        self.pintor = PintorGantt()
         self.setMinimumSize(400, 200)
-    
+
+    @property
+    def transiciones(self) -> Dict[str, List[Transicion]]:
+        """Transiciones que se dibujan."""
+        return self.pintor.transiciones
+
+    @property
+    def tiempo_maximo(self) -> int:
+        """Tiempo final de la línea de tiempo."""
+        return self.pintor.tiempo_maximo
+
+    @property
+    def num_procesos(self) -> int:
+        """Cantidad de filas del diagrama."""
+        return self.pintor.num_procesos
+
+    @property
+    def inicio(self) -> float:
+        """Tiempo en el borde izquierdo del área de barras."""
+        return self.pintor.inicio
+
+    @inicio.setter
+    def inicio(self, valor: float) -> None:
+        self.pintor.inicio = valor
+
+    @property
+    def pixeles_por_tick(self) -> float:
+        """Escala horizontal actual."""
+        return self.pintor.pixeles_por_tick
+
     def actualizar(self, datos: Dict[str, Any]) -> None:
         """
         Actualiza el diagrama con nuevos datos.
-        
+
         Args:
             datos: Diccionario con los datos actualizados
         """
-        self.historial = datos['historial_estados']
-        self.tiempo_maximo = datos['tiempo_actual']
-        if self.historial:
-            self.num_procesos = len(next(iter(self.historial.values())))
-        
-        # Actualizar tamaño del widget
-        width = self.MARGEN * 2 + (self.tiempo_maximo + 1) * self.ANCHO_UNIDAD_TIEMPO
-        height = self.MARGEN * 2 + self.num_procesos * self.ALTURA_PROCESO
-        self.setMinimumSize(width, height)
-        self.resize(width, height)
+        self.pintor.transiciones = datos['transiciones']
+        self.pintor.tiempo_maximo = datos['tiempo_actual']
+
+        # Solo la altura depende de los datos; el ancho es el de la ventana
+        self.setMinimumHeight(self.pintor.altura_total())
         self.update()
-    
-    def paintEvent(self, event):
-        """Dibuja el diagrama de Gantt."""
-        if not self.historial:
+
+    def ticks_visibles(self) -> float:
+        """Cantidad de ticks que caben en el ancho del área de dibujo."""
+        self.pintor.ancho = self.width()
+        return self.pintor.ticks_visibles()
+
+    def cambiar_escala(self, factor: float, ancla_x: Optional[float] = None) -> None:
+        """
+        Cambia el zoom manteniendo fijo el tiempo bajo el cursor.
+
+        Args:
+            factor: Multiplicador de píxeles por tick
+            ancla_x: Posición x del cursor (por defecto, el borde izquierdo)
+        """
+        ancla_x = self.MARGEN if ancla_x is None else ancla_x
+        tiempo_ancla = self.tiempo_en(ancla_x)
+        self.pintor.pixeles_por_tick = min(self.MAX_PIXELES_POR_TICK,
+                                           max(self.MIN_PIXELES_POR_TICK,
+                                               self.pixeles_por_tick * factor))
+        self.inicio = max(0.0, tiempo_ancla - (ancla_x - self.MARGEN) / self.pixeles_por_tick)
+        self.escala_cambiada.emit()
+        self.update()
+
+    def tiempo_en(self, x: float) -> float:
+        """Tiempo simulado correspondiente a una coordenada x."""
+        return self.pintor.tiempo_en(x)
+
+    def tick_en(self, x: float) -> Optional[int]:
+        """Tick dibujado en una coordenada x, si está dentro del historial."""
+        tiempo = self.tiempo_en(x)
+        if x < self.MARGEN or not 0 <= tiempo < self.tiempo_maximo:
+            return None
+        return int(tiempo)
+
+    def event(self, event):
+        """Muestra el estado del proceso bajo el cursor como ayuda emergente."""
+        if event.type() == QEvent.Type.ToolTip:
+            posicion = event.pos()
+            clave = self.pintor.fila_en(posicion.y())
+            tick = self.tick_en(posicion.x())
+            if clave is None or tick is None:
+                QToolTip.hideText()
+                event.ignore()
+                return True
+            estado = self.pintor.indice().estado_en(clave, tick)
+            texto = f"{clave} en t = {tick}: {PROCESS_STATES.get(estado, 'Sin llegar')}"
+            QToolTip.showText(event.globalPos(), texto, self)
+            return True
+        return super().event(event)
+
+    def seleccionar_instante(self, tick: Optional[int]) -> None:
+        """
+        Marca un instante con el cursor de tiempo.
+
+        Args:
+            tick: Instante a marcar (None: quitar el cursor)
+        """
+        if tick == self.pintor.cursor:
             return
-            
+        self.pintor.cursor = tick
+        self.update()
+        if tick is not None:
+            self.instante_seleccionado.emit(tick)
+
+    def mousePressEvent(self, event):
+        """Un clic izquierdo fija el instante seleccionado."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            tick = self.tick_en(event.position().x())
+            if tick is not None:
+                self.seleccionar_instante(tick)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """Arrastrar con el botón izquierdo recorre la línea de tiempo."""
+        if event.buttons() & Qt.MouseButton.LeftButton:
+            tick = self.tick_en(event.position().x())
+            if tick is not None:
+                self.seleccionar_instante(tick)
+        super().mouseMoveEvent(event)
+
+    def wheelEvent(self, event):
+        """Ctrl + rueda cambia el zoom."""
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+            self.cambiar_escala(factor, event.position().x())
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    def paintEvent(self, event):
+        """Dibuja el diagrama de Gantt en la región expuesta."""
+        self.pintor.ancho = self.width()
+        self.pintor.alto = self.height()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Dibujar ejes
-        self._dibujar_ejes(painter)
-        
-        # Dibujar las barras del diagrama
-        self._dibujar_barras(painter)
-        
-        # Dibujar etiquetas de tiempo
-        self._dibujar_etiquetas_tiempo(painter)
-        
-        # Dibujar etiquetas de procesos
-        self._dibujar_etiquetas_procesos(painter)
-    
-    def _dibujar_ejes(self, painter: QPainter):
-        """Dibuja los ejes del diagrama."""
-        pen = QPen(Qt.GlobalColor.black, 2)
-        painter.setPen(pen)
-        
-        # Eje Y
-        painter.drawLine(
-            self.MARGEN, self.MARGEN,
-            self.MARGEN, self.height() - self.MARGEN
-        )
-        
-        # Eje X
-        painter.drawLine(
-            self.MARGEN, self.height() - self.MARGEN,
-            self.width() - self.MARGEN, self.height() - self.MARGEN
-        )
-    
-    def _dibujar_barras(self, painter: QPainter):
-        """Dibuja las barras del diagrama para cada proceso."""
-        for tiempo in range(self.tiempo_maximo + 1):
-            if tiempo not in self.historial:
-                continue
-                
-            estados = self.historial[tiempo]
-            for i, (proceso_id, estado) in enumerate(estados.items()):
-                if estado not in self.colores:
-                    continue
-                    
-                x = self.MARGEN + tiempo * self.ANCHO_UNIDAD_TIEMPO
-                y = self.MARGEN + i * self.ALTURA_PROCESO
-                
-                rect = QRect(
-                    x, y,
-                    self.ANCHO_UNIDAD_TIEMPO,
-                    self.ALTURA_PROCESO
-                )
-                
-                painter.fillRect(rect, self.colores[estado])
-                painter.setPen(QPen(Qt.GlobalColor.black, 1))
-                painter.drawRect(rect)
-    
-    def _dibujar_etiquetas_tiempo(self, painter: QPainter):
-        """Dibuja las etiquetas de tiempo en el eje X."""
-        painter.setPen(QPen(Qt.GlobalColor.black))
-        for t in range(self.tiempo_maximo + 1):
-            x = self.MARGEN + t * self.ANCHO_UNIDAD_TIEMPO
-            y = self.height() - self.MARGEN + 20
-            painter.drawText(x, y, str(t))
-    
-    def _dibujar_etiquetas_procesos(self, painter: QPainter):
-        """Dibuja las etiquetas de procesos en el eje Y."""
-        painter.setPen(QPen(Qt.GlobalColor.black))
-        for i in range(self.num_procesos):
-            x = self.MARGEN - 30
-            y = self.MARGEN + i * self.ALTURA_PROCESO + self.ALTURA_PROCESO // 2
-            painter.drawText(x, y, f"P{i}")
-
-class DiagramaGantt(QScrollArea):
-    """Widget con scroll que contiene el diagrama de Gantt."""
-    
+        self.pintor.dibujar(painter, event.rect())
+
+class DiagramaGantt(QWidget):
+    """
+    Diagrama de Gantt con desplazamiento vertical por procesos y una barra
+    horizontal en ticks. Ctrl + rueda cambia el zoom.
+    """
+
+    # Dibuja a partir de las transiciones de estado de cada proceso
+    NIVEL_HISTORIAL_REQUERIDO = NivelHistorial.TRANSICIONES
+
     def __init__(self):
         super().__init__()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.etiqueta_instante = QLabel(AYUDA_INSTANTE)
+        layout.addWidget(self.etiqueta_instante)
+
         self.contenido = DiagramaGanttContenido()
-        self.setWidget(self.contenido)
-        self.setWidgetResizable(True)
+        self.area = QScrollArea()
+        self.area.setWidget(self.contenido)
+        self.area.setWidgetResizable(True)
+        self.area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        layout.addWidget(self.area)
+
+        self.barra = QScrollBar(Qt.Orientation.Horizontal)
+        self.barra.valueChanged.connect(self._desplazar)
+        layout.addWidget(self.barra)
+        self.contenido.escala_cambiada.connect(self._ajustar_barra)
+        self.contenido.instante_seleccionado.connect(self._mostrar_instante)
+
         self.setMinimumSize(400, 200)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-    
+
     def actualizar(self, datos: Dict[str, Any]) -> None:
         """
         Actualiza el diagrama con nuevos datos.
-        
+
         Args:
             datos: Diccionario con los datos actualizados
         """
-        self.contenido.actualizar(datos) 
\ No newline at end of file
+        pintor = self.contenido.pintor
+        # Los ticks ya simulados no cambian: el instante marcado solo se
+        # vuelve a consultar si empezó otra simulación
+        reiniciado = (datos['transiciones'] is not pintor.transiciones
+                      or datos['tiempo_actual'] < pintor.tiempo_maximo)
+        # Seguir el final de la simulación si la vista ya estaba al final
+        al_final = self.barra.value() >= self.barra.maximum()
+        self.contenido.actualizar(datos)
+        self._ajustar_barra()
+        if al_final:
+            self.barra.setValue(self.barra.maximum())
+        if pintor.cursor is not None and reiniciado:
+            if pintor.cursor < pintor.tiempo_maximo:
+                self._mostrar_instante(pintor.cursor)
+            else:
+                self.contenido.seleccionar_instante(None)
+                self.etiqueta_instante.setText(AYUDA_INSTANTE)
+
+    def _ajustar_barra(self) -> None:
+        """Actualiza el rango de la barra horizontal según el zoom."""
+        visibles = int(self.contenido.ticks_visibles())
+        self.barra.blockSignals(True)
+        self.barra.setRange(0, max(0, self.contenido.tiempo_maximo + 1 - visibles))
+        self.barra.setPageStep(max(1, visibles))
+        self.barra.setSingleStep(max(1, visibles // 20))
+        self.barra.setValue(int(self.contenido.inicio))
+        self.barra.blockSignals(False)
+        # El rango nuevo puede haber recortado el inicio
+        self.contenido.inicio = min(self.contenido.inicio, float(self.barra.maximum()))
+
+    def _mostrar_instante(self, tick: int) -> None:
+        """Muestra qué proceso tenía la CPU y cuáles estaban listos en un instante."""
+        indice = self.contenido.pintor.indice()
+        ejecutando = ", ".join(indice.en_ejecucion(tick)) or "libre"
+        listos = indice.listos(tick)
+        nombres = ", ".join(listos[:MAX_LISTOS_MOSTRADOS])
+        if len(listos) > MAX_LISTOS_MOSTRADOS:
+            nombres += f" y {len(listos) - MAX_LISTOS_MOSTRADOS} más"
+        self.etiqueta_instante.setText(
+            f"t = {tick} | CPU: {ejecutando} | Listos ({len(listos)}): {nombres or '-'}")
+
+    def _desplazar(self, valor: int) -> None:
+        """Mueve la ventana de tiempo visible."""
+        self.contenido.inicio = float(valor)
+        self.contenido.update()
+
+    def resizeEvent(self, event):
+        """Recalcula el rango visible al cambiar el tamaño."""
+        super().resizeEvent(event)
+        self._ajustar_barra()
@@ -0,0 +1,279 @@
+"""
+Instrumentación opcional del rendimiento de la interfaz.
+
+`RegistroRendimiento` guarda intervalos de tiempo (pintado de cada widget,
+callbacks de observadores, ticks del planificador) y contadores (latencia
+del bucle de eventos, cuadros perdidos) en el formato Trace Event, el que
+leen chrome://tracing y Perfetto. `MonitorRendimiento` lo conecta a una
+ventana: mide la latencia del bucle de eventos con un latido de un cuadro,
+muestra un panel superpuesto con los promedios recientes y exporta la traza.
+
+Los intervalos anidados (un observador dentro del tick que lo notifica) se
+ven anidados en el visor porque se registran en el mismo hilo.
+
+Atajos con el monitor activo:
+    F12: muestra u oculta el panel
+    Ctrl+Shift+T: exporta la traza
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+from PyQt6.QtWidgets import QWidget, QLabel, QFileDialog
+from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, QObject, QTimer, QElapsedTimer
+from ..core.scheduler import ObservadorSimulacion
+from ..core.historial import NivelHistorial
+from ..config.settings import (GUI_FRAME_BUDGET_MS, GUI_TRACE_MAX_EVENTS, GUI_PROFILE_WINDOW,
+                               GUI_OVERLAY_REFRESH_MS)
+
+# Nombre de la serie de latencia del bucle de eventos
+LATENCIA_BUCLE = "latencia del bucle"
+
+class RegistroRendimiento:
+    """Eventos de tiempo en formato Trace Event, con resúmenes recientes."""
+
+    def __init__(self, max_eventos: int = GUI_TRACE_MAX_EVENTS,
+                 ventana: int = GUI_PROFILE_WINDOW):
+        """
+        Args:
+            max_eventos: Eventos guardados para la traza (se descartan los más viejos)
+            ventana: Mediciones recientes por nombre para el resumen
+        """
+        self._origen = time.perf_counter_ns()
+        self.eventos: Deque[Dict[str, Any]] = deque(maxlen=max_eventos)
+        self._ventana = ventana
+        # nombre -> (categoría, duraciones recientes en ms)
+        self._recientes: Dict[str, Tuple[str, Deque[float]]] = {}
+        self.cuadros_perdidos = 0
+
+    def _ahora_us(self) -> float:
+        """Microsegundos desde la creación del registro."""
+        return (time.perf_counter_ns() - self._origen) / 1000
+
+    def _reciente(self, nombre: str, categoria: str, milisegundos: float) -> None:
+        """Agrega una medición a la ventana reciente de su nombre."""
+        if nombre not in self._recientes:
+            self._recientes[nombre] = (categoria, deque(maxlen=self._ventana))
+        self._recientes[nombre][1].append(milisegundos)
+
+    def intervalo(self, nombre: str, categoria: str, inicio_us: float, duracion_us: float) -> None:
+        """
+        Registra un intervalo ya medido.
+
+        Args:
+            nombre: Nombre del intervalo (p. ej. el widget o el observador)
+            categoria: 'pintado', 'observador', 'simulacion'...
+            inicio_us: Inicio en microsegundos del registro
+            duracion_us: Duración en microsegundos
+        """
+        self.eventos.append({"name": nombre, "cat": categoria, "ph": "X", "ts": inicio_us,
+                             "dur": duracion_us, "pid": os.getpid(),
+                             "tid": threading.get_native_id()})
+        self._reciente(nombre, categoria, duracion_us / 1000)
+
+    @contextmanager
+    def medir(self, nombre: str, categoria: str) -> Iterator[None]:
+        """
+        Mide la duración del bloque como un intervalo.
+
+        Args:
+            nombre: Nombre del intervalo
+            categoria: Categoría del intervalo
+        """
+        inicio = self._ahora_us()
+        try:
+            yield
+        finally:
+            self.intervalo(nombre, categoria, inicio, self._ahora_us() - inicio)
+
+    def contador(self, nombre: str, **valores: float) -> None:
+        """Registra valores de un contador (una serie por clave)."""
+        self.eventos.append({"name": nombre, "ph": "C", "ts": self._ahora_us(),
+                             "pid": os.getpid(), "args": valores})
+
+    def latencia(self, milisegundos: float, presupuesto_ms: float = GUI_FRAME_BUDGET_MS) -> None:
+        """
+        Registra el retraso de un latido del bucle de eventos.
+
+        Cada cuadro completo de retraso cuenta como un cuadro perdido.
+
+        Args:
+            milisegundos: Retraso respecto del momento previsto
+            presupuesto_ms: Duración de un cuadro
+        """
+        perdidos = int(max(0.0, milisegundos) // presupuesto_ms)
+        self.cuadros_perdidos += perdidos
+        self._reciente(LATENCIA_BUCLE, "bucle", milisegundos)
+        self.contador(LATENCIA_BUCLE, milisegundos=round(milisegundos, 3))
+        if perdidos:
+            self.contador("cuadros perdidos", total=self.cuadros_perdidos)
+
+    def resumen(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Resume las mediciones recientes.
+
+        Returns:
+            Por nombre: 'categoria', 'cantidad', 'media' y 'maximo' (en ms)
+        """
+        return {nombre: {"categoria": categoria, "cantidad": len(valores),
+                         "media": sum(valores) / len(valores), "maximo": max(valores)}
+                for nombre, (categoria, valores) in self._recientes.items() if valores}
+
+    def exportar(self, ruta: str) -> str:
+        """
+        Guarda la traza en formato JSON de Trace Event.
+
+        Args:
+            ruta: Archivo de salida
+
+        Returns:
+            La ruta escrita
+        """
+        metadatos = [
+            {"name": "process_name", "ph": "M", "pid": os.getpid(),
+             "args": {"name": "Simulador Round Robin"}},
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(),
+             "tid": threading.get_native_id(), "args": {"name": "interfaz"}},
+        ]
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"traceEvents": metadatos + list(self.eventos),
+                       "displayTimeUnit": "ms",
+                       "otherData": {"cuadros_perdidos": self.cuadros_perdidos}}, archivo)
+        return ruta
+
+class ObservadorMedido(ObservadorSimulacion):
+    """Envuelve un observador y mide cada llamada a `actualizar`."""
+
+    def __init__(self, observador: ObservadorSimulacion, registro: RegistroRendimiento):
+        super().__init__()
+        self.observador = observador
+        self.registro = registro
+        self.nombre = f"{type(observador).__name__}.actualizar"
+        # El planificador debe seguir registrando el historial que pide el observador real
+        self.NIVEL_HISTORIAL_REQUERIDO = getattr(observador, 'NIVEL_HISTORIAL_REQUERIDO',
+                                                 NivelHistorial.NINGUNO)
+
+    def actualizar(self, datos: Dict[str, Any]) -> None:
+        with self.registro.medir(self.nombre, "observador"):
+            self.observador.actualizar(datos)
+
+def instrumentar_pintado(widget: QWidget, nombre: str, registro: RegistroRendimiento) -> None:
+    """
+    Mide cada `paintEvent` de un widget.
+
+    Args:
+        widget: Widget a medir
+        nombre: Nombre con que aparece en la traza
+        registro: Registro donde se guardan las mediciones
+    """
+    original = widget.paintEvent
+
+    def paintEvent(event):
+        with registro.medir(nombre, "pintado"):
+            original(event)
+
+    widget.paintEvent = paintEvent
+
+class MonitorRendimiento(QObject):
+    """Latido del bucle de eventos, panel superpuesto y exportación de la traza."""
+
+    def __init__(self, ventana: QWidget, ruta_traza: Optional[str] = None,
+                 registro: Optional[RegistroRendimiento] = None):
+        """
+        Args:
+            ventana: Ventana sobre la que se dibuja el panel
+            ruta_traza: Archivo donde se guarda la traza al detener (opcional)
+            registro: Registro a usar (por defecto, uno nuevo)
+        """
+        super().__init__(ventana)
+        self.ventana = ventana
+        self.ruta_traza = ruta_traza
+        self.registro = registro or RegistroRendimiento()
+
+        # Latido: el retraso de cada disparo es la latencia del bucle de eventos
+        self._reloj = QElapsedTimer()
+        self._latido = QTimer(self)
+        self._latido.setTimerType(Qt.TimerType.PreciseTimer)
+        self._latido.setInterval(max(1, round(GUI_FRAME_BUDGET_MS)))
+        self._latido.timeout.connect(self._al_latir)
+
+        self.panel = QLabel(ventana)
+        self.panel.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.panel.setStyleSheet("background: rgba(0, 0, 0, 170); color: white; "
+                                 "font-family: monospace; padding: 6px;")
+        self._refresco = QTimer(self)
+        self._refresco.setInterval(GUI_OVERLAY_REFRESH_MS)
+        self._refresco.timeout.connect(self._actualizar_panel)
+
+        QShortcut(QKeySequence("F12"), ventana, self.alternar_panel)
+        QShortcut(QKeySequence("Ctrl+Shift+T"), ventana, self._exportar_con_dialogo)
+
+    def iniciar(self) -> None:
+        """Empieza a medir y muestra el panel."""
+        self._reloj.start()
+        self._latido.start()
+        self._refresco.start()
+        self.panel.show()
+        self._actualizar_panel()
+
+    def detener(self) -> None:
+        """Deja de medir y guarda la traza si se indicó una ruta."""
+        self._latido.stop()
+        self._refresco.stop()
+        if self.ruta_traza:
+            self.registro.exportar(self.ruta_traza)
+
+    def medir(self, nombre: str, categoria: str):
+        """Mide un bloque (ver `RegistroRendimiento.medir`)."""
+        return self.registro.medir(nombre, categoria)
+
+    def observador(self, observador: ObservadorSimulacion) -> ObservadorMedido:
+        """Envuelve un observador para medir sus callbacks."""
+        return ObservadorMedido(observador, self.registro)
+
+    def instrumentar(self, widget: QWidget, nombre: str) -> None:
+        """Mide el pintado de un widget."""
+        instrumentar_pintado(widget, nombre, self.registro)
+
+    def alternar_panel(self) -> None:
+        """Muestra u oculta el panel superpuesto."""
+        self.panel.setVisible(not self.panel.isVisible())
+
+    def _al_latir(self) -> None:
+        """Registra cuánto se atrasó el latido respecto de su intervalo."""
+        transcurrido = self._reloj.nsecsElapsed() / 1e6
+        self._reloj.restart()
+        self.registro.latencia(transcurrido - self._latido.interval())
+
+    def texto_panel(self) -> str:
+        """Texto del panel con las mediciones recientes."""
+        resumen = self.registro.resumen()
+        lineas = [f"{'medición':<44} {'media':>8} {'máx':>8}"]
+        for nombre, datos in sorted(resumen.items(), key=lambda item: (item[1]["categoria"], item[0])):
+            etiqueta = f"{datos['categoria']}: {nombre}"[:44]
+            lineas.append(f"{etiqueta:<44} {datos['media']:7.2f}ms {datos['maximo']:7.2f}ms")
+        lineas.append(f"cuadros perdidos: {self.registro.cuadros_perdidos}")
+        return "\n".join(lineas)
+
+    def _actualizar_panel(self) -> None:
+        """Refresca el panel y lo ubica en la esquina superior derecha."""
+        if not self.panel.isVisible():
+            return
+        self.panel.setText(self.texto_panel())
+        self.panel.adjustSize()
+        self.panel.move(self.ventana.width() - self.panel.width() - 10, 10)
+        self.panel.raise_()
+
+    def _exportar_con_dialogo(self) -> None:
+        """Pide un archivo y exporta la traza."""
+        nombre = f"traza_interfaz_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        ruta, _ = QFileDialog.getSaveFileName(self.ventana, "Guardar traza", nombre,
+                                              "Trace Event (*.json)")
+        if ruta:
+            self.registro.exportar(ruta)
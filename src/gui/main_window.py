@@ -6,7 +6,7 @@ Implementa el patrón MVC y Observer.
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QSpinBox, QLabel, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+    QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox, QCheckBox
 )
 from PyQt6.QtCore import QTimer, Qt
 from typing import Dict, Any, Optional
@@ -14,11 +14,19 @@ from .widgets.control_panel import PanelControl
 from .widgets.process_table import TablaProcesos
 from .gantt_widget import DiagramaGantt
 from .widgets.metrics_panel import PanelMetricas
+from .comparacion import VentanaComparacion
+from .instrumentacion import MonitorRendimiento
 from ..core.scheduler import PlanificadorRoundRobin, ObservadorSimulacion
-from ..core.process import FabricaProcesos, Proceso
+from ..core.process import FabricaProcesos, Proceso, EstadoProceso
+from ..core.ejecucion import (ConfiguracionSimulacion, resultado_planificador,
+                              transiciones_simulacion)
+from ..utils.cache_resultados import CacheResultados
+from ..utils.almacen_resultados import AlmacenResultados
 from ..config.settings import (WINDOW_TITLE, WINDOW_MIN_WIDTH, 
                              WINDOW_MIN_HEIGHT, SIMULATION_INTERVAL,
-                             SimulationState)
+                             SimulationState, RESULT_CACHE_DIR,
+                             RESULT_STORE_PATH, GANTT_VIEW)
+from contextlib import nullcontext
 from datetime import datetime
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment
@@ -29,7 +37,12 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
     Actúa como controlador en el patrón MVC y como observador de la simulación.
     """
     
-    def __init__(self):
+    def __init__(self, perfilado: bool = False, ruta_traza: Optional[str] = None):
+        """
+        Args:
+            perfilado: Mide pintado, observadores y bucle de eventos con un panel superpuesto
+            ruta_traza: Archivo donde se guarda la traza del perfilado al cerrar
+        """
         super().__init__()
         self.setWindowTitle(WINDOW_TITLE)
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
@@ -38,6 +51,16 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
         self.setup_ui()
         self.setup_timer()
         
+        # Instrumentación opcional del rendimiento de la interfaz
+        self.monitor: Optional[MonitorRendimiento] = None
+        if perfilado:
+            self.monitor = MonitorRendimiento(self, ruta_traza)
+            # La vista de matplotlib no tiene un contenido aparte: se mide el widget
+            contenido = getattr(self.diagrama_gantt, "contenido", self.diagrama_gantt)
+            self.monitor.instrumentar(contenido, type(contenido).__name__)
+            self.monitor.instrumentar(self.tabla_procesos, "TablaProcesos")
+            self.monitor.iniciar()
+        
         # Estado de la simulación
         self.planificador: Optional[PlanificadorRoundRobin] = None
         self.estado_simulacion = SimulationState.STOPPED
@@ -45,6 +68,11 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
         # Datos para el reporte
         self.historial_procesos = []
         self.ultima_metricas = {}
+        
+        # Caché de resultados compartida con las ejecuciones sin interfaz
+        self.cache = CacheResultados(directorio=RESULT_CACHE_DIR)
+        self.config_actual: Optional[ConfiguracionSimulacion] = None
+        self.almacen = AlmacenResultados(RESULT_STORE_PATH, tamano_lote=1)
     
     def setup_ui(self):
         """Configura la interfaz de usuario."""
@@ -76,6 +104,13 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
         panel_control.addWidget(label_procesos)
         panel_control.addWidget(self.spin_procesos)
         
+        # Repetir la carga anterior permite reutilizar su resultado en caché
+        self.check_repetir = QCheckBox("Repetir carga")
+        self.check_repetir.setEnabled(False)
+        self.check_repetir.toggled.connect(
+            lambda marcado: self.spin_procesos.setEnabled(not marcado))
+        panel_control.addWidget(self.check_repetir)
+        
         # Botones
         self.boton_iniciar = QPushButton("Iniciar")
         self.boton_iniciar.clicked.connect(self._iniciar_simulacion)
@@ -88,6 +123,9 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
         panel_control.addWidget(self.boton_iniciar)
         panel_control.addWidget(self.boton_pausar)
         panel_control.addWidget(self.boton_exportar)
+        self.boton_comparar = QPushButton("Comparar")
+        self.boton_comparar.clicked.connect(self._abrir_comparacion)
+        panel_control.addWidget(self.boton_comparar)
         
         panel_control.addStretch()
         
@@ -104,7 +142,12 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
         layout_principal.addWidget(self.tabla_procesos)
         
         # Diagrama de Gantt
-        self.diagrama_gantt = DiagramaGantt()
+        if GANTT_VIEW == "matplotlib":
+            # matplotlib solo se importa si se eligió esta vista
+            from .widgets.gantt_chart import DiagramaGantt as DiagramaGanttMatplotlib
+            self.diagrama_gantt = DiagramaGanttMatplotlib()
+        else:
+            self.diagrama_gantt = DiagramaGantt()
         layout_principal.addWidget(self.diagrama_gantt)
         
         # Panel de métricas
@@ -133,16 +176,31 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
         quantum = self.spin_quantum.value()
         self.planificador = PlanificadorRoundRobin(quantum)
         
-        # Crear procesos
-        num_procesos = self.spin_procesos.value()
-        fabrica = FabricaProcesos()
-        for _ in range(num_procesos):
-            proceso = fabrica.crear_proceso_aleatorio()
+        # Crear procesos (los de la carga anterior si se pidió repetirla)
+        if self.check_repetir.isChecked() and self.config_actual is not None:
+            procesos = self.config_actual.crear_procesos()
+        else:
+            fabrica = FabricaProcesos()
+            procesos = [fabrica.crear_proceso_aleatorio()
+                        for _ in range(self.spin_procesos.value())]
+        for proceso in procesos:
             self.planificador.agregar_proceso(proceso)
         
+        # Consultar la caché: si la carga ya se simuló, se muestra directamente
+        # el estado final sin animar la simulación
+        self.config_actual = ConfiguracionSimulacion.desde_procesos(
+            self.planificador.procesos, quantum=quantum)
+        resultado = self.cache.obtener(self.config_actual)
+        if resultado is not None:
+            self._mostrar_resultado(resultado)
+            return
+        self.statusBar().clearMessage()
+        
         # Configurar observadores
-        self.planificador.agregar_observador(self)
-        self.planificador.agregar_observador(self.diagrama_gantt)
+        for observador in (self, self.diagrama_gantt):
+            if self.monitor is not None:
+                observador = self.monitor.observador(observador)
+            self.planificador.agregar_observador(observador)
         
         # Limpiar historial
         self.historial_procesos = []
@@ -154,10 +212,59 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
         self.boton_exportar.setEnabled(False)
         self.spin_quantum.setEnabled(False)
         self.spin_procesos.setEnabled(False)
+        self.check_repetir.setEnabled(False)
         
         # Iniciar timer
         self.timer.start(1000)  # 1 segundo por tick
     
+    def _mostrar_resultado(self, resultado: Dict[str, Any]) -> None:
+        """
+        Muestra el estado final de la simulación actual a partir de la caché.
+
+        La caché no guarda el historial de estados, así que el diagrama de
+        Gantt se reconstruye con `transiciones_simulacion` (motor de eventos
+        para Round Robin) en lugar de animar tick a tick.
+
+        Args:
+            resultado: Resultado en caché de `config_actual`
+        """
+        procesos = self.config_actual.crear_procesos()
+        for proceso, datos in zip(procesos, resultado['procesos']):
+            proceso.estado = EstadoProceso.FINALIZADO
+            proceso.tiempo_restante = 0
+            proceso.tiempo_comienzo = datos['tiempo_comienzo']
+            proceso.tiempo_finalizacion = datos['tiempo_finalizacion']
+            proceso.tiempo_espera = datos['tiempo_espera']
+            proceso.tiempo_respuesta = datos['tiempo_respuesta']
+        self.actualizar({'procesos': procesos, 'metricas': resultado['metricas']})
+        transiciones, tiempo_final = transiciones_simulacion(self.config_actual)
+        finalizados = sorted(procesos, key=lambda p: p.tiempo_finalizacion)
+        self.diagrama_gantt.actualizar({'transiciones': transiciones,
+                                        'tiempo_actual': tiempo_final,
+                                        'procesos_finalizados': finalizados,
+                                        'proceso_actual': None})
+        self.statusBar().showMessage("Resultado obtenido de la caché")
+        self._finalizar_simulacion()
+    
+    def _finalizar_simulacion(self) -> None:
+        """Rehabilita los controles al terminar una simulación."""
+        self.boton_pausar.setEnabled(False)
+        self.boton_iniciar.setEnabled(True)
+        self.boton_exportar.setEnabled(True)
+        self.spin_quantum.setEnabled(True)
+        self.check_repetir.setEnabled(True)
+        self.spin_procesos.setEnabled(not self.check_repetir.isChecked())
+    
+    def _abrir_comparacion(self):
+        """Abre la comparación de planificadores con la carga actual."""
+        procesos = self.historial_procesos
+        if not procesos:
+            fabrica = FabricaProcesos()
+            procesos = [fabrica.crear_proceso_aleatorio()
+                        for _ in range(self.spin_procesos.value())]
+        self.ventana_comparacion = VentanaComparacion(procesos, self)
+        self.ventana_comparacion.show()
+    
     def _pausar_simulacion(self):
         """Pausa o reanuda la simulación."""
         if self.timer.isActive():
@@ -169,13 +276,17 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
     
     def _tick(self):
         """Ejecuta un tick de la simulación."""
-        if self.planificador and not self.planificador.tick():
+        medicion = (self.monitor.medir("tick", "simulacion")
+                    if self.monitor is not None else nullcontext())
+        with medicion:
+            continuar = self.planificador is None or self.planificador.tick()
+        if not continuar:
             self.timer.stop()
-            self.boton_pausar.setEnabled(False)
-            self.boton_iniciar.setEnabled(True)
-            self.boton_exportar.setEnabled(True)
-            self.spin_quantum.setEnabled(True)
-            self.spin_procesos.setEnabled(True)
+            if self.config_actual is not None:
+                resultado = resultado_planificador(self.planificador)
+                self.cache.guardar(self.config_actual, resultado)
+                self.almacen.guardar(self.config_actual, resultado)
+            self._finalizar_simulacion()
     
     def actualizar(self, datos: Dict[str, Any]) -> None:
         """
@@ -320,4 +431,10 @@ class VentanaPrincipal(QMainWindow, ObservadorSimulacion):
                 self,
                 "Error",
                 f"Error al exportar el reporte:\n{str(e)}"
-            ) 
\ No newline at end of file
+            )
+    
+    def closeEvent(self, event):
+        """Guarda la traza del perfilado (si está activo) al cerrar."""
+        if self.monitor is not None:
+            self.monitor.detener()
+        super().closeEvent(event)
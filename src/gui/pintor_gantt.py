@@ -0,0 +1,293 @@
+"""
+Dibujo del diagrama de Gantt sobre cualquier QPainter.
+
+`PintorGantt` solo depende de QtGui: lo usan tanto el widget interactivo
+(`DiagramaGanttContenido`) como el renderizado sin pantalla a PNG o SVG.
+Con zoom cercano dibuja cada intervalo de estado y, al alejarse, bandas de
+densidad tomadas de una pirámide de ocupación. Solo se recorre la región
+pedida, así que el costo de dibujo depende de los píxeles y no del tiempo
+simulado. Las consultas por instante (ayudas emergentes, cursor de tiempo)
+usan un `IndiceHistorial` que se construye bajo demanda.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from PyQt6.QtGui import QPainter, QColor, QPen, QImage
+from PyQt6.QtCore import Qt, QPointF, QRect, QRectF
+from ..core.historial import Transicion
+from ..core.piramide import PiramideOcupacion
+from ..core.indice_historial import IndiceHistorial
+
+class PintorGantt:
+    """
+    Estado de la vista y rutinas de dibujo del diagrama de Gantt.
+
+        transiciones: Cambios de estado por proceso (una fila por clave)
+        tiempo_maximo: Tiempo final de la línea de tiempo
+        inicio: Tiempo en el borde izquierdo del área de barras
+        pixeles_por_tick: Escala horizontal
+        ancho, alto: Tamaño total de la superficie de dibujo
+        cursor: Instante marcado con una línea vertical (None: sin cursor)
+    """
+
+    ALTURA_PROCESO = 30
+    ANCHO_UNIDAD_TIEMPO = 30
+    MARGEN = 50
+    # Por encima de esta escala se dibujan bandas de densidad
+    MAX_TICKS_POR_PIXEL_DETALLE = 2.0
+    # Por debajo de esta escala no se dibujan los bordes de cada tick
+    MIN_PIXELES_BORDES = 8.0
+
+    # Colores para los diferentes estados (RGB)
+    COLORES = {
+        'E': (46, 204, 113),  # Verde para ejecutando
+        'L': (241, 196, 15),  # Amarillo para listo
+        'F': (231, 76, 60),   # Rojo para finalizado
+    }
+
+    def __init__(self):
+        self.transiciones: Dict[str, List[Transicion]] = {}
+        self.tiempo_maximo = 0
+        self.inicio = 0.0
+        self.pixeles_por_tick = float(self.ANCHO_UNIDAD_TIEMPO)
+        self.ancho = 0
+        self.alto = 0
+        self.cursor: Optional[int] = None
+        self._piramide: Optional[PiramideOcupacion] = None
+        self._indice: Optional[IndiceHistorial] = None
+        # Claves de las filas y el historial del que salieron
+        self._claves: List[str] = []
+        self._claves_de: Optional[Dict[str, List[Transicion]]] = None
+        self._indice_claves: Optional[List[str]] = None
+        self.colores = {estado: QColor(*rgb) for estado, rgb in self.COLORES.items()}
+
+    def __getstate__(self) -> dict:
+        """Estado serializable (los QColor se reconstruyen al cargar)."""
+        estado = dict(self.__dict__)
+        del estado['colores']
+        return estado
+
+    def __setstate__(self, estado: dict) -> None:
+        self.__dict__.update(estado)
+        self.colores = {e: QColor(*rgb) for e, rgb in self.COLORES.items()}
+
+    @property
+    def num_procesos(self) -> int:
+        """Cantidad de filas del diagrama."""
+        return len(self.transiciones)
+
+    def altura_total(self) -> int:
+        """Altura necesaria para dibujar todas las filas con sus márgenes."""
+        return self.MARGEN * 2 + self.num_procesos * self.ALTURA_PROCESO
+
+    def piramide(self) -> PiramideOcupacion:
+        """Pirámide de ocupación del historial actual (se extiende si cambió)."""
+        if self._piramide is None:
+            self._piramide = PiramideOcupacion(self.transiciones, self.tiempo_maximo)
+        else:
+            # Durante una simulación solo se resumen los cambios nuevos
+            self._piramide.actualizar(self.transiciones, self.tiempo_maximo)
+        return self._piramide
+
+    def claves(self) -> List[str]:
+        """Claves de las filas, en orden (el historial solo agrega procesos al final)."""
+        if self._claves_de is not self.transiciones or len(self._claves) != len(self.transiciones):
+            self._claves = list(self.transiciones)
+            self._claves_de = self.transiciones
+        return self._claves
+
+    def indice(self) -> IndiceHistorial:
+        """Índice de consultas del historial actual (se reconstruye si cambió)."""
+        claves = self.claves()
+        if (self._indice is None or self._indice.tiempo_final != self.tiempo_maximo
+                or self._indice_claves is not claves):
+            self._indice = IndiceHistorial(self.transiciones, self.tiempo_maximo)
+            self._indice_claves = claves
+        return self._indice
+
+    def fila_en(self, y: float) -> Optional[str]:
+        """Clave del proceso dibujado en una coordenada y, si hay alguno."""
+        fila = int((y - self.MARGEN) // self.ALTURA_PROCESO)
+        if y < self.MARGEN or fila >= self.num_procesos:
+            return None
+        return self.claves()[fila]
+
+    def ticks_visibles(self) -> float:
+        """Cantidad de ticks que caben en el ancho del área de dibujo."""
+        return max(1, self.ancho - 2 * self.MARGEN) / self.pixeles_por_tick
+
+    def tiempo_en(self, x: float) -> float:
+        """Tiempo simulado correspondiente a una coordenada x."""
+        return self.inicio + (x - self.MARGEN) / self.pixeles_por_tick
+
+    def _x(self, tiempo: float) -> float:
+        """Coordenada x de un instante de tiempo."""
+        return self.MARGEN + (tiempo - self.inicio) * self.pixeles_por_tick
+
+    def dibujar(self, painter: QPainter, region: QRect) -> None:
+        """
+        Dibuja la parte del diagrama que cae dentro de una región.
+
+        Args:
+            painter: Painter sobre la superficie (en coordenadas del diagrama)
+            region: Rectángulo a dibujar
+        """
+        if not self.transiciones:
+            return
+
+        painter.save()
+        area = QRect(self.MARGEN, 0, max(0, self.ancho - 2 * self.MARGEN), self.alto)
+        painter.setClipRect(area.intersected(region))
+
+        # Solo las filas de procesos y los ticks dentro de la región, ampliada
+        # en el ancho del borde: el contorno de una barra que termina justo en
+        # el borde de la región (p. ej. de una franja o tesela) cae dentro
+        visible = region.adjusted(-1, -1, 1, 1)
+        filas = range(
+            max(0, (visible.top() - self.MARGEN) // self.ALTURA_PROCESO),
+            min(self.num_procesos,
+                (visible.bottom() - self.MARGEN) // self.ALTURA_PROCESO + 1)
+        )
+        desde = max(self.inicio, self.tiempo_en(visible.left()))
+        hasta = min(self.tiempo_maximo, self.inicio + self.ticks_visibles() + 1,
+                    self.tiempo_en(visible.right() + 1) + 1)
+
+        # Dibujar las barras del diagrama
+        if 1.0 / self.pixeles_por_tick > self.MAX_TICKS_POR_PIXEL_DETALLE:
+            self._dibujar_densidad(painter, filas, desde, hasta)
+        else:
+            self._dibujar_barras(painter, filas, desde, hasta)
+        if self.cursor is not None:
+            self._dibujar_cursor(painter)
+        painter.restore()
+
+        # Dibujar ejes
+        self._dibujar_ejes(painter)
+
+        # Dibujar etiquetas de tiempo
+        self._dibujar_etiquetas_tiempo(painter, region)
+
+        # Dibujar etiquetas de procesos
+        self._dibujar_etiquetas_procesos(painter, filas)
+
+    def _dibujar_ejes(self, painter: QPainter):
+        """Dibuja los ejes del diagrama."""
+        pen = QPen(Qt.GlobalColor.black, 2)
+        painter.setPen(pen)
+
+        # Eje Y
+        painter.drawLine(
+            self.MARGEN, self.MARGEN,
+            self.MARGEN, self.alto - self.MARGEN
+        )
+
+        # Eje X
+        painter.drawLine(
+            self.MARGEN, self.alto - self.MARGEN,
+            self.ancho - self.MARGEN, self.alto - self.MARGEN
+        )
+
+    def _dibujar_barras(self, painter: QPainter, filas: range, desde: float, hasta: float):
+        """Dibuja los intervalos de estado visibles de cada proceso."""
+        con_bordes = self.pixeles_por_tick >= self.MIN_PIXELES_BORDES
+        painter.setPen(QPen(Qt.GlobalColor.black, 1))
+        claves = self.claves()
+        for i in filas:
+            cambios = self.transiciones[claves[i]]
+            y = self.MARGEN + i * self.ALTURA_PROCESO
+            # Último cambio anterior o igual al inicio visible
+            k = max(0, bisect_right(cambios, (int(desde), '\uffff')) - 1)
+            while k < len(cambios) and cambios[k][0] < hasta:
+                inicio, estado = cambios[k]
+                fin = cambios[k + 1][0] if k + 1 < len(cambios) else self.tiempo_maximo
+                k += 1
+                if estado not in self.colores or fin <= desde:
+                    continue
+                inicio, fin = max(inicio, int(desde)), min(fin, int(hasta) + 1)
+                rect = QRectF(self._x(inicio), y, (fin - inicio) * self.pixeles_por_tick,
+                              self.ALTURA_PROCESO)
+                painter.fillRect(rect, self.colores[estado])
+                if con_bordes:
+                    # Un borde por tick, como en la vista original
+                    for t in range(inicio, fin):
+                        painter.drawRect(QRectF(self._x(t), y, self.pixeles_por_tick,
+                                                self.ALTURA_PROCESO))
+
+    def _paleta(self, estados: Sequence[str]) -> np.ndarray:
+        """Color ARGB de cada estado, más uno transparente al final."""
+        paleta = np.zeros(len(estados) + 1, dtype=np.uint32)
+        for j, estado in enumerate(estados):
+            r, g, b = self.COLORES[estado]
+            paleta[j] = 0xFF000000 | r << 16 | g << 8 | b
+        return paleta
+
+    def _dibujar_densidad(self, painter: QPainter, filas: range, desde: float, hasta: float):
+        """
+        Dibuja bandas con la fracción de tiempo en cada estado por cubeta.
+
+        Cada fila se arma como una imagen con una columna por cubeta, escalada
+        al ancho de sus cubetas: el costo no depende de la cantidad de franjas
+        y un SVG guarda una imagen por fila en vez de un rectángulo por cubeta.
+        """
+        piramide = self.piramide()
+        nivel, tamano = piramide.nivel_para(1.0 / self.pixeles_por_tick)
+        primera = int(desde // tamano)
+        ultima = int(-(-hasta // tamano))
+        if ultima <= primera:
+            return
+        paleta = self._paleta(piramide.estados)
+        centros = (np.arange(self.ALTURA_PROCESO, dtype=np.float32) + 0.5)[:, None]
+        destino = QRectF(self._x(primera * tamano), 0,
+                         (ultima - primera) * tamano * self.pixeles_por_tick, self.ALTURA_PROCESO)
+        for i in filas:
+            if i >= len(piramide.procesos):
+                break
+            datos = piramide.fila(nivel, i, primera, ultima)
+            # Franjas apiladas: cada píxel toma el estado cuya franja lo cubre
+            limites = np.cumsum(datos, axis=1) * self.ALTURA_PROCESO
+            indices = np.zeros((self.ALTURA_PROCESO, ultima - primera), dtype=np.uint8)
+            for j in range(len(piramide.estados)):
+                indices += centros >= limites[:, j]
+            pixeles = paleta[indices]
+            imagen = QImage(pixeles.data, ultima - primera, self.ALTURA_PROCESO,
+                            4 * (ultima - primera), QImage.Format.Format_ARGB32)
+            destino.moveTop(self.MARGEN + i * self.ALTURA_PROCESO)
+            painter.drawImage(destino, imagen)
+
+    def _dibujar_cursor(self, painter: QPainter):
+        """Dibuja la línea del instante seleccionado."""
+        painter.setPen(QPen(Qt.GlobalColor.blue, 2))
+        x = self._x(self.cursor + 0.5)
+        painter.drawLine(QPointF(x, self.MARGEN), QPointF(x, self.alto - self.MARGEN))
+
+    def _dibujar_etiquetas_tiempo(self, painter: QPainter, region: QRect):
+        """Dibuja las etiquetas de tiempo en el eje X."""
+        painter.setPen(QPen(Qt.GlobalColor.black))
+        # Paso 1, 2, 5, 10, 20, 50... con espacio para la etiqueta más larga
+        separacion = 20 + 8 * len(str(self.tiempo_maximo))
+        paso, multiplicadores, k = 1, (2, 2.5, 2), 0
+        while paso * self.pixeles_por_tick < separacion:
+            paso = int(paso * multiplicadores[k % 3])
+            k += 1
+        # Se empieza una etiqueta antes para no cortar las que cruzan el borde de la región
+        primero = max(self.inicio, self.tiempo_en(region.left() - separacion))
+        t = int(primero // paso) * paso
+        if t < primero:
+            t += paso
+        limite = min(self.tiempo_maximo, self.inicio + self.ticks_visibles(),
+                     self.tiempo_en(region.right() + 1))
+        while t <= limite:
+            x = self._x(t)
+            y = self.alto - self.MARGEN + 20
+            painter.drawText(int(x), y, str(t))
+            t += paso
+
+    def _dibujar_etiquetas_procesos(self, painter: QPainter, filas: range):
+        """Dibuja las etiquetas de procesos en el eje Y."""
+        painter.setPen(QPen(Qt.GlobalColor.black))
+        claves = self.claves()
+        for i in filas:
+            x = self.MARGEN - 30
+            y = self.MARGEN + i * self.ALTURA_PROCESO + self.ALTURA_PROCESO // 2
+            painter.drawText(x, y, claves[i])
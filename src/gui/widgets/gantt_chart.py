@@ -5,7 +5,10 @@ Widget del diagrama de Gantt.
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCore import QObject
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import PolyCollection
+from matplotlib.patches import Rectangle
+from typing import List
 from ...config.settings import PROCESS_COLORS
 from ...core.scheduler import ObservadorSimulacion
 
@@ -13,77 +16,184 @@ class DiagramaGantt(QWidget, ObservadorSimulacion):
     """
     Widget que muestra el diagrama de Gantt de la simulación.
     Implementa el patrón Observer para actualizar la vista.
+
+    Los artistas son persistentes: cada tick solo se agregan las barras de los
+    procesos que acaban de finalizar y se redibujan con blitting sobre un fondo
+    en caché. El dibujo completo solo ocurre al ampliar el eje X (que crece al
+    doble para amortizar el costo) o cuando Qt lo solicita, por ejemplo al
+    redimensionar.
     """
-    
+
+    TIEMPO_MINIMO_VISIBLE = 40
+
     def __init__(self, parent=None):
         QWidget.__init__(self, parent)
         ObservadorSimulacion.__init__(self)
         self.setup_ui()
-    
+
     def setup_ui(self):
         """Configura la interfaz del diagrama."""
         # Crear layout
         layout = QVBoxLayout(self)
-        
+
         # Crear figura y canvas
         self.figure, self.ax = plt.subplots(figsize=(10, 2))
         self.canvas = FigureCanvas(self.figure)
-        
+
+        # Configurar ejes una sola vez
+        self.ax.set_ylim(-0.5, 0.5)
+        self.ax.set_yticks([])
+        self.ax.set_xlabel("Tiempo")
+        self.ax.set_title("Diagrama de Gantt")
+        self.ax.grid(True, axis='x', linestyle='--', alpha=0.3)
+
+        # Barras ya integradas al fondo y barras nuevas (dibujadas por blitting)
+        self._barras = PolyCollection([], alpha=0.8)
+        self._barras_nuevas = PolyCollection([], alpha=0.8, animated=True)
+        self.ax.add_collection(self._barras)
+        self.ax.add_collection(self._barras_nuevas)
+
+        # Proceso en ejecución: cambia en cada tick, nunca forma parte del fondo
+        self._barra_actual = Rectangle((0, -0.4), 1, 0.8, alpha=0.8,
+                                       animated=True, visible=False)
+        self.ax.add_patch(self._barra_actual)
+        self._texto_actual = self.ax.text(0, 0, "", va='center', ha='center',
+                                          animated=True)
+
+        self.canvas.mpl_connect('draw_event', self._al_dibujar)
+
         # Agregar canvas al layout
         layout.addWidget(self.canvas)
-    
+
+        self._reiniciar()
+
+    def _reiniciar(self) -> None:
+        """Elimina todas las barras y deja el diagrama listo para una nueva simulación."""
+        for texto in getattr(self, '_textos', []):
+            texto.remove()
+        self._vertices: List[list] = []
+        self._colores: List[str] = []
+        self._pendientes = 0
+        self._textos: List = []
+        self._num_dibujados = 0
+        self._ultimo_tiempo = 0
+        self._fondo = None
+        self._limite_x = self.TIEMPO_MINIMO_VISIBLE
+        self._barras.set_verts([])
+        self._barras_nuevas.set_verts([])
+        self._barra_actual.set_visible(False)
+        self._texto_actual.set_text("")
+        self.ax.set_xlim(0, self._limite_x)
+
     def obtener_color_proceso(self, id_proceso: int) -> str:
         """
         Obtiene el color correspondiente a un proceso.
-        
+
         Args:
             id_proceso: ID del proceso
-            
+
         Returns:
             Color en formato hexadecimal
         """
         return PROCESS_COLORS[(id_proceso - 1) % len(PROCESS_COLORS)]
-    
+
     def actualizar(self, datos: dict) -> None:
         """
         Actualiza el diagrama de Gantt con los datos de la simulación.
-        
+
         Args:
             datos: Diccionario con los datos actualizados
         """
-        self.ax.clear()
-        
         # Obtener datos
         proceso_actual = datos.get('proceso_actual')
         procesos_finalizados = datos.get('procesos_finalizados', [])
         tiempo_actual = datos.get('tiempo_actual', 0)
-        
-        # Dibujar proceso actual
-        if proceso_actual:
-            color = self.obtener_color_proceso(proceso_actual.id)
-            self.ax.barh(0, 1, left=tiempo_actual,
-                        color=color, alpha=0.8)
-            self.ax.text(tiempo_actual + 0.5, 0,
-                        f"P{proceso_actual.id}",
-                        va='center', ha='center')
-        
-        # Dibujar procesos finalizados
-        for proceso in procesos_finalizados:
-            color = self.obtener_color_proceso(proceso.id)
-            self.ax.barh(0, proceso.tiempo_rafaga,
-                        left=proceso.tiempo_finalizacion - proceso.tiempo_rafaga,
-                        color=color, alpha=0.8)
-            self.ax.text(proceso.tiempo_finalizacion - proceso.tiempo_rafaga + 
-                        proceso.tiempo_rafaga/2, 0,
-                        f"P{proceso.id}", va='center', ha='center')
-        
-        # Configurar ejes
-        self.ax.set_xlim(0, max(tiempo_actual + 1, 40))  # Mínimo 40 unidades de tiempo
-        self.ax.set_ylim(-0.5, 0.5)
-        self.ax.set_yticks([])
-        self.ax.set_xlabel("Tiempo")
-        self.ax.set_title("Diagrama de Gantt")
-        self.ax.grid(True, axis='x', linestyle='--', alpha=0.3)
-        
-        # Actualizar canvas
-        self.canvas.draw() 
\ No newline at end of file
+
+        # Una nueva simulación reinicia el diagrama
+        if (tiempo_actual < self._ultimo_tiempo or
+                len(procesos_finalizados) < self._num_dibujados):
+            self._reiniciar()
+        self._ultimo_tiempo = tiempo_actual
+
+        # Agregar solo los procesos que finalizaron desde la última actualización
+        nuevos = procesos_finalizados[self._num_dibujados:]
+        self._num_dibujados = len(procesos_finalizados)
+        inicio_nuevos = len(self._vertices)
+        for proceso in nuevos:
+            izquierda = proceso.tiempo_finalizacion - proceso.tiempo_ejecucion
+            derecha = proceso.tiempo_finalizacion
+            self._vertices.append([(izquierda, -0.4), (izquierda, 0.4),
+                                   (derecha, 0.4), (derecha, -0.4)])
+            self._colores.append(self.obtener_color_proceso(proceso.id))
+            self._textos.append(self.ax.text(
+                izquierda + proceso.tiempo_ejecucion / 2, 0,
+                f"P{proceso.id}", va='center', ha='center'))
+        self._pendientes += len(nuevos)
+
+        self._actualizar_barra_actual(proceso_actual, tiempo_actual)
+
+        # Ampliar el eje X al doble evita redibujar todo en cada tick
+        if tiempo_actual + 1 > self._limite_x:
+            self._limite_x = max(self._limite_x * 2, tiempo_actual + 1)
+            self.ax.set_xlim(0, self._limite_x)
+            self._fondo = None
+
+        if self._fondo is None:
+            self._integrar_pendientes()
+            self.canvas.draw()
+            return
+
+        # Blitting: restaurar el fondo y dibujar únicamente lo nuevo
+        self.canvas.restore_region(self._fondo)
+        if nuevos:
+            self._barras_nuevas.set_verts(self._vertices[inicio_nuevos:])
+            self._barras_nuevas.set_facecolors(self._colores[inicio_nuevos:])
+            self.ax.draw_artist(self._barras_nuevas)
+            for texto in self._textos[inicio_nuevos:]:
+                self.ax.draw_artist(texto)
+            self._fondo = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._dibujar_animados()
+        self.canvas.blit(self.ax.bbox)
+
+    def _actualizar_barra_actual(self, proceso_actual, tiempo_actual: int) -> None:
+        """Reposiciona la barra y la etiqueta del proceso en ejecución."""
+        if proceso_actual is None:
+            self._barra_actual.set_visible(False)
+            self._texto_actual.set_text("")
+            return
+        self._barra_actual.set_x(tiempo_actual)
+        self._barra_actual.set_facecolor(self.obtener_color_proceso(proceso_actual.id))
+        self._barra_actual.set_visible(True)
+        self._texto_actual.set_position((tiempo_actual + 0.5, 0))
+        self._texto_actual.set_text(f"P{proceso_actual.id}")
+
+    def _integrar_pendientes(self) -> None:
+        """Pasa las barras dibujadas por blitting a la colección del fondo."""
+        if not self._pendientes:
+            return
+        self._barras.set_verts(self._vertices)
+        self._barras.set_facecolors(self._colores)
+        self._barras_nuevas.set_verts([])
+        self._pendientes = 0
+
+    def _dibujar_animados(self) -> None:
+        """Dibuja los artistas que cambian en cada tick sobre el fondo actual."""
+        self.ax.draw_artist(self._barra_actual)
+        self.ax.draw_artist(self._texto_actual)
+
+    def _al_dibujar(self, evento) -> None:
+        """
+        Guarda el fondo tras cada dibujo completo del canvas.
+
+        Args:
+            evento: Evento 'draw_event' de matplotlib
+        """
+        if self._pendientes:
+            # Un dibujo externo (p. ej. redimensionar) no incluye las barras
+            # agregadas por blitting: se integran y se programa otro dibujo.
+            self._integrar_pendientes()
+            self._fondo = None
+            self.canvas.draw_idle()
+            return
+        self._fondo = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._dibujar_animados()
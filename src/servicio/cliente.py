@@ -0,0 +1,43 @@
+"""
+Cliente asyncio para el servicio de simulación.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict
+from ..config.settings import SERVICE_HOST, SERVICE_PORT
+
+# Mensajes con los que termina un trabajo
+MENSAJES_FINALES = {"resultado", "cancelado", "error", "rechazado"}
+
+async def simular(trabajo: Dict[str, Any], host: str = SERVICE_HOST,
+                  puerto: int = SERVICE_PORT, detalle: bool = False) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Envía un trabajo al servicio y devuelve sus mensajes a medida que llegan.
+
+    Args:
+        trabajo: Diccionario con 'procesos', 'planificador' y 'quantum'
+        host: Dirección del servicio
+        puerto: Puerto del servicio
+        detalle: Si True, el resultado incluye los datos de cada proceso
+
+    Yields:
+        Mensajes del servidor; el último es de tipo resultado, cancelado,
+        error o rechazado
+    """
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    try:
+        escritor.write(json.dumps({"tipo": "enviar", "trabajo": trabajo,
+                                   "detalle": detalle}).encode() + b"\n")
+        await escritor.drain()
+        while True:
+            linea = await lector.readline()
+            if not linea:
+                return
+            mensaje = json.loads(linea)
+            yield mensaje
+            if mensaje["tipo"] in MENSAJES_FINALES:
+                return
+    finally:
+        escritor.close()
+        await escritor.wait_closed()
@@ -0,0 +1,428 @@
+"""
+Cola de trabajos compartida en un archivo SQLite.
+
+Permite repartir un barrido de simulaciones entre varias máquinas sin un
+intermediario externo: basta con que todas vean el mismo archivo (por ejemplo,
+en un disco compartido). Cada trabajador reclama un trabajo con un préstamo
+(lease) de duración limitada y lo renueva desde un hilo mientras simula
+(la simulación usa el motor rápido, sin callback de progreso); si el
+trabajador muere, el préstamo vence y el trabajo vuelve a la cola hasta agotar sus
+intentos. Los resultados compactos se escriben en la misma base.
+
+Los préstamos usan el reloj de cada máquina, por lo que los relojes deben
+estar razonablemente sincronizados. Sobre sistemas de archivos en red se
+usa el diario clásico de SQLite (no WAL), que solo requiere bloqueos de
+archivo.
+
+Uso desde la línea de comandos:
+    python -m src.servicio.cola_trabajos encolar cola.db barrido.json --lote b1
+    python -m src.servicio.cola_trabajos trabajador cola.db --procesos 4
+    python -m src.servicio.cola_trabajos estado cola.db
+    python -m src.servicio.cola_trabajos resultados cola.db --lote b1
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+from ..core.ejecucion import ConfiguracionSimulacion, ejecutar_simulacion
+from ..utils.cache_resultados import CacheResultados
+from ..config.settings import (WORK_QUEUE_LEASE_SECONDS, WORK_QUEUE_MAX_ATTEMPTS,
+                               WORK_QUEUE_POLL_INTERVAL, WORK_QUEUE_STALL_SECONDS,
+                               RESULT_CACHE_DIR)
+
+ESTADOS_TRABAJO = ("pendiente", "en_curso", "terminado", "fallido")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS trabajos (
+    id INTEGER PRIMARY KEY,
+    lote TEXT NOT NULL,
+    posicion INTEGER NOT NULL,
+    config TEXT NOT NULL,
+    estado TEXT NOT NULL DEFAULT 'pendiente',
+    intentos INTEGER NOT NULL DEFAULT 0,
+    trabajador TEXT,
+    vence REAL,
+    resultado TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS trabajos_estado ON trabajos (estado, id);
+CREATE INDEX IF NOT EXISTS trabajos_lote ON trabajos (lote, posicion);
+"""
+
+class ColaTrabajos:
+    """
+    Cola de trabajos de simulación con préstamos, respaldada por SQLite.
+
+    Cada proceso debe abrir su propia instancia sobre la misma ruta.
+    """
+
+    def __init__(self, ruta: str, max_intentos: int = WORK_QUEUE_MAX_ATTEMPTS):
+        self.ruta = ruta
+        self.max_intentos = max_intentos
+        # Sin transacciones implícitas: cada operación abre la suya
+        self._conexion = sqlite3.connect(ruta, timeout=60.0, isolation_level=None)
+        self._conexion.executescript(_ESQUEMA)
+
+    def cerrar(self) -> None:
+        """Cierra la conexión con la base."""
+        self._conexion.close()
+
+    def _transaccion(self) -> sqlite3.Cursor:
+        """Abre una transacción que toma el bloqueo de escritura de inmediato."""
+        cursor = self._conexion.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        return cursor
+
+    def encolar(self, configs: List[ConfiguracionSimulacion],
+                lote: Optional[str] = None) -> str:
+        """
+        Agrega un barrido de simulaciones a la cola.
+
+        Args:
+            configs: Configuraciones a simular, en el orden del barrido
+            lote: Nombre del lote (por defecto, uno aleatorio)
+
+        Returns:
+            Nombre del lote, usado para consultar sus resultados
+        """
+        lote = lote or uuid.uuid4().hex[:12]
+        cursor = self._transaccion()
+        try:
+            inicio = cursor.execute(
+                "SELECT COALESCE(MAX(posicion) + 1, 0) FROM trabajos WHERE lote = ?",
+                (lote,)).fetchone()[0]
+            cursor.executemany(
+                "INSERT INTO trabajos (lote, posicion, config) VALUES (?, ?, ?)",
+                [(lote, inicio + i, json.dumps(config.a_dict(), separators=(",", ":")))
+                 for i, config in enumerate(configs)])
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        return lote
+
+    def reclamar(self, trabajador: str,
+                 duracion: float = WORK_QUEUE_LEASE_SECONDS
+                 ) -> Optional[Tuple[int, ConfiguracionSimulacion]]:
+        """
+        Toma el siguiente trabajo pendiente con un préstamo.
+
+        Antes de buscar, devuelve a la cola los trabajos cuyo préstamo venció
+        (o los marca como fallidos si agotaron sus intentos).
+
+        Args:
+            trabajador: Identificador del trabajador
+            duracion: Segundos de validez del préstamo
+
+        Returns:
+            (id del trabajo, configuración) o None si no hay trabajos pendientes
+        """
+        ahora = time.time()
+        cursor = self._transaccion()
+        try:
+            cursor.execute(
+                "UPDATE trabajos SET estado = CASE WHEN intentos >= ? THEN 'fallido' "
+                "ELSE 'pendiente' END, trabajador = NULL, vence = NULL, "
+                "error = 'préstamo vencido' WHERE estado = 'en_curso' AND vence < ?",
+                (self.max_intentos, ahora))
+            reclamado = None
+            while reclamado is None:
+                fila = cursor.execute(
+                    "SELECT id, config FROM trabajos WHERE estado = 'pendiente' "
+                    "ORDER BY id LIMIT 1").fetchone()
+                if fila is None:
+                    break
+                try:
+                    reclamado = (fila[0], ConfiguracionSimulacion.desde_dict(json.loads(fila[1])))
+                except (ValueError, KeyError, TypeError, IndexError) as error:
+                    # Una configuración inválida no se reintenta
+                    cursor.execute(
+                        "UPDATE trabajos SET estado = 'fallido', error = ? WHERE id = ?",
+                        (f"Configuración inválida: {error}", fila[0]))
+                    continue
+                cursor.execute(
+                    "UPDATE trabajos SET estado = 'en_curso', trabajador = ?, vence = ?, "
+                    "intentos = intentos + 1 WHERE id = ?",
+                    (trabajador, ahora + duracion, fila[0]))
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        return reclamado
+
+    def _actualizar_propio(self, sql: str, parametros: tuple,
+                           id_trabajo: int, trabajador: str) -> bool:
+        """Actualiza un trabajo solo si sigue prestado a este trabajador."""
+        cursor = self._conexion.execute(
+            sql + " WHERE id = ? AND trabajador = ? AND estado = 'en_curso'",
+            parametros + (id_trabajo, trabajador))
+        return cursor.rowcount == 1
+
+    def renovar(self, id_trabajo: int, trabajador: str,
+                duracion: float = WORK_QUEUE_LEASE_SECONDS) -> bool:
+        """
+        Extiende el préstamo de un trabajo.
+
+        Returns:
+            False si el préstamo ya se perdió (venció y otro lo reclamó)
+        """
+        return self._actualizar_propio("UPDATE trabajos SET vence = ?",
+                                       (time.time() + duracion,), id_trabajo, trabajador)
+
+    def completar(self, id_trabajo: int, trabajador: str,
+                  resultado: Dict[str, Any]) -> bool:
+        """
+        Guarda el resultado de un trabajo terminado.
+
+        Returns:
+            False si el préstamo ya se perdió; el resultado se descarta
+        """
+        return self._actualizar_propio(
+            "UPDATE trabajos SET estado = 'terminado', vence = NULL, error = NULL, "
+            "resultado = ?", (json.dumps(resultado, separators=(",", ":")),),
+            id_trabajo, trabajador)
+
+    def fallar(self, id_trabajo: int, trabajador: str, error: str) -> bool:
+        """
+        Registra un error; el trabajo se reintenta si le quedan intentos.
+
+        Returns:
+            False si el préstamo ya se perdió
+        """
+        return self._actualizar_propio(
+            "UPDATE trabajos SET estado = CASE WHEN intentos >= ? THEN 'fallido' "
+            "ELSE 'pendiente' END, trabajador = NULL, vence = NULL, error = ?",
+            (self.max_intentos, error), id_trabajo, trabajador)
+
+    def estado(self, lote: Optional[str] = None) -> Dict[str, int]:
+        """
+        Cuenta los trabajos por estado.
+
+        Args:
+            lote: Lote a consultar (por defecto, toda la cola)
+
+        Returns:
+            Cantidad de trabajos en cada estado
+        """
+        sql = "SELECT estado, COUNT(*) FROM trabajos"
+        parametros: tuple = ()
+        if lote is not None:
+            sql += " WHERE lote = ?"
+            parametros = (lote,)
+        conteo = dict.fromkeys(ESTADOS_TRABAJO, 0)
+        conteo.update(self._conexion.execute(sql + " GROUP BY estado", parametros).fetchall())
+        return conteo
+
+    def resultados(self, lote: str) -> List[Optional[Dict[str, Any]]]:
+        """
+        Devuelve los resultados de un lote en el orden en que se encoló.
+
+        Args:
+            lote: Nombre del lote
+
+        Returns:
+            Resultado de cada trabajo, o None si no terminó (aún)
+        """
+        filas = self._conexion.execute(
+            "SELECT resultado FROM trabajos WHERE lote = ? ORDER BY posicion",
+            (lote,)).fetchall()
+        return [None if r is None else json.loads(r) for (r,) in filas]
+
+    def _avance(self, lote: str) -> List[tuple]:
+        """Huella del avance de un lote: cambia al terminar, reclamar o renovar trabajos."""
+        return self._conexion.execute(
+            "SELECT estado, COUNT(*), SUM(intentos), MAX(vence) FROM trabajos "
+            "WHERE lote = ? GROUP BY estado ORDER BY estado", (lote,)).fetchall()
+
+    def esperar(self, lote: str, intervalo: float = WORK_QUEUE_POLL_INTERVAL,
+                tiempo_limite: Optional[float] = None,
+                max_sin_avance: Optional[float] = WORK_QUEUE_STALL_SECONDS
+                ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Espera a que todos los trabajos de un lote terminen o fallen.
+
+        Args:
+            lote: Nombre del lote
+            intervalo: Segundos entre consultas
+            tiempo_limite: Segundos máximos de espera (por defecto, sin límite)
+            max_sin_avance: Segundos máximos sin que ningún trabajo del lote
+                termine, se reclame o renueve su préstamo, es decir, sin
+                trabajadores vivos (None: sin límite)
+
+        Returns:
+            Resultados del lote, como en `resultados`
+
+        Raises:
+            TimeoutError: Si se agota el tiempo límite o el lote deja de avanzar
+        """
+        ahora = time.monotonic()
+        limite = None if tiempo_limite is None else ahora + tiempo_limite
+        avance, ultimo_avance = None, ahora
+        while True:
+            conteo = self.estado(lote)
+            if conteo["pendiente"] == 0 and conteo["en_curso"] == 0:
+                return self.resultados(lote)
+            ahora = time.monotonic()
+            if limite is not None and ahora > limite:
+                raise TimeoutError(f"El lote {lote} no terminó: {conteo}")
+            huella = self._avance(lote)
+            if huella != avance:
+                avance, ultimo_avance = huella, ahora
+            elif max_sin_avance is not None and ahora - ultimo_avance > max_sin_avance:
+                raise TimeoutError(f"El lote {lote} no avanza hace {ahora - ultimo_avance:.0f} s "
+                                   f"(¿hay trabajadores?): {conteo}")
+            time.sleep(intervalo)
+
+class _Latido:
+    """
+    Renueva el préstamo de un trabajo desde un hilo mientras se simula.
+
+    El hilo abre su propia conexión (las de SQLite no se comparten entre
+    hilos) y renueva cada tercio de la duración del préstamo. Si el préstamo
+    se pierde deja de renovar y marca `perdido`.
+    """
+
+    def __init__(self, ruta: str, id_trabajo: int, trabajador: str, duracion: float):
+        self.ruta = ruta
+        self.id_trabajo = id_trabajo
+        self.trabajador = trabajador
+        self.duracion = duracion
+        self.perdido = False
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._renovar, daemon=True)
+
+    def __enter__(self) -> "_Latido":
+        self._hilo.start()
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self._detener.set()
+        self._hilo.join()
+
+    def _renovar(self) -> None:
+        """Bucle del hilo: renueva hasta que se detiene o se pierde el préstamo."""
+        cola = ColaTrabajos(self.ruta)
+        try:
+            while not self._detener.wait(self.duracion / 3):
+                try:
+                    if not cola.renovar(self.id_trabajo, self.trabajador, self.duracion):
+                        self.perdido = True
+                        return
+                except sqlite3.OperationalError:
+                    # Base bloqueada por más que el timeout: se reintenta en el próximo latido
+                    continue
+        finally:
+            cola.cerrar()
+
+def ejecutar_trabajador(ruta: str, nombre: Optional[str] = None,
+                        duracion: float = WORK_QUEUE_LEASE_SECONDS,
+                        intervalo: float = WORK_QUEUE_POLL_INTERVAL,
+                        esperar_nuevos: bool = False, cache=None) -> int:
+    """
+    Procesa trabajos de la cola hasta que se vacía.
+
+    El préstamo se renueva desde un hilo (`_Latido`) para que la simulación
+    use el motor rápido; si se pierde, el resultado se descarta.
+
+    Args:
+        ruta: Archivo SQLite de la cola
+        nombre: Identificador del trabajador (por defecto, host y pid)
+        duracion: Segundos de validez de cada préstamo
+        intervalo: Segundos entre consultas cuando no hay trabajos pendientes
+        esperar_nuevos: Si es True, no termina al vaciarse la cola
+        cache: CacheResultados opcional consultada antes de simular
+
+    Returns:
+        Cantidad de trabajos completados por este trabajador
+    """
+    nombre = nombre or f"{socket.gethostname()}:{os.getpid()}"
+    cola = ColaTrabajos(ruta)
+    completados = 0
+    try:
+        while True:
+            reclamado = cola.reclamar(nombre, duracion)
+            if reclamado is None:
+                conteo = cola.estado()
+                # Los trabajos en curso de otros pueden volver si su préstamo vence
+                if not esperar_nuevos and conteo["pendiente"] == 0 and conteo["en_curso"] == 0:
+                    return completados
+                time.sleep(intervalo)
+                continue
+
+            id_trabajo, config = reclamado
+            try:
+                with _Latido(ruta, id_trabajo, nombre, duracion) as latido:
+                    resultado = ejecutar_simulacion(config, cache=cache)
+            except Exception as error:
+                cola.fallar(id_trabajo, nombre, f"{type(error).__name__}: {error}")
+                continue
+            if latido.perdido:
+                continue
+            if cola.completar(id_trabajo, nombre, resultado):
+                completados += 1
+    finally:
+        cola.cerrar()
+
+def _trabajador_local(ruta: str, esperar_nuevos: bool, usar_cache: bool) -> None:
+    """Proceso trabajador lanzado por la línea de comandos."""
+    cache = CacheResultados(directorio=RESULT_CACHE_DIR) if usar_cache else None
+    ejecutar_trabajador(ruta, esperar_nuevos=esperar_nuevos, cache=cache)
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Cola de trabajos de simulación en SQLite")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    encolar = comandos.add_parser("encolar", help="Agrega un barrido desde un archivo JSON")
+    encolar.add_argument("cola")
+    encolar.add_argument("archivo", help="Lista JSON de configuraciones")
+    encolar.add_argument("--lote")
+
+    trabajador = comandos.add_parser("trabajador", help="Procesa trabajos de la cola")
+    trabajador.add_argument("cola")
+    trabajador.add_argument("--procesos", type=int, default=1)
+    trabajador.add_argument("--esperar", action="store_true",
+                            help="No terminar cuando la cola se vacía")
+    trabajador.add_argument("--sin-cache", action="store_true")
+
+    estado = comandos.add_parser("estado", help="Muestra los trabajos por estado")
+    estado.add_argument("cola")
+    estado.add_argument("--lote")
+
+    resultados = comandos.add_parser("resultados", help="Imprime los resultados de un lote")
+    resultados.add_argument("cola")
+    resultados.add_argument("--lote", required=True)
+
+    args = parser.parse_args()
+    if args.comando == "trabajador":
+        procesos = [multiprocessing.Process(target=_trabajador_local,
+                                            args=(args.cola, args.esperar, not args.sin_cache))
+                    for _ in range(args.procesos)]
+        for proceso in procesos:
+            proceso.start()
+        for proceso in procesos:
+            proceso.join()
+        return
+
+    cola = ColaTrabajos(args.cola)
+    try:
+        if args.comando == "encolar":
+            with open(args.archivo, encoding="utf-8") as archivo:
+                configs = [ConfiguracionSimulacion.desde_dict(d) for d in json.load(archivo)]
+            print(cola.encolar(configs, args.lote))
+        elif args.comando == "estado":
+            print(json.dumps(cola.estado(args.lote)))
+        else:
+            print(json.dumps(cola.resultados(args.lote)))
+    finally:
+        cola.cerrar()
+
+if __name__ == "__main__":
+    main()
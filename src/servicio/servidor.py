@@ -0,0 +1,392 @@
+"""
+Servicio local de simulación basado en asyncio.
+
+Acepta trabajos de simulación por TCP (un objeto JSON por línea), los ejecuta
+en un pool de procesos compartido y devuelve a cada cliente el progreso
+(limitado en frecuencia) y las métricas finales.
+
+Mensajes del cliente:
+    {"tipo": "enviar", "trabajo": {"procesos": [...], "planificador": ..., "quantum": ...}}
+    {"tipo": "cancelar", "id": "<id del trabajo>"}
+
+Mensajes del servidor:
+    aceptado, rechazado, progreso, resultado, cancelado, error
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+from ..core.ejecucion import (ConfiguracionSimulacion, SimulacionCancelada,
+                              ejecutar_simulacion)
+from ..utils.cache_resultados import CacheResultados
+from ..config.settings import (SERVICE_HOST, SERVICE_PORT, SERVICE_MAX_WORKERS,
+                               SERVICE_QUEUE_SIZE, SERVICE_MAX_JOBS_PER_CLIENT,
+                               SERVICE_PROGRESS_MIN_INTERVAL, SERVICE_CLIENT_BUFFER,
+                               RESULT_CACHE_DIR)
+
+# Estado global de cada proceso trabajador (lo fija el inicializador del pool)
+_cola_progreso = None
+_cancelados = None
+
+def _inicializar_trabajador(cola_progreso, cancelados) -> None:
+    """Guarda los canales compartidos en el proceso trabajador."""
+    global _cola_progreso, _cancelados
+    _cola_progreso = cola_progreso
+    _cancelados = cancelados
+
+def _calentar_trabajador() -> None:
+    """Tarea vacía usada para arrancar los procesos del pool por adelantado."""
+
+def _ejecutar_trabajo(id_trabajo: str, config: ConfiguracionSimulacion) -> Dict[str, Any]:
+    """
+    Ejecuta un trabajo dentro de un proceso trabajador.
+
+    Args:
+        id_trabajo: Identificador del trabajo
+        config: Configuración de la simulación
+
+    Returns:
+        Resultado de la simulación
+    """
+    def progreso(avance: Dict[str, Any]) -> None:
+        if _cancelados.get(id_trabajo):
+            raise SimulacionCancelada(id_trabajo)
+        _cola_progreso.put((id_trabajo, avance))
+
+    return ejecutar_simulacion(config, progreso)
+
+class _Cliente:
+    """
+    Conexión de un cliente con su buffer de salida.
+
+    Ningún envío espera al socket: los mensajes de progreso se descartan si
+    hay SERVICE_CLIENT_BUFFER pendientes y los que no pueden perderse se
+    encolan sin límite, en orden, detrás de ellos. Tras la desconexión todo
+    se descarta, así que un cliente lento o desaparecido nunca bloquea a un
+    despachador.
+    """
+
+    def __init__(self, escritor: asyncio.StreamWriter):
+        self.escritor = escritor
+        # (mensaje, descartable) en orden de envío
+        self.salida: Deque[Tuple[Optional[Dict[str, Any]], bool]] = deque()
+        self._descartables = 0
+        self._hay_salida = asyncio.Event()
+        self._con_espacio = asyncio.Event()
+        self.trabajos: Set[str] = set()
+        self.desconectado = False
+
+    def _encolar(self, mensaje: Optional[Dict[str, Any]], descartable: bool) -> None:
+        """Agrega un mensaje al buffer y despierta al escritor."""
+        self.salida.append((mensaje, descartable))
+        self._descartables += descartable
+        self._hay_salida.set()
+
+    def enviar_sin_esperar(self, mensaje: Dict[str, Any]) -> bool:
+        """Encola un mensaje descartable; devuelve False si el buffer está lleno."""
+        if self.desconectado or self._descartables >= SERVICE_CLIENT_BUFFER:
+            return False
+        self._encolar(mensaje, True)
+        return True
+
+    def enviar(self, mensaje: Dict[str, Any]) -> None:
+        """Encola un mensaje que no puede perderse (se descarta si el cliente se fue)."""
+        if not self.desconectado:
+            self._encolar(mensaje, False)
+
+    async def esperar_espacio(self) -> None:
+        """Espera a que el escritor vacíe el buffer (control de flujo de la lectura)."""
+        while len(self.salida) >= SERVICE_CLIENT_BUFFER and not self.desconectado:
+            self._con_espacio.clear()
+            await self._con_espacio.wait()
+
+    def desconectar(self) -> None:
+        """Descarta lo pendiente y hace terminar al escritor."""
+        self.desconectado = True
+        self.salida.clear()
+        self._descartables = 0
+        self._encolar(None, False)
+        self._con_espacio.set()
+
+    async def escribir(self) -> None:
+        """Vuelca el buffer al socket respetando el control de flujo."""
+        while True:
+            while not self.salida:
+                self._hay_salida.clear()
+                await self._hay_salida.wait()
+            mensaje, descartable = self.salida.popleft()
+            self._descartables -= descartable
+            if len(self.salida) < SERVICE_CLIENT_BUFFER:
+                self._con_espacio.set()
+            if mensaje is None:
+                return
+            self.escritor.write(json.dumps(mensaje).encode() + b"\n")
+            await self.escritor.drain()
+
+class _Trabajo:
+    """Trabajo aceptado por el servicio."""
+
+    def __init__(self, id_trabajo: str, config: ConfiguracionSimulacion,
+                 cliente: _Cliente, detalle: bool):
+        self.id = id_trabajo
+        self.config = config
+        self.cliente = cliente
+        self.detalle = detalle
+        self.cancelado = False
+        self.ultimo_progreso = 0.0
+
+class ServicioSimulacion:
+    """
+    Servidor asyncio que reparte simulaciones en un pool de procesos compartido.
+
+    La cola de trabajos es acotada (los envíos con la cola llena se rechazan),
+    cada conexión tiene un límite de trabajos activos y los mensajes de
+    progreso se descartan si el cliente no consume su buffer a tiempo.
+    """
+
+    def __init__(self, max_trabajadores: int = SERVICE_MAX_WORKERS,
+                 tamano_cola: int = SERVICE_QUEUE_SIZE,
+                 max_trabajos_por_cliente: int = SERVICE_MAX_JOBS_PER_CLIENT,
+                 intervalo_progreso: float = SERVICE_PROGRESS_MIN_INTERVAL,
+                 cache: Optional[CacheResultados] = None):
+        self.cache = cache
+        self.max_trabajadores = max_trabajadores
+        self.max_trabajos_por_cliente = max_trabajos_por_cliente
+        self.intervalo_progreso = intervalo_progreso
+        self._cola: asyncio.Queue = asyncio.Queue(maxsize=tamano_cola)
+        self._trabajos: Dict[str, _Trabajo] = {}
+        self._conexiones: Set[asyncio.Task] = set()
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._tareas = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+
+    async def iniciar(self, host: str = SERVICE_HOST, puerto: int = SERVICE_PORT) -> asyncio.AbstractServer:
+        """
+        Arranca el pool de trabajadores y el servidor TCP.
+
+        Args:
+            host: Dirección en la que escuchar
+            puerto: Puerto TCP (0 elige uno libre)
+
+        Returns:
+            El servidor asyncio en ejecución
+        """
+        loop = asyncio.get_running_loop()
+        self._manager = multiprocessing.Manager()
+        self._cancelados = self._manager.dict()
+        self._cola_progreso = self._manager.Queue()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_trabajadores,
+            initializer=_inicializar_trabajador,
+            initargs=(self._cola_progreso, self._cancelados)
+        )
+        # Pool caliente: los procesos existen antes del primer trabajo
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _calentar_trabajador)
+                               for _ in range(self.max_trabajadores)))
+
+        threading.Thread(target=self._leer_progreso, args=(loop,), daemon=True).start()
+        self._tareas = [asyncio.create_task(self._despachar())
+                        for _ in range(self.max_trabajadores)]
+        self._servidor = await asyncio.start_server(self._atender_cliente, host, puerto)
+        return self._servidor
+
+    async def cerrar(self) -> None:
+        """Detiene el servidor, los despachadores y el pool."""
+        if self._servidor is not None:
+            self._servidor.close()
+        for conexion in list(self._conexiones):
+            conexion.cancel()
+        await asyncio.gather(*self._conexiones, return_exceptions=True)
+        if self._servidor is not None:
+            await self._servidor.wait_closed()
+        for tarea in self._tareas:
+            tarea.cancel()
+        for trabajo in self._trabajos.values():
+            self._cancelados[trabajo.id] = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._manager is not None:
+            self._cola_progreso.put(None)
+            self._manager.shutdown()
+
+    def _leer_progreso(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Hilo que pasa el progreso de los trabajadores al bucle de eventos."""
+        while True:
+            try:
+                mensaje = self._cola_progreso.get()
+            except (EOFError, OSError):
+                return
+            if mensaje is None:
+                return
+            loop.call_soon_threadsafe(self._entregar_progreso, *mensaje)
+
+    def _entregar_progreso(self, id_trabajo: str, avance: Dict[str, Any]) -> None:
+        """Reenvía el progreso de un trabajo respetando la frecuencia máxima."""
+        trabajo = self._trabajos.get(id_trabajo)
+        if trabajo is None or trabajo.cancelado:
+            return
+        ahora = time.monotonic()
+        if ahora - trabajo.ultimo_progreso < self.intervalo_progreso:
+            return
+        if trabajo.cliente.enviar_sin_esperar({"tipo": "progreso", "id": id_trabajo, **avance}):
+            trabajo.ultimo_progreso = ahora
+
+    async def _despachar(self) -> None:
+        """Toma trabajos de la cola y los ejecuta en el pool."""
+        while True:
+            trabajo: _Trabajo = await self._cola.get()
+            try:
+                mensaje = await self._ejecutar(trabajo)
+            finally:
+                # El despachador queda libre antes de responder
+                self._finalizar_trabajo(trabajo)
+                self._cola.task_done()
+            trabajo.cliente.enviar(mensaje)
+
+    async def _ejecutar(self, trabajo: _Trabajo) -> Dict[str, Any]:
+        """Ejecuta un trabajo en el pool y devuelve el mensaje final para su cliente."""
+        if trabajo.cancelado:
+            return {"tipo": "cancelado", "id": trabajo.id}
+        try:
+            resultado = await asyncio.get_running_loop().run_in_executor(
+                self._pool, _ejecutar_trabajo, trabajo.id, trabajo.config)
+        except SimulacionCancelada:
+            return {"tipo": "cancelado", "id": trabajo.id}
+        except Exception as e:
+            return {"tipo": "error", "id": trabajo.id, "mensaje": str(e)}
+        if self.cache is not None:
+            self.cache.guardar(trabajo.config, resultado)
+        return self._mensaje_resultado(trabajo, resultado)
+
+    @staticmethod
+    def _mensaje_resultado(trabajo: _Trabajo, resultado: Dict[str, Any]) -> Dict[str, Any]:
+        """Construye el mensaje final de un trabajo."""
+        mensaje = {"tipo": "resultado", "id": trabajo.id,
+                   "metricas": resultado["metricas"]}
+        if trabajo.detalle:
+            mensaje["procesos"] = resultado["procesos"]
+        return mensaje
+
+    def _finalizar_trabajo(self, trabajo: _Trabajo) -> None:
+        """Olvida un trabajo terminado, cancelado o fallido."""
+        self._trabajos.pop(trabajo.id, None)
+        trabajo.cliente.trabajos.discard(trabajo.id)
+        self._cancelados.pop(trabajo.id, None)
+
+    async def _atender_cliente(self, lector: asyncio.StreamReader,
+                               escritor: asyncio.StreamWriter) -> None:
+        """Lee los mensajes de una conexión hasta que se cierra."""
+        self._conexiones.add(asyncio.current_task())
+        cliente = _Cliente(escritor)
+        tarea_escritura = asyncio.create_task(cliente.escribir())
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                try:
+                    mensaje = json.loads(linea)
+                except json.JSONDecodeError:
+                    cliente.enviar({"tipo": "error", "mensaje": "JSON inválido"})
+                    continue
+                self._procesar_mensaje(cliente, mensaje)
+                # Un cliente que no lee sus respuestas deja de ser leído
+                await cliente.esperar_espacio()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._conexiones.discard(asyncio.current_task())
+            # Los trabajos de un cliente desconectado ya no tienen destinatario
+            for id_trabajo in list(cliente.trabajos):
+                self._cancelar(id_trabajo)
+            cliente.desconectar()
+            tarea_escritura.cancel()
+            try:
+                await tarea_escritura
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+            escritor.close()
+
+    def _procesar_mensaje(self, cliente: _Cliente, mensaje: Dict[str, Any]) -> None:
+        """Atiende un mensaje de cliente ya decodificado."""
+        tipo = mensaje.get("tipo")
+        if tipo == "cancelar":
+            if mensaje.get("id") not in cliente.trabajos:
+                cliente.enviar({"tipo": "error", "id": mensaje.get("id"),
+                                "mensaje": "Trabajo desconocido"})
+                return
+            self._cancelar(mensaje["id"])
+            return
+        if tipo != "enviar":
+            cliente.enviar({"tipo": "error", "mensaje": f"Tipo de mensaje desconocido: {tipo}"})
+            return
+
+        try:
+            config = ConfiguracionSimulacion.desde_dict(mensaje.get("trabajo", {}))
+        except (ValueError, TypeError, KeyError, IndexError) as e:
+            cliente.enviar({"tipo": "rechazado", "motivo": f"Trabajo inválido: {e}"})
+            return
+        if len(cliente.trabajos) >= self.max_trabajos_por_cliente:
+            cliente.enviar({"tipo": "rechazado",
+                            "motivo": "Límite de trabajos por cliente alcanzado"})
+            return
+
+        trabajo = _Trabajo(uuid.uuid4().hex, config, cliente, bool(mensaje.get("detalle")))
+        if self.cache is not None:
+            resultado = self.cache.obtener(config)
+            if resultado is not None:
+                cliente.enviar({"tipo": "aceptado", "id": trabajo.id, "en_cola": 0})
+                cliente.enviar(self._mensaje_resultado(trabajo, resultado))
+                return
+        try:
+            self._cola.put_nowait(trabajo)
+        except asyncio.QueueFull:
+            cliente.enviar({"tipo": "rechazado", "motivo": "Cola de trabajos llena"})
+            return
+        self._trabajos[trabajo.id] = trabajo
+        cliente.trabajos.add(trabajo.id)
+        cliente.enviar({"tipo": "aceptado", "id": trabajo.id,
+                        "en_cola": self._cola.qsize()})
+
+    def _cancelar(self, id_trabajo: str) -> None:
+        """Marca un trabajo como cancelado, esté en cola o en ejecución."""
+        trabajo = self._trabajos.get(id_trabajo)
+        if trabajo is None:
+            return
+        trabajo.cancelado = True
+        self._cancelados[id_trabajo] = True
+
+async def _servir(host: str, puerto: int, trabajadores: int) -> None:
+    """Ejecuta el servicio hasta que se interrumpe."""
+    servicio = ServicioSimulacion(max_trabajadores=trabajadores,
+                                  cache=CacheResultados(directorio=RESULT_CACHE_DIR))
+    servidor = await servicio.iniciar(host, puerto)
+    direccion = servidor.sockets[0].getsockname()
+    print(f"Servicio de simulación escuchando en {direccion[0]}:{direccion[1]}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servicio.cerrar()
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Servicio local de simulación")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--puerto", type=int, default=SERVICE_PORT)
+    parser.add_argument("--trabajadores", type=int, default=SERVICE_MAX_WORKERS)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_servir(args.host, args.puerto, args.trabajadores))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
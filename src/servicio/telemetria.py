@@ -0,0 +1,212 @@
+"""
+Telemetría de simulaciones largas en formato de texto de Prometheus.
+
+`ObservadorTelemetria` se registra como un observador más del planificador,
+pero solo toma una muestra cada `intervalo` segundos: el resto de los ticks
+se limita a comparar la hora. Cada muestra es un diccionario inmutable que
+reemplaza al anterior, de modo que el hilo HTTP lo lee sin bloqueos.
+
+Uso:
+    python -m src.servicio.telemetria carga.json --puerto 9464
+    curl http://127.0.0.1:9464/metrics
+"""
+
+import argparse
+import json
+import math
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from ..core.scheduler import ObservadorSimulacion
+from ..core.ejecucion import ConfiguracionSimulacion, ejecutar_simulacion
+from ..utils.estadistica import percentil
+from ..config.settings import (TELEMETRY_HOST, TELEMETRY_PORT, TELEMETRY_SAMPLE_INTERVAL,
+                               TELEMETRY_WAIT_WINDOW)
+
+# Cuantiles publicados de la espera reciente
+CUANTILES_ESPERA = (0.5, 0.9, 0.99)
+
+# (nombre, tipo, ayuda, clave en la muestra)
+_METRICAS = (
+    ("simulador_tiempo_simulado", "gauge", "Tiempo simulado actual en ticks", "tiempo"),
+    ("simulador_ticks_por_segundo", "gauge", "Ticks simulados por segundo desde la muestra anterior",
+     "ticks_por_segundo"),
+    ("simulador_longitud_cola", "gauge", "Procesos en la cola de listos", "longitud_cola"),
+    ("simulador_procesos", "gauge", "Procesos de la simulación", "procesos"),
+    ("simulador_procesos_finalizados_total", "counter", "Procesos finalizados", "finalizados"),
+    ("simulador_utilizacion_cpu", "gauge", "Porcentaje de ticks con la CPU ocupada",
+     "utilizacion_cpu"),
+    ("simulador_muestras_total", "counter", "Muestras tomadas por el observador", "muestras"),
+)
+
+def _formato(valor: float) -> str:
+    """Número en el formato de texto de Prometheus."""
+    if isinstance(valor, float) and math.isnan(valor):
+        return "NaN"
+    return repr(valor) if isinstance(valor, float) else str(valor)
+
+class ObservadorTelemetria(ObservadorSimulacion):
+    """Observador que resume la simulación a frecuencia acotada."""
+
+    def __init__(self, intervalo: float = TELEMETRY_SAMPLE_INTERVAL,
+                 ventana: int = TELEMETRY_WAIT_WINDOW):
+        """
+        Args:
+            intervalo: Segundos mínimos entre muestras
+            ventana: Últimos procesos finalizados usados para los percentiles
+        """
+        super().__init__()
+        self.intervalo = intervalo
+        self._proxima = 0.0
+        self._datos: Optional[Dict[str, Any]] = None
+        self._esperas: deque = deque(maxlen=ventana)
+        self._vistos = 0
+        self._anterior: Optional[tuple] = None
+        self._muestras = 0
+        self.muestra: Dict[str, Any] = {}
+
+    def actualizar(self, datos: Dict[str, Any]) -> None:
+        """Guarda los datos del tick y muestrea si pasó el intervalo."""
+        self._datos = datos
+        ahora = time.monotonic()
+        if ahora >= self._proxima:
+            self._proxima = ahora + self.intervalo
+            self._muestrear(datos, ahora)
+
+    def muestrear(self) -> None:
+        """Toma una muestra de los últimos datos recibidos (p. ej. al terminar)."""
+        if self._datos is not None:
+            self._muestrear(self._datos, time.monotonic())
+
+    def _muestrear(self, datos: Dict[str, Any], ahora: float) -> None:
+        """Construye la muestra a partir de los datos de un tick."""
+        finalizados = datos['procesos_finalizados']
+        for proceso in finalizados[self._vistos:]:
+            self._esperas.append(proceso.tiempo_espera)
+        self._vistos = len(finalizados)
+
+        tiempo = datos['tiempo_actual']
+        ticks_por_segundo = 0.0
+        if self._anterior is not None and ahora > self._anterior[0]:
+            ticks_por_segundo = (tiempo - self._anterior[1]) / (ahora - self._anterior[0])
+        self._anterior = (ahora, tiempo)
+        self._muestras += 1
+
+        esperas = sorted(self._esperas)
+        self.muestra = {
+            "tiempo": tiempo,
+            "ticks_por_segundo": ticks_por_segundo,
+            "longitud_cola": datos.get('longitud_cola', 0),
+            "procesos": len(datos['procesos']),
+            "finalizados": len(finalizados),
+            "utilizacion_cpu": (datos['tiempo_cpu_ocupada'] / tiempo * 100 if tiempo else 0.0),
+            "muestras": self._muestras,
+            "cuantiles_espera": {q: percentil(esperas, q * 100) for q in CUANTILES_ESPERA},
+            "suma_espera": sum(esperas),
+            "cantidad_espera": len(esperas),
+        }
+
+    def texto_prometheus(self) -> str:
+        """
+        Exporta la última muestra.
+
+        Returns:
+            Métricas en el formato de exposición de texto de Prometheus
+        """
+        muestra = self.muestra
+        if not muestra:
+            return ""
+        lineas = []
+        for nombre, tipo, ayuda, clave in _METRICAS:
+            lineas += [f"# HELP {nombre} {ayuda}", f"# TYPE {nombre} {tipo}",
+                       f"{nombre} {_formato(muestra[clave])}"]
+        nombre = "simulador_espera_reciente"
+        lineas += [f"# HELP {nombre} Tiempo de espera de los últimos procesos finalizados",
+                   f"# TYPE {nombre} summary"]
+        for q, valor in muestra["cuantiles_espera"].items():
+            lineas.append(f'{nombre}{{quantile="{q}"}} {_formato(valor)}')
+        lineas += [f"{nombre}_sum {_formato(muestra['suma_espera'])}",
+                   f"{nombre}_count {muestra['cantidad_espera']}"]
+        return "\n".join(lineas) + "\n"
+
+class _ManejadorMetricas(BaseHTTPRequestHandler):
+    """Atiende GET /metrics con la última muestra del observador."""
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        cuerpo = self.server.observador.texto_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato: str, *args: Any) -> None:
+        """Sin registro por petición."""
+        pass
+
+class ServidorTelemetria:
+    """Servidor HTTP en un hilo aparte que publica un ObservadorTelemetria."""
+
+    def __init__(self, observador: ObservadorTelemetria, host: str = TELEMETRY_HOST,
+                 puerto: int = TELEMETRY_PORT):
+        """
+        Args:
+            observador: Observador cuyas muestras se publican
+            host: Dirección de escucha (por defecto, solo local)
+            puerto: Puerto de escucha (0: uno libre)
+        """
+        self.servidor = ThreadingHTTPServer((host, puerto), _ManejadorMetricas)
+        self.servidor.daemon_threads = True
+        self.servidor.observador = observador
+        self._hilo: Optional[threading.Thread] = None
+
+    @property
+    def puerto(self) -> int:
+        """Puerto en que escucha el servidor."""
+        return self.servidor.server_address[1]
+
+    def iniciar(self) -> None:
+        """Empieza a atender peticiones en segundo plano."""
+        self._hilo = threading.Thread(target=self.servidor.serve_forever, daemon=True)
+        self._hilo.start()
+
+    def detener(self) -> None:
+        """Detiene el servidor y libera el puerto."""
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        if self._hilo is not None:
+            self._hilo.join()
+
+def main() -> None:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulación con telemetría para Prometheus")
+    parser.add_argument("archivo", help="Configuración JSON de la simulación")
+    parser.add_argument("--host", default=TELEMETRY_HOST)
+    parser.add_argument("--puerto", type=int, default=TELEMETRY_PORT)
+    parser.add_argument("--intervalo", type=float, default=TELEMETRY_SAMPLE_INTERVAL)
+    parser.add_argument("--mantener", type=float, default=0.0,
+                        help="Segundos que se sigue publicando al terminar")
+    args = parser.parse_args()
+
+    with open(args.archivo, encoding="utf-8") as archivo:
+        config = ConfiguracionSimulacion.desde_dict(json.load(archivo))
+    observador = ObservadorTelemetria(args.intervalo)
+    servidor = ServidorTelemetria(observador, args.host, args.puerto)
+    servidor.iniciar()
+    try:
+        resultado = ejecutar_simulacion(config, observadores=[observador])
+        observador.muestrear()
+        print(json.dumps(resultado["metricas"]))
+        time.sleep(args.mantener)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.detener()
+
+if __name__ == "__main__":
+    main()
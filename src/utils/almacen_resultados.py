@@ -0,0 +1,250 @@
+"""
+Almacén indexado de resultados de simulación en SQLite.
+
+Cada ejecución guarda su configuración, el hash de la carga de trabajo, las
+métricas de `obtener_metricas()` y percentiles de espera y retorno. Las
+inserciones se agrupan en lotes y una tabla de resumen por familia de cargas
+y quantum se mantiene al insertar, de modo que consultas como "mejor quantum
+por familia" no recorren todas las ejecuciones.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from ..core.ejecucion import ConfiguracionSimulacion
+from .cache_resultados import clave_simulacion, clave_carga
+from .estadistica import percentiles
+from ..config.settings import RESULT_STORE_BATCH_SIZE
+
+# Columnas numéricas consultables (nombre de métrica -> columna)
+METRICAS = (
+    "tiempo_total", "utilizacion_cpu", "tiempo_espera_promedio",
+    "tiempo_retorno_promedio", "espera_p50", "espera_p90", "espera_p99",
+    "retorno_p50", "retorno_p90", "retorno_p99",
+)
+# Métricas acumuladas en la tabla de resumen
+METRICAS_RESUMEN = ("tiempo_total", "utilizacion_cpu", "tiempo_espera_promedio",
+                    "tiempo_retorno_promedio", "espera_p99")
+PERCENTILES = (50, 90, 99)
+
+_ESQUEMA = f"""
+CREATE TABLE IF NOT EXISTS ejecuciones (
+    id INTEGER PRIMARY KEY,
+    clave TEXT NOT NULL,
+    carga TEXT NOT NULL,
+    familia TEXT NOT NULL,
+    planificador TEXT NOT NULL,
+    quantum INTEGER NOT NULL,
+    num_procesos INTEGER NOT NULL,
+    creado REAL NOT NULL,
+    parametros TEXT NOT NULL,
+    metricas TEXT NOT NULL,
+    {", ".join(f"{m} REAL" for m in METRICAS)}
+);
+CREATE INDEX IF NOT EXISTS ejecuciones_clave ON ejecuciones (clave);
+CREATE INDEX IF NOT EXISTS ejecuciones_carga ON ejecuciones (carga, planificador, quantum);
+CREATE INDEX IF NOT EXISTS ejecuciones_familia ON ejecuciones (familia, planificador, quantum);
+CREATE INDEX IF NOT EXISTS ejecuciones_espera_p99 ON ejecuciones (espera_p99);
+CREATE INDEX IF NOT EXISTS ejecuciones_espera ON ejecuciones (tiempo_espera_promedio);
+CREATE INDEX IF NOT EXISTS ejecuciones_retorno ON ejecuciones (tiempo_retorno_promedio);
+CREATE TABLE IF NOT EXISTS resumen_quantum (
+    familia TEXT NOT NULL,
+    planificador TEXT NOT NULL,
+    quantum INTEGER NOT NULL,
+    ejecuciones INTEGER NOT NULL,
+    {", ".join(f"suma_{m} REAL NOT NULL" for m in METRICAS_RESUMEN)},
+    PRIMARY KEY (familia, planificador, quantum)
+);
+"""
+
+def _validar_metrica(metrica: str, permitidas: Tuple[str, ...] = METRICAS) -> str:
+    """Comprueba que la métrica sea una columna conocida (se interpola en SQL)."""
+    if metrica not in permitidas:
+        raise ValueError(f"Métrica desconocida: {metrica}")
+    return metrica
+
+class AlmacenResultados:
+    """
+    Almacén de resultados de simulación con inserciones por lotes.
+
+    Se puede usar como administrador de contexto para vaciar el lote
+    pendiente al salir.
+    """
+
+    def __init__(self, ruta: str, tamano_lote: int = RESULT_STORE_BATCH_SIZE):
+        self.ruta = ruta
+        self.tamano_lote = tamano_lote
+        self._pendientes: List[tuple] = []
+        if os.path.dirname(ruta):
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        self._conexion = sqlite3.connect(ruta, timeout=60.0)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.executescript(_ESQUEMA)
+
+    def __enter__(self) -> "AlmacenResultados":
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        """Escribe el lote pendiente y cierra la conexión."""
+        self.vaciar()
+        self._conexion.close()
+
+    def guardar(self, config: ConfiguracionSimulacion, resultado: Dict[str, Any],
+                familia: Optional[str] = None) -> None:
+        """
+        Agrega una ejecución al lote pendiente.
+
+        Args:
+            config: Configuración simulada
+            resultado: Resultado devuelto por ejecutar_simulacion
+            familia: Familia de cargas a la que pertenece (por defecto, la
+                propia carga)
+        """
+        metricas = resultado["metricas"]
+        carga = clave_carga(config)
+        fila = {m: metricas.get(m) for m in METRICAS}
+        procesos = resultado.get("procesos")
+        if procesos:
+            for prefijo, campo in (("espera", "tiempo_espera"), ("retorno", "tiempo_retorno")):
+                valores = percentiles((p[campo] for p in procesos), list(PERCENTILES))
+                for p, valor in valores.items():
+                    fila[f"{prefijo}_p{p}"] = valor
+        self._pendientes.append((
+            clave_simulacion(config), carga, familia or carga, config.planificador,
+            config.quantum, len(config.procesos), time.time(),
+            json.dumps(dict(config.parametros), sort_keys=True),
+            json.dumps(metricas, separators=(",", ":")),
+            *(fila[m] for m in METRICAS)
+        ))
+        if len(self._pendientes) >= self.tamano_lote:
+            self.vaciar()
+
+    def vaciar(self) -> None:
+        """Escribe el lote pendiente y actualiza el resumen en una transacción."""
+        if not self._pendientes:
+            return
+        columnas = ("clave", "carga", "familia", "planificador", "quantum",
+                    "num_procesos", "creado", "parametros", "metricas", *METRICAS)
+        indice = {c: i for i, c in enumerate(columnas)}
+        resumen: Dict[Tuple[str, str, int], List[float]] = {}
+        for fila in self._pendientes:
+            grupo = (fila[indice["familia"]], fila[indice["planificador"]],
+                     fila[indice["quantum"]])
+            acumulado = resumen.setdefault(grupo, [0] * (1 + len(METRICAS_RESUMEN)))
+            acumulado[0] += 1
+            for j, m in enumerate(METRICAS_RESUMEN, start=1):
+                acumulado[j] += fila[indice[m]] or 0.0
+
+        sumas = [f"suma_{m}" for m in METRICAS_RESUMEN]
+        with self._conexion:
+            self._conexion.executemany(
+                f"INSERT INTO ejecuciones ({', '.join(columnas)}) "
+                f"VALUES ({', '.join('?' * len(columnas))})", self._pendientes)
+            self._conexion.executemany(
+                f"INSERT INTO resumen_quantum (familia, planificador, quantum, ejecuciones, "
+                f"{', '.join(sumas)}) VALUES ({', '.join('?' * (4 + len(sumas)))}) "
+                f"ON CONFLICT (familia, planificador, quantum) DO UPDATE SET "
+                f"ejecuciones = ejecuciones + excluded.ejecuciones, "
+                + ", ".join(f"{s} = {s} + excluded.{s}" for s in sumas),
+                [(*grupo, *valores) for grupo, valores in resumen.items()])
+        self._pendientes.clear()
+
+    def contar(self) -> int:
+        """Cantidad de ejecuciones almacenadas."""
+        self.vaciar()
+        return self._conexion.execute("SELECT COUNT(*) FROM ejecuciones").fetchone()[0]
+
+    def mejor_quantum(self, metrica: str = "tiempo_espera_promedio",
+                      planificador: str = "round_robin", minimizar: bool = True,
+                      familia: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Quantum con el mejor promedio de una métrica en cada familia de cargas.
+
+        Args:
+            metrica: Métrica acumulada en el resumen (ver METRICAS_RESUMEN)
+            planificador: Planificador a considerar
+            minimizar: True si valores menores son mejores
+            familia: Limitar la consulta a una familia
+
+        Returns:
+            Por familia: quantum elegido, promedio de la métrica y ejecuciones
+        """
+        _validar_metrica(metrica, METRICAS_RESUMEN)
+        self.vaciar()
+        sql = (f"SELECT familia, quantum, suma_{metrica} / ejecuciones, ejecuciones "
+               f"FROM resumen_quantum WHERE planificador = ?")
+        parametros: tuple = (planificador,)
+        if familia is not None:
+            sql += " AND familia = ?"
+            parametros += (familia,)
+        mejores: Dict[str, tuple] = {}
+        for fila in self._conexion.execute(sql, parametros):
+            actual = mejores.get(fila[0])
+            if (actual is None or (fila[2] < actual[2] if minimizar else fila[2] > actual[2])
+                    or (fila[2] == actual[2] and fila[1] < actual[1])):
+                mejores[fila[0]] = fila
+        return [{"familia": f, "quantum": q, metrica: valor, "ejecuciones": n}
+                for f, q, valor, n in sorted(mejores.values())]
+
+    def ejecuciones_donde(self, metrica: str, minimo: Optional[float] = None,
+                          maximo: Optional[float] = None, familia: Optional[str] = None,
+                          limite: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Ejecuciones cuya métrica cae en un rango, p. ej. espera p99 > X.
+
+        Args:
+            metrica: Columna de METRICAS
+            minimo: Límite inferior exclusivo (opcional)
+            maximo: Límite superior inclusivo (opcional)
+            familia: Limitar la consulta a una familia
+            limite: Máximo de filas devueltas
+
+        Returns:
+            Filas con la configuración resumida y las métricas de cada ejecución,
+            ordenadas de mayor a menor valor de la métrica
+        """
+        _validar_metrica(metrica)
+        self.vaciar()
+        condiciones, parametros = [], []
+        if minimo is not None:
+            condiciones.append(f"{metrica} > ?")
+            parametros.append(minimo)
+        if maximo is not None:
+            condiciones.append(f"{metrica} <= ?")
+            parametros.append(maximo)
+        if familia is not None:
+            condiciones.append("familia = ?")
+            parametros.append(familia)
+        sql = ("SELECT id, clave, carga, familia, planificador, quantum, num_procesos, "
+               f"{', '.join(METRICAS)} FROM ejecuciones")
+        if condiciones:
+            sql += " WHERE " + " AND ".join(condiciones)
+        sql += f" ORDER BY {metrica} DESC"
+        if limite is not None:
+            sql += " LIMIT ?"
+            parametros.append(limite)
+        cursor = self._conexion.execute(sql, parametros)
+        nombres = [d[0] for d in cursor.description]
+        return [dict(zip(nombres, fila)) for fila in cursor]
+
+    def ejecuciones_de_carga(self, config: ConfiguracionSimulacion) -> List[Dict[str, Any]]:
+        """
+        Todas las ejecuciones almacenadas de la misma carga de trabajo.
+
+        Args:
+            config: Configuración cuya carga se busca
+
+        Returns:
+            Filas con planificador, quantum y métricas, por quantum
+        """
+        self.vaciar()
+        cursor = self._conexion.execute(
+            f"SELECT planificador, quantum, {', '.join(METRICAS)} FROM ejecuciones "
+            "WHERE carga = ? ORDER BY planificador, quantum", (clave_carga(config),))
+        nombres = [d[0] for d in cursor.description]
+        return [dict(zip(nombres, fila)) for fila in cursor]
@@ -0,0 +1,207 @@
+"""
+Caché de resultados de simulación direccionada por contenido.
+
+La clave es un hash estable de la carga de trabajo (llegadas, ejecuciones y
+prioridades, en orden), del planificador y de sus parámetros. Los
+identificadores de los procesos no forman parte de la clave: dos cargas con
+los mismos tiempos comparten resultado.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from ..core.ejecucion import ConfiguracionSimulacion
+from ..config.settings import RESULT_CACHE_MEMORY_ITEMS, RESULT_CACHE_DISK_BYTES
+
+# Se incrementa cuando cambia la semántica de los motores de simulación
+VERSION_RESULTADOS = 1
+
+def clave_simulacion(config: ConfiguracionSimulacion) -> str:
+    """
+    Calcula la clave de caché de una configuración.
+
+    Args:
+        config: Configuración de la simulación
+
+    Returns:
+        Hash SHA-256 hexadecimal de la configuración
+    """
+    contenido = json.dumps({
+        "version": VERSION_RESULTADOS,
+        "procesos": [p[1:] for p in config.procesos],
+        "planificador": config.planificador,
+        "quantum": config.quantum,
+        "parametros": config.parametros,
+    }, separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(contenido.encode()).hexdigest()
+
+def clave_carga(config: ConfiguracionSimulacion) -> str:
+    """
+    Calcula un hash de la carga de trabajo sin el planificador ni el quantum.
+
+    Args:
+        config: Configuración de la simulación
+
+    Returns:
+        Hash SHA-256 hexadecimal de los tiempos de los procesos
+    """
+    contenido = json.dumps([p[1:] for p in config.procesos], separators=(",", ":"))
+    return hashlib.sha256(contenido.encode()).hexdigest()
+
+class CacheResultados:
+    """
+    Caché de dos niveles: LRU en memoria y directorio en disco.
+
+    El nivel en disco guarda un archivo JSON por resultado y, al superar
+    `max_bytes_disco`, elimina los archivos usados hace más tiempo.
+    """
+
+    def __init__(self, directorio: Optional[str] = None,
+                 capacidad_memoria: int = RESULT_CACHE_MEMORY_ITEMS,
+                 max_bytes_disco: int = RESULT_CACHE_DISK_BYTES):
+        self.directorio = directorio
+        self.capacidad_memoria = capacidad_memoria
+        self.max_bytes_disco = max_bytes_disco
+        self._memoria: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._bytes_disco = 0
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+            self._bytes_disco = sum(os.path.getsize(ruta) for ruta in self._archivos())
+
+    def obtener(self, config: ConfiguracionSimulacion) -> Optional[Dict[str, Any]]:
+        """
+        Busca el resultado de una configuración.
+
+        Args:
+            config: Configuración de la simulación
+
+        Returns:
+            El resultado con los identificadores de `config`, o None si no está
+        """
+        return self.obtener_por_clave(clave_simulacion(config), config)
+
+    def obtener_por_clave(self, clave: str,
+                          config: ConfiguracionSimulacion) -> Optional[Dict[str, Any]]:
+        """
+        Busca un resultado por su clave ya calculada.
+
+        Args:
+            clave: Clave devuelta por clave_simulacion
+            config: Configuración de la simulación
+
+        Returns:
+            El resultado con los identificadores de `config`, o None si no está
+        """
+        resultado = self._memoria.get(clave)
+        if resultado is not None:
+            self._memoria.move_to_end(clave)
+        elif self.directorio is not None:
+            resultado = self._leer_disco(clave)
+            if resultado is not None:
+                self._guardar_memoria(clave, resultado)
+        if resultado is None:
+            return None
+        # Copia profunda de las métricas (pueden tener valores anidados) y
+        # entradas nuevas por proceso: quien la recibe no altera la caché
+        return {
+            "metricas": copy.deepcopy(resultado["metricas"]),
+            "procesos": [{"id": p[0], **datos}
+                         for p, datos in zip(config.procesos, resultado["procesos"])],
+        }
+
+    def guardar(self, config: ConfiguracionSimulacion, resultado: Dict[str, Any],
+                clave: Optional[str] = None) -> None:
+        """
+        Guarda el resultado de una configuración en ambos niveles.
+
+        Args:
+            config: Configuración simulada
+            resultado: Resultado devuelto por ejecutar_simulacion
+            clave: Clave ya calculada (opcional)
+        """
+        clave = clave or clave_simulacion(config)
+        compacto = {
+            "metricas": copy.deepcopy(resultado["metricas"]),
+            "procesos": [{k: v for k, v in p.items() if k != "id"}
+                         for p in resultado["procesos"]],
+        }
+        self._guardar_memoria(clave, compacto)
+        if self.directorio is not None:
+            self._escribir_disco(clave, compacto)
+
+    def limpiar(self) -> None:
+        """Vacía ambos niveles de la caché."""
+        self._memoria.clear()
+        if self.directorio is not None:
+            for ruta in self._archivos():
+                os.remove(ruta)
+            self._bytes_disco = 0
+
+    def _guardar_memoria(self, clave: str, resultado: Dict[str, Any]) -> None:
+        """Inserta en el nivel de memoria expulsando el menos usado."""
+        self._memoria[clave] = resultado
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.capacidad_memoria:
+            self._memoria.popitem(last=False)
+
+    def _ruta(self, clave: str) -> str:
+        """Ruta del archivo de un resultado."""
+        return os.path.join(self.directorio, clave[:2], f"{clave}.json")
+
+    def _archivos(self):
+        """Recorre los archivos de resultados del directorio."""
+        for raiz, _, archivos in os.walk(self.directorio):
+            for archivo in archivos:
+                if archivo.endswith(".json"):
+                    yield os.path.join(raiz, archivo)
+
+    def _leer_disco(self, clave: str) -> Optional[Dict[str, Any]]:
+        """Lee un resultado del disco y marca el archivo como recién usado."""
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, encoding="utf-8") as archivo:
+                resultado = json.load(archivo)
+            os.utime(ruta)
+            return resultado
+        except (OSError, ValueError):
+            return None
+
+    def _escribir_disco(self, clave: str, resultado: Dict[str, Any]) -> None:
+        """Escribe un resultado de forma atómica y aplica el límite de tamaño."""
+        ruta = self._ruta(clave)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        previo = os.path.getsize(ruta) if os.path.exists(ruta) else 0
+        descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as archivo:
+            json.dump(resultado, archivo, separators=(",", ":"))
+        os.replace(temporal, ruta)
+        self._bytes_disco += os.path.getsize(ruta) - previo
+        if self._bytes_disco > self.max_bytes_disco:
+            self._expulsar_disco()
+
+    def _expulsar_disco(self) -> None:
+        """Elimina los archivos usados hace más tiempo hasta cumplir el límite."""
+        archivos = []
+        for ruta in self._archivos():
+            try:
+                estado = os.stat(ruta)
+            except OSError:
+                continue
+            archivos.append((estado.st_mtime, estado.st_size, ruta))
+        archivos.sort()
+        total = sum(tamano for _, tamano, _ in archivos)
+        # Se libera hasta un 90 % del límite para no expulsar en cada escritura
+        objetivo = self.max_bytes_disco * 0.9
+        for _, tamano, ruta in archivos:
+            if total <= objetivo:
+                break
+            try:
+                os.remove(ruta)
+                total -= tamano
+            except OSError:
+                pass
+        self._bytes_disco = total
@@ -0,0 +1,337 @@
+"""
+Funciones estadísticas simples sobre los resultados de las simulaciones.
+"""
+
+import math
+from typing import Dict, Iterable, List, Sequence
+
+def percentil(ordenados: Sequence[float], p: float) -> float:
+    """
+    Percentil por interpolación lineal entre rangos (como numpy.percentile).
+
+    Args:
+        ordenados: Valores ordenados de menor a mayor
+        p: Percentil entre 0 y 100
+
+    Returns:
+        El percentil, o NaN si no hay valores
+    """
+    if not ordenados:
+        return math.nan
+    posicion = (len(ordenados) - 1) * p / 100.0
+    inferior = int(math.floor(posicion))
+    superior = min(inferior + 1, len(ordenados) - 1)
+    fraccion = posicion - inferior
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * fraccion
+
+def percentiles(valores: Iterable[float], ps: List[float]) -> Dict[float, float]:
+    """
+    Calcula varios percentiles ordenando los valores una sola vez.
+
+    Args:
+        valores: Valores sin ordenar
+        ps: Percentiles entre 0 y 100
+
+    Returns:
+        Valor de cada percentil
+    """
+    ordenados = sorted(valores)
+    return {p: percentil(ordenados, p) for p in ps}
+
+class EstadisticaWelford:
+    """
+    Media y varianza acumuladas en una pasada (algoritmo de Welford).
+
+    Usa memoria constante y es numéricamente estable con muchos valores.
+    """
+
+    def __init__(self):
+        self.cantidad = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def agregar(self, valor: float) -> None:
+        """Incorpora un valor."""
+        self.cantidad += 1
+        delta = valor - self.media
+        self.media += delta / self.cantidad
+        self._m2 += delta * (valor - self.media)
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral (NaN con menos de dos valores)."""
+        return self._m2 / (self.cantidad - 1) if self.cantidad > 1 else math.nan
+
+    def resumen(self) -> Dict[str, float]:
+        """Cantidad, media, desviación estándar, mínimo y máximo."""
+        return {
+            "cantidad": self.cantidad,
+            "media": self.media if self.cantidad else math.nan,
+            "desviacion": math.sqrt(self.varianza) if self.cantidad > 1 else math.nan,
+            "minimo": self.minimo if self.cantidad else math.nan,
+            "maximo": self.maximo if self.cantidad else math.nan,
+        }
+
+def _beta_incompleta(a: float, b: float, x: float) -> float:
+    """Función beta incompleta regularizada I_x(a, b) por fracción continua."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    factor = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                      + a * math.log(x) + b * math.log1p(-x))
+    # La fracción converge rápido para x < (a + 1) / (a + b + 2)
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - _beta_incompleta(b, a, 1.0 - x)
+    minimo = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > minimo else minimo)
+    resultado = d
+    for m in range(1, 300):
+        for numerador in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerador * d
+            d = 1.0 / (d if abs(d) > minimo else minimo)
+            c = 1.0 + numerador / c
+            c = c if abs(c) > minimo else minimo
+            resultado *= d * c
+        if abs(d * c - 1.0) < 1e-15:
+            break
+    return factor * resultado / a
+
+def distribucion_t(t: float, grados: float) -> float:
+    """
+    Función de distribución de la t de Student.
+
+    Args:
+        t: Valor de la variable
+        grados: Grados de libertad (positivos)
+
+    Returns:
+        P(T <= t)
+    """
+    cola = 0.5 * _beta_incompleta(grados / 2, 0.5, grados / (grados + t * t))
+    return 1.0 - cola if t > 0 else cola
+
+def cuantil_t(p: float, grados: float) -> float:
+    """
+    Cuantil de la t de Student (inversa de `distribucion_t`) por bisección.
+
+    Args:
+        p: Probabilidad entre 0 y 1 (exclusivo)
+        grados: Grados de libertad (positivos)
+
+    Returns:
+        El valor t con P(T <= t) = p
+
+    Raises:
+        ValueError: Si p no está en (0, 1) o los grados no son positivos
+    """
+    if not 0.0 < p < 1.0 or grados <= 0:
+        raise ValueError("Se requiere 0 < p < 1 y grados de libertad positivos")
+    if p < 0.5:
+        return -cuantil_t(1.0 - p, grados)
+    inferior, superior = 0.0, 1.0
+    while distribucion_t(superior, grados) < p:
+        superior *= 2
+    for _ in range(100):
+        medio = (inferior + superior) / 2
+        if distribucion_t(medio, grados) < p:
+            inferior = medio
+        else:
+            superior = medio
+        if superior - inferior < 1e-12 * max(1.0, superior):
+            break
+    return (inferior + superior) / 2
+
+def intervalo_t(valores: Sequence[float], confianza: float = 0.95) -> Dict[str, float]:
+    """
+    Intervalo de confianza de la media de observaciones independientes.
+
+    Args:
+        valores: Observaciones (al menos dos para la semiamplitud)
+        confianza: Nivel de confianza
+
+    Returns:
+        'media', 'desviacion', 'semiamplitud', 'inferior', 'superior' y
+        'cantidad' (desviación y semiamplitud NaN con menos de dos valores)
+    """
+    estadistica = EstadisticaWelford()
+    for valor in valores:
+        estadistica.agregar(valor)
+    n = estadistica.cantidad
+    media = estadistica.media if n else math.nan
+    semiamplitud = math.nan
+    if n > 1:
+        semiamplitud = cuantil_t(0.5 + confianza / 2, n - 1) * math.sqrt(estadistica.varianza / n)
+    return {"media": media, "desviacion": math.sqrt(estadistica.varianza) if n > 1 else math.nan,
+            "semiamplitud": semiamplitud, "inferior": media - semiamplitud,
+            "superior": media + semiamplitud, "cantidad": n}
+
+def intervalo_diferencia(a: Sequence[float], b: Sequence[float], pareadas: bool,
+                         confianza: float = 0.95) -> Dict[str, float]:
+    """
+    Intervalo de confianza de la diferencia de medias b - a.
+
+    Con observaciones pareadas (la i-ésima de a y de b comparten sus números
+    aleatorios) usa la t de Student sobre las diferencias; si no, la
+    aproximación de Welch para varianzas distintas.
+
+    Args:
+        a: Observaciones de la primera alternativa
+        b: Observaciones de la segunda
+        pareadas: Si las observaciones van de a pares
+        confianza: Nivel de confianza
+
+    Returns:
+        'media', 'semiamplitud', 'inferior', 'superior', 'error' (error
+        estándar de la diferencia) y 'grados' de libertad
+
+    Raises:
+        ValueError: Si las observaciones pareadas no tienen la misma cantidad
+    """
+    if pareadas:
+        if len(a) != len(b):
+            raise ValueError("Las observaciones pareadas deben tener la misma cantidad")
+        intervalo = intervalo_t([y - x for x, y in zip(a, b)], confianza)
+        n = intervalo["cantidad"]
+        error = intervalo["desviacion"] / math.sqrt(n) if n else math.nan
+        return {"media": intervalo["media"], "semiamplitud": intervalo["semiamplitud"],
+                "inferior": intervalo["inferior"], "superior": intervalo["superior"],
+                "error": error, "grados": n - 1}
+    ia, ib = intervalo_t(a, confianza), intervalo_t(b, confianza)
+    va, vb = ia["desviacion"] ** 2 / len(a), ib["desviacion"] ** 2 / len(b)
+    error = math.sqrt(va + vb)
+    media = ib["media"] - ia["media"]
+    if va + vb > 0:
+        grados = (va + vb) ** 2 / (va ** 2 / (len(a) - 1) + vb ** 2 / (len(b) - 1))
+        semiamplitud = cuantil_t(0.5 + confianza / 2, grados) * error
+    else:
+        grados, semiamplitud = len(a) + len(b) - 2, 0.0 if error == 0 else math.nan
+    return {"media": media, "semiamplitud": semiamplitud, "inferior": media - semiamplitud,
+            "superior": media + semiamplitud, "error": error, "grados": grados}
+
+def truncamiento_mser(medias: Sequence[float]) -> int:
+    """
+    Punto de truncamiento del calentamiento por la regla MSER.
+
+    Elige el d que minimiza sum_{i >= d} (y_i - media_d)^2 / (n - d)^2, con d
+    en la primera mitad de la serie. Aplicada a medias de lotes de 5
+    observaciones es la regla MSER-5.
+
+    Args:
+        medias: Serie (medias de lotes) en orden de observación
+
+    Returns:
+        Cantidad de elementos iniciales a descartar
+    """
+    n = len(medias)
+    if n < 4:
+        return 0
+    # Sumas de sufijos para evaluar cada d en O(1)
+    suma, cuadrados = 0.0, 0.0
+    sufijos = [(0.0, 0.0)] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        suma += medias[i]
+        cuadrados += medias[i] * medias[i]
+        sufijos[i] = (suma, cuadrados)
+    mejor, mejor_valor = 0, math.inf
+    for d in range(n // 2):
+        restantes = n - d
+        s, c = sufijos[d]
+        valor = (c - s * s / restantes) / (restantes * restantes)
+        if valor < mejor_valor:
+            mejor, mejor_valor = d, valor
+    return mejor
+
+def intervalo_medias_lotes(medias: Sequence[float], lotes: int,
+                           confianza: float = 0.95) -> Dict[str, float]:
+    """
+    Intervalo de confianza de la media por medias de lotes.
+
+    Agrupa la serie en `lotes` lotes consecutivos de igual tamaño (descarta
+    el sobrante del principio) y usa la t de Student con lotes - 1 grados.
+
+    Args:
+        medias: Serie ya sin calentamiento
+        lotes: Cantidad de lotes deseada (se reduce si la serie es corta)
+        confianza: Nivel de confianza
+
+    Returns:
+        'media', 'semiamplitud', 'inferior', 'superior' y 'lotes'
+        (semiamplitud NaN con menos de dos lotes)
+    """
+    k = min(lotes, len(medias))
+    if k == 0:
+        return {"media": math.nan, "semiamplitud": math.nan, "inferior": math.nan,
+                "superior": math.nan, "lotes": 0}
+    tamano = len(medias) // k
+    serie = medias[len(medias) - k * tamano:]
+    grupos = [sum(serie[i * tamano:(i + 1) * tamano]) / tamano for i in range(k)]
+    media = sum(grupos) / k
+    semiamplitud = math.nan
+    if k > 1:
+        varianza = sum((g - media) ** 2 for g in grupos) / (k - 1)
+        semiamplitud = cuantil_t(0.5 + confianza / 2, k - 1) * math.sqrt(varianza / k)
+    return {"media": media, "semiamplitud": semiamplitud, "inferior": media - semiamplitud,
+            "superior": media + semiamplitud, "lotes": k}
+
+class SerieLotes:
+    """
+    Serie de medias de lotes con memoria acotada.
+
+    Acumula observaciones en lotes de `tamano` valores; al llegar a
+    `max_lotes` medias, une los lotes de a pares y duplica el tamaño, de modo
+    que la serie siempre cubre todas las observaciones con a lo sumo
+    `max_lotes` números.
+    """
+
+    def __init__(self, tamano: int = 5, max_lotes: int = 1024):
+        """
+        Args:
+            tamano: Observaciones por lote inicial (5 para MSER-5)
+            max_lotes: Medias guardadas como máximo (par)
+        """
+        self.tamano = tamano
+        self.max_lotes = max_lotes - max_lotes % 2
+        self.medias: List[float] = []
+        self._suma = 0.0
+        self._pendientes = 0
+
+    def agregar(self, valor: float) -> None:
+        """Incorpora una observación."""
+        self._suma += valor
+        self._pendientes += 1
+        if self._pendientes == self.tamano:
+            self.medias.append(self._suma / self.tamano)
+            self._suma = 0.0
+            self._pendientes = 0
+            if len(self.medias) >= self.max_lotes:
+                self.medias = [(a + b) / 2 for a, b in zip(self.medias[::2], self.medias[1::2])]
+                self.tamano *= 2
+
+    def estacionario(self, lotes: int, confianza: float = 0.95) -> Dict[str, float]:
+        """
+        Media en régimen estacionario con su intervalo de confianza.
+
+        Descarta el calentamiento con MSER sobre las medias guardadas y
+        aplica medias de lotes al resto.
+
+        Args:
+            lotes: Lotes del intervalo de confianza
+            confianza: Nivel de confianza
+
+        Returns:
+            Resultado de `intervalo_medias_lotes` más 'calentamiento':
+            observaciones descartadas
+        """
+        corte = truncamiento_mser(self.medias)
+        resultado = intervalo_medias_lotes(self.medias[corte:], lotes, confianza)
+        resultado["calentamiento"] = corte * self.tamano
+        return resultado
@@ -3,17 +3,25 @@ Módulo para exportar los resultados de la simulación a Excel.
 """
 
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 from ..core.process import Proceso
+from ..core.historial import NivelHistorial
+from ..core.indice_historial import IndiceHistorial
 from ..config.settings import EXCEL_HEADERS, PROCESS_STATES
 
 class ExportadorExcel:
     """Clase para exportar los resultados de la simulación a Excel."""
     
+    # La hoja 'Diagrama de Estados' se construye desde el índice de transiciones
+    # (o desde historial_estados, que requiere NivelHistorial.COMPLETO); crear
+    # el planificador con `crear_planificador(consumidores=[ExportadorExcel])`
+    NIVEL_HISTORIAL_REQUERIDO = NivelHistorial.TRANSICIONES
+    
     @staticmethod
     def exportar_informe(procesos: List[Proceso], quantum: int, 
-                        metricas: Dict, historial_estados: Dict) -> str:
+                        metricas: Dict, historial_estados: Optional[Dict] = None,
+                        indice: Optional[IndiceHistorial] = None) -> str:
         """
         Exporta los resultados de la simulación a un archivo Excel.
         
@@ -22,6 +30,7 @@ class ExportadorExcel:
             quantum: Quantum utilizado en la simulación
             metricas: Diccionario con las métricas finales
             historial_estados: Diccionario con el historial de estados por tiempo
+            indice: Índice del historial de transiciones (reemplaza a historial_estados)
             
         Returns:
             Ruta del archivo Excel generado
@@ -48,15 +57,22 @@ class ExportadorExcel:
             df_procesos.to_excel(writer, sheet_name='Procesos', index=False)
             
             # Hoja 2: Diagrama de estados
-            max_tiempo = max(historial_estados.keys())
-            df_estados = pd.DataFrame(index=range(max_tiempo + 1))
-            
-            for proceso in procesos:
-                estados = []
-                for t in range(max_tiempo + 1):
-                    estado = historial_estados.get(t, {}).get(f"P{proceso.id}", "")
-                    estados.append(estado)
-                df_estados[f"P{proceso.id}"] = estados
+            if indice is not None:
+                columnas = indice.matriz_estados()
+                df_estados = pd.DataFrame(index=range(indice.tiempo_final))
+                for proceso in procesos:
+                    clave = f"P{proceso.id}"
+                    df_estados[clave] = columnas.get(clave, [""] * indice.tiempo_final)
+            else:
+                max_tiempo = max(historial_estados.keys())
+                df_estados = pd.DataFrame(index=range(max_tiempo + 1))
+                
+                for proceso in procesos:
+                    estados = []
+                    for t in range(max_tiempo + 1):
+                        estado = historial_estados.get(t, {}).get(f"P{proceso.id}", "")
+                        estados.append(estado)
+                    df_estados[f"P{proceso.id}"] = estados
             
             df_estados.to_excel(writer, sheet_name='Diagrama de Estados')
             
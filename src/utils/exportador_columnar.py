@@ -0,0 +1,210 @@
+"""
+Módulo para exportar los resultados de la simulación en formato columnar
+(Parquet o Arrow IPC).
+
+Cada ejecución escribe un archivo por tabla dentro de un directorio común:
+
+    <directorio>/procesos/<ejecucion>.<ext>
+    <directorio>/segmentos/<ejecucion>.<ext>
+    <directorio>/metricas/<ejecucion>.<ext>
+
+de modo que los resultados de miles de ejecuciones se leen como un único
+dataset, con lectura selectiva de columnas.
+"""
+
+import os
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from ..core.scheduler import PlanificadorBase, CODIGOS_ESTADO
+from ..core.historial import NivelHistorial
+from ..core.indice_historial import IndiceHistorial
+from ..config.settings import PROCESS_STATES
+
+TABLAS = ("procesos", "segmentos", "metricas")
+EXTENSIONES = {"parquet": "parquet", "arrow": "arrow"}
+
+# Diccionario fijo de estados: el mismo índice significa lo mismo en todas las ejecuciones
+ESTADOS = ["", *PROCESS_STATES]
+
+def _diccionario(valores: List[str], categorias: Optional[List[str]] = None) -> pa.DictionaryArray:
+    """
+    Codifica una columna de texto como arreglo de diccionario.
+
+    Args:
+        valores: Valores de la columna
+        categorias: Diccionario a usar (por defecto, los valores distintos en orden)
+
+    Returns:
+        Arreglo Arrow codificado por diccionario
+    """
+    if categorias is None:
+        categorias = list(dict.fromkeys(valores))
+    indice = {categoria: i for i, categoria in enumerate(categorias)}
+    return pa.DictionaryArray.from_arrays(
+        pa.array([indice[v] for v in valores], type=pa.int32()),
+        pa.array(categorias, type=pa.string())
+    )
+
+def _constante(valor: str, filas: int) -> pa.DictionaryArray:
+    """Columna de diccionario con el mismo valor en todas las filas."""
+    return pa.DictionaryArray.from_arrays(
+        pa.array([0] * filas, type=pa.int32()), pa.array([valor], type=pa.string()))
+
+class ExportadorColumnar:
+    """Clase para exportar los resultados de la simulación a Parquet o Arrow."""
+
+    # La tabla de segmentos se construye desde las transiciones; crear el
+    # planificador con `crear_planificador(consumidores=[ExportadorColumnar])`
+    NIVEL_HISTORIAL_REQUERIDO = NivelHistorial.TRANSICIONES
+
+    @staticmethod
+    def tabla_procesos(planificador: PlanificadorBase, ejecucion: str) -> pa.Table:
+        """
+        Construye la tabla de procesos de una ejecución.
+
+        Args:
+            planificador: Planificador con la simulación
+            ejecucion: Identificador de la ejecución
+
+        Returns:
+            Tabla con una fila por proceso
+        """
+        procesos = planificador.procesos
+        return pa.table({
+            "ejecucion": _constante(ejecucion, len(procesos)),
+            "proceso": _diccionario([f"P{p.id}" for p in procesos]),
+            "id": pa.array([p.id for p in procesos], type=pa.int64()),
+            "tiempo_llegada": pa.array([p.tiempo_llegada for p in procesos], type=pa.int64()),
+            "tiempo_ejecucion": pa.array([p.tiempo_ejecucion for p in procesos], type=pa.int64()),
+            "prioridad": pa.array([p.prioridad for p in procesos], type=pa.int64()),
+            "estado": _diccionario([CODIGOS_ESTADO[p.estado] for p in procesos], ESTADOS),
+            "tiempo_comienzo": pa.array([p.tiempo_comienzo for p in procesos], type=pa.int64()),
+            "tiempo_finalizacion": pa.array([p.tiempo_finalizacion for p in procesos], type=pa.int64()),
+            "tiempo_espera": pa.array([p.tiempo_espera for p in procesos], type=pa.int64()),
+            "tiempo_respuesta": pa.array([p.tiempo_respuesta for p in procesos], type=pa.int64()),
+            "tiempo_retorno": pa.array([p.tiempo_retorno for p in procesos], type=pa.int64()),
+        })
+
+    @staticmethod
+    def tabla_segmentos(planificador: PlanificadorBase, ejecucion: str) -> pa.Table:
+        """
+        Construye la tabla de intervalos de estado de una ejecución.
+
+        Args:
+            planificador: Planificador con la simulación
+            ejecucion: Identificador de la ejecución
+
+        Returns:
+            Tabla con una fila por intervalo (proceso, estado, inicio, fin)
+        """
+        indice = IndiceHistorial(planificador.transiciones, planificador.tiempo_actual)
+        # Códigos del índice traducidos a los del diccionario de estados de la tabla
+        codigo_estado = np.array([ESTADOS.index(estado) for estado in indice.estados], dtype=np.int32)
+        filas = len(indice)
+        return pa.table({
+            "ejecucion": _constante(ejecucion, filas),
+            "proceso": pa.DictionaryArray.from_arrays(
+                pa.array(indice.proceso, type=pa.int32()),
+                pa.array(indice.procesos, type=pa.string())),
+            "estado": pa.DictionaryArray.from_arrays(
+                pa.array(codigo_estado[indice.estado], type=pa.int32()),
+                pa.array(ESTADOS, type=pa.string())),
+            "inicio": pa.array(indice.inicio, type=pa.int64()),
+            "fin": pa.array(indice.fin, type=pa.int64()),
+        })
+
+    @staticmethod
+    def tabla_metricas(planificador: PlanificadorBase, ejecucion: str) -> pa.Table:
+        """
+        Construye la tabla de métricas (una fila) de una ejecución.
+
+        Args:
+            planificador: Planificador con la simulación
+            ejecucion: Identificador de la ejecución
+
+        Returns:
+            Tabla con la configuración y las métricas de la ejecución
+        """
+        metricas = planificador.obtener_metricas()
+        columnas = {
+            "ejecucion": _constante(ejecucion, 1),
+            "planificador": _constante(type(planificador).__name__, 1),
+            "quantum": pa.array([getattr(planificador, "quantum", None)], type=pa.int64()),
+        }
+        for nombre, valor in metricas.items():
+            if isinstance(valor, (int, float)):
+                columnas[nombre] = pa.array([float(valor)], type=pa.float64())
+        return pa.table(columnas)
+
+    @staticmethod
+    def exportar(planificador: PlanificadorBase, directorio: str,
+                 ejecucion: Optional[str] = None, formato: str = "parquet") -> Dict[str, str]:
+        """
+        Exporta procesos, segmentos de historial y métricas de una ejecución.
+
+        Args:
+            planificador: Planificador con la simulación terminada
+            directorio: Directorio raíz del dataset
+            ejecucion: Identificador de la ejecución (por defecto, fecha y hora)
+            formato: 'parquet' o 'arrow'
+
+        Returns:
+            Ruta del archivo escrito para cada tabla
+
+        Raises:
+            ValueError: Si el formato no existe o el planificador no registró
+                el historial necesario para la tabla de segmentos
+        """
+        if formato not in EXTENSIONES:
+            raise ValueError(f"Formato no soportado: {formato}")
+        if planificador.nivel_historial < ExportadorColumnar.NIVEL_HISTORIAL_REQUERIDO:
+            raise ValueError("El planificador no registró transiciones: créelo con "
+                             "nivel_historial TRANSICIONES o mayor")
+        if ejecucion is None:
+            ejecucion = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+        tablas = {
+            "procesos": ExportadorColumnar.tabla_procesos(planificador, ejecucion),
+            "segmentos": ExportadorColumnar.tabla_segmentos(planificador, ejecucion),
+            "metricas": ExportadorColumnar.tabla_metricas(planificador, ejecucion),
+        }
+        rutas = {}
+        for nombre, tabla in tablas.items():
+            carpeta = os.path.join(directorio, nombre)
+            os.makedirs(carpeta, exist_ok=True)
+            ruta = os.path.join(carpeta, f"{ejecucion}.{EXTENSIONES[formato]}")
+            if formato == "parquet":
+                pq.write_table(tabla, ruta, compression="zstd")
+            else:
+                with ipc.new_file(ruta, tabla.schema) as escritor:
+                    escritor.write_table(tabla)
+            rutas[nombre] = ruta
+        return rutas
+
+    @staticmethod
+    def cargar(directorio: str, tabla: str, columnas: Optional[List[str]] = None,
+               filtro=None, formato: str = "parquet") -> pa.Table:
+        """
+        Carga una tabla de todas las ejecuciones exportadas en un directorio.
+
+        Args:
+            directorio: Directorio raíz del dataset
+            tabla: 'procesos', 'segmentos' o 'metricas'
+            columnas: Columnas a leer (el resto no se lee del disco)
+            filtro: Expresión de pyarrow.dataset para filtrar filas
+            formato: 'parquet' o 'arrow'
+
+        Returns:
+            Tabla Arrow con las filas de todas las ejecuciones
+        """
+        if tabla not in TABLAS:
+            raise ValueError(f"Tabla desconocida: {tabla}")
+        dataset = ds.dataset(os.path.join(directorio, tabla),
+                             format="ipc" if formato == "arrow" else "parquet")
+        return dataset.to_table(columns=columnas, filter=filtro)